@@ -19,6 +19,7 @@ _DEFAULT_FRONTEND = "gui"
 _THEME_ENV_VAR = "TICTACTOE_THEME"
 _THEME_FILE_ENV_VAR = "TICTACTOE_THEME_FILE"
 _THEME_PAYLOAD_ENV_VAR = "TICTACTOE_THEME_PAYLOAD"
+_PROFILE_ENV_VAR = "TICTACTOE_PROFILE"
 
 
 @dataclass(frozen=True)
@@ -29,8 +30,12 @@ class FrontendSpec:
     description: str
     env_overrides: Mapping[str, str] = field(default_factory=dict)
 
-    def load(self) -> FrontendRunner:
-        """Import and return the callable referenced by *target*."""
+    def load(self, *, profile: Optional[str] = None) -> FrontendRunner:
+        """Import and return the callable referenced by *target*.
+
+        *profile* (or ``TICTACTOE_PROFILE`` when omitted) names the
+        profiling modes to wrap the runner in; see `tictactoe.tools.profiling`.
+        """
 
         module_name, _, attr_name = self.target.partition(":")
         attr_name = attr_name or "main"
@@ -39,6 +44,15 @@ class FrontendSpec:
         if not callable(runner):  # pragma: no cover - defensive
             message = f"Frontend target {self.target!r} is not callable"
             raise TypeError(message)
+        if profile is None:
+            profile = os.environ.get(_PROFILE_ENV_VAR, "")
+        if profile.strip():
+            from tictactoe.tools.profiling import parse_modes, profiled
+
+            modes = parse_modes(profile)
+            if modes:
+                label = module_name.rsplit(".", 2)[-2]
+                runner = profiled(runner, modes, label=f"tictactoe-{label}")
         return cast(FrontendRunner, runner)
 
 
@@ -97,6 +111,15 @@ def _build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Path to a JSON file that stores a serialized GameViewConfig.",
     )
+    parser.add_argument(
+        "--profile",
+        metavar="MODES",
+        help=(
+            "Profile the frontend with cprofile, sample, tracemalloc (comma "
+            f"separated) or all. Overrides the {_PROFILE_ENV_VAR} environment "
+            "variable."
+        ),
+    )
     return parser
 
 
@@ -181,7 +204,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     frontend = _determine_frontend(args.ui)
     _apply_env_overrides(frontend.env_overrides)
-    runner = frontend.load()
+    try:
+        runner = frontend.load(profile=args.profile)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
     if frontend.target.startswith("tictactoe.ui.gui"):
         _set_theme_payload_env(_resolve_theme_payload(args))
     else:
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
-from dataclasses import dataclass, field
-from typing import Any, Callable, Mapping, MutableMapping
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, MutableMapping
+
+if TYPE_CHECKING:
+    from tictactoe.controller.metrics import MetricsRegistry
 
 TelemetryHook = Callable[["TelemetryEvent"], None]
 ErrorHook = Callable[[Exception, "TelemetryEvent"], None]
@@ -20,27 +24,108 @@ class TelemetryEvent:
     payload: Mapping[str, Any] = field(default_factory=dict)
 
 
+class LazyPayload(Mapping[str, Any]):
+    """Payload mapping built on first access.
+
+    `ControllerHooks.emit_lazy` wraps its builder in one of these so hooks
+    that drop an event (sampling, a full async queue) never pay for the
+    payload. Builders should only capture immutable values, because they may
+    run later or on another thread.
+    """
+
+    __slots__ = ("_build", "_data")
+
+    def __init__(self, build: Callable[[], Mapping[str, Any]]) -> None:
+        self._build: Callable[[], Mapping[str, Any]] | None = build
+        self._data: Mapping[str, Any] = {}
+
+    def _resolve(self) -> Mapping[str, Any]:
+        build = self._build
+        if build is not None:
+            self._data = dict(build())
+            self._build = None
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._resolve()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resolve())
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
+
 @dataclass
 class ControllerHooks:
-    """Optional callbacks that capture controller telemetry."""
+    """Optional callbacks that capture controller telemetry.
+
+    *other* receives events on any channel besides ``view`` and ``domain``
+    (an `EventBus` uses it to accept arbitrary topics). *muted* lists
+    channels (``"view"``) or ``channel.action`` names (``"domain.snapshot"``)
+    that are dropped before any payload is built. Hot paths can ask
+    `enabled` once and skip the call entirely.
+    """
 
     view: TelemetryHook | None = None
     domain: TelemetryHook | None = None
     error: ErrorHook | None = None
+    muted: frozenset[str] = frozenset()
+    other: TelemetryHook | None = None
+
+    def enabled(self, channel: str, action: str) -> bool:
+        """True when an event on *channel*/*action* would reach a hook."""
+
+        if self._hook_for(channel) is None:
+            return False
+        muted = self.muted
+        return not muted or (
+            channel not in muted and f"{channel}.{action}" not in muted
+        )
 
     def emit(self, channel: str, action: str, **payload: Any) -> TelemetryEvent:
-        """Trigger the hook registered for the supplied channel."""
+        """Trigger the hook registered for the supplied channel.
 
-        payload_dict: MutableMapping[str, Any] = dict(payload)
-        event = TelemetryEvent(channel=channel, action=action, payload=payload_dict)
+        The event is always returned; muted or unhooked channels just skip
+        delivery. Use `emit_lazy` when building the payload itself is costly.
+        """
+
+        # ``**payload`` is already a fresh dict owned by this call.
+        event = TelemetryEvent(channel=channel, action=action, payload=payload)
         hook = self._hook_for(channel)
-        if not hook:
+        if hook is None or (self.muted and not self.enabled(channel, action)):
             return event
+        self._deliver(hook, event)
+        return event
+
+    def emit_lazy(
+        self,
+        channel: str,
+        action: str,
+        build: Callable[[], Mapping[str, Any]],
+    ) -> TelemetryEvent | None:
+        """Like `emit`, but *build* produces the payload on first access.
+
+        Returns None, without creating an event, when nothing would consume it.
+        """
+
+        hook = self._hook_for(channel)
+        if hook is None or (self.muted and not self.enabled(channel, action)):
+            return None
+        event = TelemetryEvent(
+            channel=channel, action=action, payload=LazyPayload(build)
+        )
+        self._deliver(hook, event)
+        return event
+
+    def _deliver(self, hook: TelemetryHook, event: TelemetryEvent) -> None:
         try:
             hook(event)
         except Exception as exc:  # pragma: no cover - defensive guardrail
             self._handle_error(exc, event)
-        return event
 
     def emit_error(
         self, exc: Exception, *, action: str, **payload: Any
@@ -73,7 +158,7 @@ class ControllerHooks:
             return self.view
         if channel == "domain":
             return self.domain
-        return None
+        return self.other
 
     def _handle_error(self, exc: Exception, event: TelemetryEvent) -> None:
         if self.error:
@@ -142,11 +227,180 @@ def telemetry_logging_requested(*aliases: str) -> bool:
     return False
 
 
+ASYNC_TELEMETRY_ENV_VAR = "TICTACTOE_TELEMETRY_ASYNC"
+MUTE_TELEMETRY_ENV_VAR = "TICTACTOE_TELEMETRY_MUTE"
+METRICS_FILE_ENV_VAR = "TICTACTOE_METRICS_FILE"
+METRICS_PORT_ENV_VAR = "TICTACTOE_METRICS_PORT"
+TRACE_ENV_VAR = "TICTACTOE_TRACE"
+TELEMETRY_FILE_ENV_VAR = "TICTACTOE_TELEMETRY_FILE"
+TELEMETRY_ROTATE_BYTES_ENV_VAR = "TICTACTOE_TELEMETRY_ROTATE_BYTES"
+TELEMETRY_ROTATE_SECONDS_ENV_VAR = "TICTACTOE_TELEMETRY_ROTATE_SECONDS"
+TELEMETRY_GZIP_ENV_VAR = "TICTACTOE_TELEMETRY_GZIP"
+_FALSY = {"", "0", "false", "no", "off"}
+
+
+def configure_hooks(
+    hooks: ControllerHooks | None, *aliases: str
+) -> ControllerHooks | None:
+    """Apply the delivery options selected through environment variables.
+
+    ``TICTACTOE_LOGGING_POLICY`` (or ``<alias>_POLICY`` for a frontend flag
+    such as ``TICTACTOE_CLI_LOGGING``) samples or rate-limits events per
+    channel/action; see `tictactoe.controller.sampling` for the syntax.
+
+    ``TICTACTOE_TELEMETRY_FILE`` adds a buffered JSON-lines sink next to the
+    logging hooks (or on its own). ``TICTACTOE_TELEMETRY_ROTATE_BYTES`` and
+    ``TICTACTOE_TELEMETRY_ROTATE_SECONDS`` rotate it, and
+    ``TICTACTOE_TELEMETRY_GZIP=1`` compresses rotated files.
+
+    ``TICTACTOE_TELEMETRY_MUTE`` is a comma-separated list of channels or
+    ``channel.action`` names to drop (for example ``view.cell_click``).
+
+    ``TICTACTOE_TELEMETRY_ASYNC`` moves view/domain callbacks onto a
+    background `AsyncDispatcher`; ``block`` or ``drop_oldest`` picks the
+    queue-full policy (any other truthy value means ``drop_oldest``).
+
+    ``TICTACTOE_METRICS_FILE`` / ``TICTACTOE_METRICS_PORT`` feed every event
+    into the default metrics registry and export it as a Prometheus text
+    file or on ``http://127.0.0.1:PORT/metrics``. Metrics work even when
+    *hooks* is None (logging disabled).
+
+    ``TICTACTOE_TRACE`` names a file that receives a Chrome/Perfetto trace of
+    every `tracing.span` recorded until the process exits.
+    """
+
+    _tracing_from_env()
+    registry = _metrics_registry_from_env()
+    hooks = _sink_from_env(hooks)
+    if hooks is not None:
+        hooks = _muted_from_env(hooks)
+        hooks = _sampling_from_env(hooks, aliases)
+        hooks = _async_from_env(hooks, registry)
+    if registry is None:
+        return hooks
+    from tictactoe.controller.metrics import metrics_hooks
+
+    return metrics_hooks(registry, hooks)
+
+
+def _tracing_from_env() -> None:
+    path = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if not path:
+        return
+    from pathlib import Path
+
+    from tictactoe import tracing
+
+    if tracing.active_tracer() is None:
+        tracer = tracing.start_tracing()
+        atexit.register(tracer.write, Path(path))
+
+
+def _sink_from_env(hooks: ControllerHooks | None) -> ControllerHooks | None:
+    path = os.environ.get(TELEMETRY_FILE_ENV_VAR, "").strip()
+    if not path:
+        return hooks
+    from pathlib import Path
+
+    from tictactoe.controller.sinks import JsonLinesSink
+
+    def number(name: str) -> float | None:
+        value = os.environ.get(name, "").strip()
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError as exc:
+            raise ValueError(f"{name} must be a number.") from exc
+
+    max_bytes = number(TELEMETRY_ROTATE_BYTES_ENV_VAR)
+    compress = os.environ.get(TELEMETRY_GZIP_ENV_VAR, "").strip().lower()
+    sink = JsonLinesSink(
+        Path(path),
+        max_bytes=int(max_bytes) if max_bytes is not None else None,
+        max_age=number(TELEMETRY_ROTATE_SECONDS_ENV_VAR),
+        compress=compress not in _FALSY,
+    )
+    atexit.register(sink.close)
+    return sink.hooks(hooks)
+
+
+def _muted_from_env(hooks: ControllerHooks) -> ControllerHooks:
+    muted = os.environ.get(MUTE_TELEMETRY_ENV_VAR, "")
+    names = frozenset(name.strip() for name in muted.split(",") if name.strip())
+    if not names:
+        return hooks
+    return replace(hooks, muted=hooks.muted | names)
+
+
+def _sampling_from_env(
+    hooks: ControllerHooks, aliases: tuple[str, ...]
+) -> ControllerHooks:
+    names = [f"{alias}_POLICY" for alias in aliases if alias]
+    names.append(f"{GLOBAL_TELEMETRY_ENV_VAR}_POLICY")
+    spec = next((os.environ[name] for name in names if os.environ.get(name)), "")
+    if not spec.strip():
+        return hooks
+    from tictactoe.controller.sampling import SamplingFilter, parse_rules
+
+    sampler = SamplingFilter(hooks, parse_rules(spec))
+    atexit.register(sampler.flush)
+    return sampler.hooks
+
+
+def _async_from_env(
+    hooks: ControllerHooks, registry: MetricsRegistry | None
+) -> ControllerHooks:
+    mode = os.environ.get(ASYNC_TELEMETRY_ENV_VAR, "").strip().lower()
+    if mode in _FALSY:
+        return hooks
+    from tictactoe.controller.dispatch import BLOCK, DROP_OLDEST, AsyncDispatcher
+
+    policy = BLOCK if mode == BLOCK else DROP_OLDEST
+    dispatcher = AsyncDispatcher(hooks, policy=policy)
+    if registry is not None:
+        dispatcher.register_metrics(registry)
+    return dispatcher.hooks
+
+
+def _metrics_registry_from_env() -> MetricsRegistry | None:
+    path = os.environ.get(METRICS_FILE_ENV_VAR, "").strip()
+    port = os.environ.get(METRICS_PORT_ENV_VAR, "").strip()
+    if not path and not port:
+        return None
+    from pathlib import Path
+
+    from tictactoe.controller.metrics import (
+        DEFAULT_REGISTRY,
+        PeriodicMetricsWriter,
+        serve_metrics,
+    )
+
+    if port:
+        try:
+            number = int(port)
+        except ValueError as exc:
+            raise ValueError(f"{METRICS_PORT_ENV_VAR} must be a port number.") from exc
+        serve_metrics(DEFAULT_REGISTRY, port=number)
+    if path:
+        writer = PeriodicMetricsWriter(DEFAULT_REGISTRY, Path(path))
+        atexit.register(writer.close)
+    return DEFAULT_REGISTRY
+
+
 __all__ = [
+    "ASYNC_TELEMETRY_ENV_VAR",
     "ControllerHooks",
+    "LazyPayload",
+    "METRICS_FILE_ENV_VAR",
+    "METRICS_PORT_ENV_VAR",
+    "MUTE_TELEMETRY_ENV_VAR",
+    "TELEMETRY_FILE_ENV_VAR",
+    "TRACE_ENV_VAR",
     "TelemetryEvent",
     "TelemetryHook",
     "GLOBAL_TELEMETRY_ENV_VAR",
+    "configure_hooks",
     "logging_hooks",
     "telemetry_logging_requested",
 ]
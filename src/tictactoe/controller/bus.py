@@ -0,0 +1,171 @@
+"""Topic-based publish/subscribe for telemetry events.
+
+Every event is published on the topic ``channel.action``. Subscribers
+register a pattern made of two segments, each either a literal or ``*``::
+
+    bus = EventBus()
+    bus.subscribe("view.*", overlay.on_view_event)
+    bus.subscribe("*.snapshot", recorder.append)
+    bus.subscribe_hooks(logging_hooks())          # existing ControllerHooks
+    game_gui = TicTacToeGUI(controller_hooks=bus.hooks())
+
+Patterns are parsed once at subscribe time. The first event on a topic
+resolves the matching handlers into a tuple that is cached per
+``(channel, action)``; later publishes are one dict lookup plus the calls,
+however many patterns are registered. Subscribing or unsubscribing swaps in
+a fresh, empty route table, so publishers never take a lock.
+
+Errors reported through `ControllerHooks.emit_error` are published on
+``error.<action>`` with the exception added to the payload as
+``exception``. A handler that raises is logged and skipped; the remaining
+handlers still run.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent, TelemetryHook
+
+WILDCARD = "*"
+
+_logger = logging.getLogger("tictactoe.controller")
+
+
+def parse_pattern(pattern: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split ``channel.action`` into segments; None stands for ``*``."""
+
+    if pattern == WILDCARD:
+        return None, None
+    channel, separator, action = pattern.partition(".")
+    if not separator or not channel or not action:
+        raise ValueError(f"Pattern {pattern!r} must look like channel.action or *.")
+    for segment in (channel, action):
+        if WILDCARD in segment and segment != WILDCARD:
+            raise ValueError(f"Wildcards must span a whole segment in {pattern!r}.")
+    return (
+        None if channel == WILDCARD else channel,
+        None if action == WILDCARD else action,
+    )
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """Handle returned by `EventBus.subscribe`."""
+
+    bus: EventBus
+    pattern: str
+    handler: TelemetryHook
+    channel: Optional[str]
+    action: Optional[str]
+
+    def matches(self, channel: str, action: str) -> bool:
+        return (self.channel is None or self.channel == channel) and (
+            self.action is None or self.action == action
+        )
+
+    def unsubscribe(self) -> bool:
+        return self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """Many subscribers per topic, with ``*`` wildcards per segment."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._routes: Dict[Tuple[str, str], Tuple[TelemetryHook, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, pattern: str, handler: TelemetryHook) -> Subscription:
+        channel, action = parse_pattern(pattern)
+        subscription = Subscription(self, pattern, handler, channel, action)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+            self._routes = {}
+        return subscription
+
+    def subscribe_hooks(self, hooks: ControllerHooks) -> List[Subscription]:
+        """Attach an existing `ControllerHooks` as view/domain/error consumer."""
+
+        subscriptions = []
+        if hooks.view is not None:
+            subscriptions.append(self.subscribe("view.*", hooks.view))
+        if hooks.domain is not None:
+            subscriptions.append(self.subscribe("domain.*", hooks.domain))
+        error = hooks.error
+        if error is not None:
+
+            def on_error(event: TelemetryEvent) -> None:
+                payload = dict(event.payload)
+                exc = payload.pop("exception", None)
+                if isinstance(exc, Exception):
+                    error(exc, TelemetryEvent(event.channel, event.action, payload))
+
+            subscriptions.append(self.subscribe("error.*", on_error))
+        return subscriptions
+
+    def unsubscribe(self, subscription: Subscription) -> bool:
+        with self._lock:
+            remaining = tuple(
+                item for item in self._subscriptions if item is not subscription
+            )
+            if len(remaining) == len(self._subscriptions):
+                return False
+            self._subscriptions = remaining
+            self._routes = {}
+        return True
+
+    def handlers_for(self, channel: str, action: str) -> Tuple[TelemetryHook, ...]:
+        routes = self._routes
+        key = (channel, action)
+        handlers = routes.get(key)
+        if handlers is None:
+            handlers = tuple(
+                item.handler
+                for item in self._subscriptions
+                if item.matches(channel, action)
+            )
+            # Written into the table we read from: if a subscribe swapped
+            # it meanwhile, this entry is simply discarded with it.
+            routes[key] = handlers
+        return handlers
+
+    def publish(self, event: TelemetryEvent) -> None:
+        for handler in self.handlers_for(event.channel, event.action):
+            try:
+                handler(event)
+            except Exception:
+                _logger.debug(
+                    "Subscriber %r raised while handling %s.%s",
+                    handler,
+                    event.channel,
+                    event.action,
+                    exc_info=True,
+                )
+
+    def publish_error(self, exc: Exception, event: TelemetryEvent) -> None:
+        payload = dict(event.payload)
+        payload["exception"] = exc
+        self.publish(
+            TelemetryEvent(channel="error", action=event.action, payload=payload)
+        )
+
+    def hooks(self, *, muted: frozenset[str] = frozenset()) -> ControllerHooks:
+        """`ControllerHooks` that publish every channel onto this bus."""
+
+        return ControllerHooks(
+            view=self.publish,
+            domain=self.publish,
+            error=self.publish_error,
+            muted=muted,
+            other=self.publish,
+        )
+
+
+__all__ = ["EventBus", "Subscription", "WILDCARD", "parse_pattern"]
@@ -0,0 +1,208 @@
+"""Background, batching delivery for `ControllerHooks` callbacks."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Deque, List, Optional, Sequence
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent
+
+if TYPE_CHECKING:
+    from tictactoe.controller.metrics import MetricsRegistry
+
+BatchHook = Callable[[Sequence[TelemetryEvent]], None]
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, BLOCK)
+
+
+@dataclass(frozen=True)
+class DispatcherStats:
+    """Counters reported by `AsyncDispatcher.stats`."""
+
+    queued: int
+    delivered: int
+    dropped: int
+    queue_depth: int
+    high_watermark: int
+    batches: int
+
+
+class AsyncDispatcher:
+    """Queue telemetry events and deliver them from a background thread.
+
+    `hooks` returns a `ControllerHooks` whose view/domain callbacks only
+    append to a bounded queue, so a slow handler no longer stalls the Tk
+    mainloop or the automation loop. A daemon thread drains up to
+    *batch_size* events at a time and forwards them to *target* (and to
+    *batch_hook*, if given, once per batch).
+
+    When the queue is full the ``drop_oldest`` policy discards the oldest
+    pending event and counts it; ``block`` makes the emitting thread wait for
+    room. Error events stay synchronous. Pending events are flushed by
+    `close`, which also runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        target: ControllerHooks,
+        *,
+        max_queue: int = 1024,
+        batch_size: int = 64,
+        policy: str = DROP_OLDEST,
+        batch_hook: Optional[BatchHook] = None,
+    ) -> None:
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1.")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy {policy!r}.")
+        self.target = target
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.policy = policy
+        self.batch_hook = batch_hook
+        self._queue: Deque[TelemetryEvent] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._in_flight = 0
+        self._queued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._batches = 0
+        self._high_watermark = 0
+        self.hooks = ControllerHooks(
+            view=self.enqueue if target.view or batch_hook else None,
+            domain=self.enqueue if target.domain or batch_hook else None,
+            error=target.error,
+            muted=target.muted,
+            other=self.enqueue if target.other or batch_hook else None,
+        )
+        atexit.register(self.close)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> DispatcherStats:
+        with self._condition:
+            return DispatcherStats(
+                queued=self._queued,
+                delivered=self._delivered,
+                dropped=self._dropped,
+                queue_depth=len(self._queue),
+                high_watermark=self._high_watermark,
+                batches=self._batches,
+            )
+
+    def register_metrics(self, registry: MetricsRegistry) -> None:
+        """Export queue depth and dropped events as callback gauges."""
+
+        registry.gauge(
+            "tictactoe_telemetry_queue_depth", "Events waiting for delivery."
+        ).labels().set_function(lambda: len(self._queue))
+        registry.gauge(
+            "tictactoe_telemetry_dropped", "Events discarded by a full queue."
+        ).labels().set_function(lambda: self._dropped)
+
+    def enqueue(self, event: TelemetryEvent) -> None:
+        """Hook callback: queue *event* for background delivery."""
+
+        with self._condition:
+            if not self._closed:
+                self._ensure_worker()
+                queue = self._queue
+                if len(queue) >= self.max_queue:
+                    on_worker = threading.current_thread() is self._thread
+                    if self.policy == BLOCK and not on_worker:
+                        while len(queue) >= self.max_queue and not self._closed:
+                            self._condition.wait()
+                    else:
+                        queue.popleft()
+                        self._dropped += 1
+                # A BLOCK wait can also end because the dispatcher closed.
+                if not self._closed:
+                    queue.append(event)
+                    self._queued += 1
+                    if len(queue) > self._high_watermark:
+                        self._high_watermark = len(queue)
+                    self._condition.notify_all()
+                    return
+        # Closed: deliver inline, without holding the lock, so a slow hook
+        # only delays its own caller.
+        self._deliver([event])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event was delivered; False on timeout."""
+
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Deliver what is pending and stop the worker thread."""
+
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="tictactoe-telemetry", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                batch: List[TelemetryEvent] = []
+                while self._queue and len(batch) < self.batch_size:
+                    batch.append(self._queue.popleft())
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+            self._deliver(batch)
+            with self._condition:
+                self._in_flight = 0
+                self._delivered += len(batch)
+                self._batches += 1
+                self._condition.notify_all()
+
+    def _deliver(self, batch: Sequence[TelemetryEvent]) -> None:
+        target = self.target
+        for event in batch:
+            hook = target._hook_for(event.channel)
+            if hook is None:
+                continue
+            try:
+                hook(event)
+            except Exception as exc:  # pragma: no cover - defensive guardrail
+                target._handle_error(exc, event)
+        if self.batch_hook is not None:
+            try:
+                self.batch_hook(batch)
+            except Exception as exc:  # pragma: no cover - defensive guardrail
+                target._handle_error(exc, batch[-1])
+
+
+__all__ = [
+    "AsyncDispatcher",
+    "BLOCK",
+    "DROP_OLDEST",
+    "DispatcherStats",
+    "POLICIES",
+]
@@ -0,0 +1,393 @@
+"""Aggregated telemetry: counters, gauges, and log-bucketed histograms.
+
+`metrics_hooks` turns every `TelemetryEvent` into a handful of O(1) updates
+instead of a log line::
+
+    tictactoe_events_total{channel,action}        counter per event
+    tictactoe_errors_total{action}                counter per error event
+    tictactoe_event_seconds{channel,action}       histogram of ``elapsed``
+    tictactoe_event_value{channel,action,field}   gauge per `GAUGE_FIELDS` key
+
+Only plain ``dict`` payloads are inspected; a `LazyPayload` is counted but
+never built, so metrics do not defeat lazy payloads. The registry renders the
+Prometheus text exposition format, which `write_metrics_file` stores
+atomically and `serve_metrics` exposes over HTTP on a local port.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent
+
+GAUGE_FIELDS = ("playouts_per_second", "tree_size")
+
+
+def log_buckets(
+    start: float = 1e-5, factor: float = 2.0, count: int = 24
+) -> Tuple[float, ...]:
+    """Upper bounds ``start * factor**i``; the defaults span 10us to ~84s."""
+
+    if start <= 0 or factor <= 1 or count < 1:
+        raise ValueError("Buckets need start > 0, factor > 1 and count >= 1.")
+    return tuple(start * factor**index for index in range(count))
+
+
+class Counter:
+    """Monotonic count."""
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        return [f"{name}{labels} {_number(self.value)}"]
+
+
+class Gauge:
+    """Last value set, or the result of a callback at export time."""
+
+    __slots__ = ("_function", "value")
+
+    def __init__(self) -> None:
+        self._function: Optional[Callable[[], float]] = None
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        value = self._function() if self._function is not None else self.value
+        return [f"{name}{labels} {_number(value)}"]
+
+
+class Histogram:
+    """Count, sum, and per-bucket counts; one bisect per observation."""
+
+    __slots__ = ("_lock", "bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        with self._lock:
+            counts = list(self.counts)
+            count, total = self.count, self.sum
+        lines = []
+        cumulative = 0
+        for bound, bucket in zip(self.bounds + (math.inf,), counts):
+            cumulative += bucket
+            le = "+Inf" if bound == math.inf else repr(bound)
+            lines.append(f"{name}_bucket{_merge(labels, 'le', le)} {cumulative}")
+        lines.append(f"{name}_sum{labels} {_number(total)}")
+        lines.append(f"{name}_count{labels} {count}")
+        return lines
+
+
+M = TypeVar("M", Counter, Gauge, Histogram)
+
+
+class MetricFamily(Generic[M]):
+    """One named metric with a fixed set of label names."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        label_names: Tuple[str, ...],
+        factory: Callable[[], M],
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.label_names = label_names
+        self._factory: Callable[[], M] = factory
+        self._children: Dict[Tuple[str, ...], M] = {}
+        self._lookup: Dict[Tuple[Any, ...], M] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> M:
+        child = self._lookup.get(values)
+        if child is None:
+            child = self._create(values)
+        return child
+
+    def _create(self, values: Tuple[Any, ...]) -> M:
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {', '.join(self.label_names)}."
+            )
+        key = tuple(str(value) for value in values)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._factory()
+            # Raw values map to the same series as their string form.
+            self._lookup[values] = child
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = sorted(self._children.items(), key=lambda item: item[0])
+        for key, child in children:
+            labels = _labels(self.label_names, key)
+            lines.extend(child.samples(self.name, labels))
+        return lines
+
+
+class MetricsRegistry:
+    """Named metric families; creating an existing name returns it again."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily[Any]] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, help_text: str = "", labels: Tuple[str, ...] = ()
+    ) -> MetricFamily[Counter]:
+        return self._family(name, "counter", help_text, labels, Counter)
+
+    def gauge(
+        self, name: str, help_text: str = "", labels: Tuple[str, ...] = ()
+    ) -> MetricFamily[Gauge]:
+        return self._family(name, "gauge", help_text, labels, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        labels: Tuple[str, ...] = (),
+        buckets: Optional[Tuple[float, ...]] = None,
+    ) -> MetricFamily[Histogram]:
+        bounds = buckets or log_buckets()
+        return self._family(
+            name, "histogram", help_text, labels, lambda: Histogram(bounds)
+        )
+
+    def render(self) -> str:
+        """Prometheus text exposition (version 0.0.4)."""
+
+        with self._lock:
+            families = sorted(self._families.items())
+        lines: List[str] = []
+        for _name, family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def _family(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        labels: Tuple[str, ...],
+        factory: Callable[[], Any],
+    ) -> MetricFamily[Any]:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(name, kind, help_text, labels, factory)
+                self._families[name] = family
+            elif family.kind != kind or family.label_names != labels:
+                raise ValueError(f"Metric {name!r} is already registered differently.")
+            return family
+
+
+DEFAULT_REGISTRY = MetricsRegistry()
+
+
+def metrics_hooks(
+    registry: MetricsRegistry = DEFAULT_REGISTRY,
+    forward: Optional[ControllerHooks] = None,
+) -> ControllerHooks:
+    """Hooks that update *registry* and then call *forward* (if any)."""
+
+    events = registry.counter(
+        "tictactoe_events_total",
+        "Telemetry events by channel and action.",
+        ("channel", "action"),
+    )
+    errors = registry.counter(
+        "tictactoe_errors_total", "Controller errors by action.", ("action",)
+    )
+    latency = registry.histogram(
+        "tictactoe_event_seconds",
+        "Durations reported through the 'elapsed' payload field.",
+        ("channel", "action"),
+    )
+    values = registry.gauge(
+        "tictactoe_event_value",
+        "Last value of selected numeric payload fields.",
+        ("channel", "action", "field"),
+    )
+
+    def record(event: TelemetryEvent) -> None:
+        events.labels(event.channel, event.action).inc()
+        payload = event.payload
+        if type(payload) is not dict:
+            return
+        elapsed = payload.get("elapsed")
+        if isinstance(elapsed, (int, float)):
+            latency.labels(event.channel, event.action).observe(elapsed)
+        for field in GAUGE_FIELDS:
+            value = payload.get(field)
+            if isinstance(value, (int, float)):
+                values.labels(event.channel, event.action, field).set(value)
+
+    def chain(
+        next_hook: Optional[Callable[[TelemetryEvent], None]]
+    ) -> Callable[[TelemetryEvent], None]:
+        if next_hook is None:
+            return record
+
+        def hook(event: TelemetryEvent) -> None:
+            record(event)
+            next_hook(event)
+
+        return hook
+
+    def on_error(exc: Exception, event: TelemetryEvent) -> None:
+        errors.labels(event.action).inc()
+        if forward is not None and forward.error is not None:
+            forward.error(exc, event)
+
+    return ControllerHooks(
+        view=chain(forward.view if forward else None),
+        domain=chain(forward.domain if forward else None),
+        error=on_error,
+        muted=forward.muted if forward else frozenset(),
+        other=chain(forward.other if forward else None),
+    )
+
+
+def write_metrics_file(registry: MetricsRegistry, path: Path) -> None:
+    """Write the exposition text atomically (for node_exporter textfiles)."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(registry.render(), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+class PeriodicMetricsWriter:
+    """Rewrite a metrics file every *interval* seconds and once on `close`."""
+
+    def __init__(
+        self, registry: MetricsRegistry, path: Path, *, interval: float = 15.0
+    ) -> None:
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="tictactoe-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            write_metrics_file(self.registry, self.path)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        write_metrics_file(self.registry, self.path)
+
+
+def serve_metrics(
+    registry: MetricsRegistry = DEFAULT_REGISTRY,
+    *,
+    port: int = 9464,
+    host: str = "127.0.0.1",
+) -> ThreadingHTTPServer:
+    """Serve ``GET /metrics`` from a daemon thread; call ``shutdown()`` to stop."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="tictactoe-metrics-http", daemon=True
+    )
+    thread.start()
+    return server
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _merge(labels: str, name: str, value: str) -> str:
+    extra = f'{name}="{value}"'
+    if not labels:
+        return "{" + extra + "}"
+    return labels[:-1] + "," + extra + "}"
+
+
+__all__ = [
+    "Counter",
+    "DEFAULT_REGISTRY",
+    "GAUGE_FIELDS",
+    "Gauge",
+    "Histogram",
+    "MetricFamily",
+    "MetricsRegistry",
+    "PeriodicMetricsWriter",
+    "log_buckets",
+    "metrics_hooks",
+    "serve_metrics",
+    "write_metrics_file",
+]
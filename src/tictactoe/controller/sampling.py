@@ -0,0 +1,243 @@
+"""Per channel/action sampling and rate limits in front of telemetry hooks.
+
+Rules are ``pattern=policy`` pairs, written in ``TICTACTOE_LOGGING_POLICY``
+as a comma-separated list::
+
+    TICTACTOE_LOGGING_POLICY="view.cell_click=sample:0.1,domain.*=rate:20/5"
+
+Patterns are ``channel.action``, ``channel.*``, ``*.action`` or ``*`` (as in
+`tictactoe.controller.bus`); the most specific rule wins and every
+channel/action pair gets its own policy state.
+
+    sample:P        keep each event with probability P
+    rate:R[/B]      token bucket refilled at R events/second, burst B (default R)
+    first:N/S       keep the first N events of every S-second window
+
+Suppressed events are not lost from the totals: the next event that passes
+carries ``suppressed=<count>`` in its payload, and `SamplingFilter.flush`
+(run at exit) emits an ``events_suppressed`` event for whatever is left.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent, TelemetryHook
+from tictactoe.controller.bus import parse_pattern
+
+Clock = Callable[[], float]
+
+
+class Policy:
+    """Decides whether one event passes; *now* comes from the filter's clock."""
+
+    def allow(self, now: float) -> bool:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class Probability(Policy):
+    def __init__(self, rate: float, rng: random.Random) -> None:
+        self.rate = rate
+        self._rng = rng
+
+    def allow(self, now: float) -> bool:
+        return self._rng.random() < self.rate
+
+
+class TokenBucket(Policy):
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated: Optional[float] = None
+
+    def allow(self, now: float) -> bool:
+        if self._updated is not None:
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class FirstPerInterval(Policy):
+    def __init__(self, limit: int, interval: float) -> None:
+        self.limit = limit
+        self.interval = interval
+        self._window = -float("inf")
+        self._count = 0
+
+    def allow(self, now: float) -> bool:
+        if now - self._window >= self.interval:
+            self._window = now
+            self._count = 0
+        self._count += 1
+        return self._count <= self.limit
+
+
+PolicyFactory = Callable[[random.Random], Policy]
+
+
+@dataclass(frozen=True)
+class Rule:
+    pattern: str
+    spec: str
+    factory: PolicyFactory
+
+
+def parse_policy(spec: str) -> PolicyFactory:
+    """Turn ``sample:P``, ``rate:R[/B]`` or ``first:N/S`` into a factory."""
+
+    kind, _, argument = spec.strip().partition(":")
+    kind = kind.strip().lower()
+    try:
+        if kind == "sample":
+            probability = float(argument)
+            if not 0.0 <= probability <= 1.0:
+                raise ValueError
+            return lambda rng: Probability(probability, rng)
+        if kind == "rate":
+            rate_text, _, burst_text = argument.partition("/")
+            rate = float(rate_text)
+            burst = float(burst_text) if burst_text else max(rate, 1.0)
+            if rate <= 0 or burst < 1:
+                raise ValueError
+            return lambda rng: TokenBucket(rate, burst)
+        if kind == "first":
+            limit_text, _, interval_text = argument.partition("/")
+            limit = int(limit_text)
+            interval = float(interval_text)
+            if limit < 0 or interval <= 0:
+                raise ValueError
+            return lambda rng: FirstPerInterval(limit, interval)
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid telemetry policy {spec!r}.")
+
+
+def parse_rules(text: str) -> List[Rule]:
+    """Parse a comma-separated ``pattern=policy`` list."""
+
+    rules = []
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        pattern, separator, spec = item.partition("=")
+        pattern = pattern.strip()
+        if not separator or not pattern:
+            raise ValueError(f"Expected pattern=policy, got {item.strip()!r}.")
+        parse_pattern(pattern)
+        rules.append(Rule(pattern, spec.strip(), parse_policy(spec)))
+    return rules
+
+
+class SamplingFilter:
+    """Wraps *forward* so each event first passes its channel/action policy."""
+
+    def __init__(
+        self,
+        forward: ControllerHooks,
+        rules: Sequence[Rule],
+        *,
+        clock: Clock = time.monotonic,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.forward = forward
+        self._rules = {rule.pattern: rule for rule in rules}
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._policies: Dict[Tuple[str, str], Optional[Policy]] = {}
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._suppressed: Dict[Tuple[str, str], int] = {}
+        self.hooks = ControllerHooks(
+            view=self._wrap(forward.view),
+            domain=self._wrap(forward.domain),
+            error=forward.error,
+            muted=forward.muted,
+            other=self._wrap(forward.other),
+        )
+
+    def suppressed(self) -> Dict[str, int]:
+        """Total suppressed events per ``channel.action`` since creation."""
+
+        with self._lock:
+            return {
+                f"{channel}.{action}": count
+                for (channel, action), count in self._suppressed.items()
+            }
+
+    def flush(self) -> None:
+        """Report suppressed counts not yet attached to a forwarded event."""
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for (channel, action), count in sorted(pending.items()):
+            hook = self.forward._hook_for(channel)
+            if hook is None:
+                continue
+            event = TelemetryEvent(
+                channel=channel,
+                action="events_suppressed",
+                payload={"action": action, "suppressed": count},
+            )
+            self.forward._deliver(hook, event)
+
+    def _wrap(self, hook: Optional[TelemetryHook]) -> Optional[TelemetryHook]:
+        if hook is None:
+            return None
+
+        def filtered(event: TelemetryEvent) -> None:
+            passed = self._admit(event)
+            if passed is not None:
+                hook(passed)
+
+        return filtered
+
+    def _admit(self, event: TelemetryEvent) -> Optional[TelemetryEvent]:
+        key = (event.channel, event.action)
+        with self._lock:
+            try:
+                policy = self._policies[key]
+            except KeyError:
+                policy = self._policies[key] = self._policy_for(key)
+            if policy is None:
+                return event
+            if not policy.allow(self._clock()):
+                self._pending[key] = self._pending.get(key, 0) + 1
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return None
+            count = self._pending.pop(key, 0)
+        if not count:
+            return event
+        payload = dict(event.payload)
+        payload["suppressed"] = count
+        return TelemetryEvent(
+            channel=event.channel, action=event.action, payload=payload
+        )
+
+    def _policy_for(self, key: Tuple[str, str]) -> Optional[Policy]:
+        channel, action = key
+        for pattern in (f"{channel}.{action}", f"{channel}.*", f"*.{action}", "*"):
+            rule = self._rules.get(pattern)
+            if rule is not None:
+                return rule.factory(self._rng)
+        return None
+
+
+__all__ = [
+    "FirstPerInterval",
+    "Policy",
+    "Probability",
+    "Rule",
+    "SamplingFilter",
+    "TokenBucket",
+    "parse_policy",
+    "parse_rules",
+]
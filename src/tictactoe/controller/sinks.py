@@ -0,0 +1,255 @@
+"""Machine-readable telemetry: one compact JSON object per event.
+
+`JsonLinesSink` serialises each `TelemetryEvent` into an in-memory buffer
+and writes it out when the buffer fills, every *flush_interval* seconds (a
+daemon thread), and on `close` (registered at exit by `configure_hooks`).
+Each line looks like::
+
+    {"ts":1760700000.1,"channel":"view","action":"cell_click","payload":{"position":4}}
+
+The file rotates once it would exceed *max_bytes* or is older than
+*max_age* seconds; rotated files get a timestamp and sequence suffix and,
+with ``compress=True``, are gzipped by a single background worker. The
+sequence continues from the highest one already next to *path*, so a new
+process never overwrites an earlier run's rotations.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Callable, List, Optional
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent, TelemetryHook
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
+
+def event_line(event: TelemetryEvent, timestamp: float) -> str:
+    """Compact JSON line (with trailing newline) for *event*."""
+
+    record = {
+        "ts": round(timestamp, 6),
+        "channel": event.channel,
+        "action": event.action,
+        "payload": dict(event.payload),
+    }
+    return _ENCODER.encode(record) + "\n"
+
+
+class JsonLinesSink:
+    """Buffered, rotating JSON-lines writer for telemetry events."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        compress: bool = False,
+        buffer_size: int = 64 * 1024,
+        flush_interval: Optional[float] = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive.")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive.")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._handle: Optional[IO[bytes]] = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._rotations: Optional[int] = None
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future[Path]] = []
+        self._closed = False
+        self.rotated: List[Path] = []
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="tictactoe-telemetry-sink",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def write(self, event: TelemetryEvent) -> None:
+        line = event_line(event, self._clock()).encode("utf-8")
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer.append(line)
+            self._buffered += len(line)
+            if self._buffered >= self.buffer_size:
+                self._flush_locked()
+
+    def write_error(self, exc: Exception, event: TelemetryEvent) -> None:
+        payload = dict(event.payload)
+        payload["error"] = repr(exc)
+        self.write(
+            TelemetryEvent(channel=event.channel, action=event.action, payload=payload)
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush, close the file, and wait for pending compression."""
+
+        self._stop.set()
+        if (
+            self._flusher is not None
+            and self._flusher is not threading.current_thread()
+        ):
+            self._flusher.join()
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        for future in self._pending:
+            future.result()
+        if self._compressor is not None:
+            self._compressor.shutdown()
+
+    def hooks(self, forward: Optional[ControllerHooks] = None) -> ControllerHooks:
+        """Hooks that write every event, then call *forward* (if any)."""
+
+        def chain(next_hook: Optional[TelemetryHook]) -> TelemetryHook:
+            if next_hook is None:
+                return self.write
+
+            def hook(event: TelemetryEvent) -> None:
+                self.write(event)
+                next_hook(event)
+
+            return hook
+
+        def on_error(exc: Exception, event: TelemetryEvent) -> None:
+            self.write_error(exc, event)
+            if forward is not None and forward.error is not None:
+                forward.error(exc, event)
+
+        return ControllerHooks(
+            view=chain(forward.view if forward else None),
+            domain=chain(forward.domain if forward else None),
+            error=on_error,
+            muted=forward.muted if forward else frozenset(),
+            other=chain(forward.other if forward else None),
+        )
+
+    # ------------------------------------------------------------------
+    # Internals (called with the lock held)
+    # ------------------------------------------------------------------
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        handle = self._handle
+        if handle is not None and self._should_rotate(len(data)):
+            self._rotate(handle)
+            handle = None
+        if handle is None:
+            handle = self._open()
+        handle.write(data)
+        handle.flush()
+        self._size += len(data)
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if (
+            self.max_bytes is not None
+            and self._size
+            and (self._size + incoming > self.max_bytes)
+        ):
+            return True
+        if self.max_age is not None:
+            return self._clock() - self._opened_at >= self.max_age
+        return False
+
+    def _open(self) -> IO[bytes]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self._handle = self.path.open("ab")
+        self._size = self.path.stat().st_size
+        self._opened_at = self._clock()
+        return handle
+
+    def _rotate(self, handle: IO[bytes]) -> None:
+        handle.close()
+        self._handle = None
+        target = self._rotation_target()
+        os.replace(self.path, target)
+        if not self.compress:
+            self.rotated.append(target)
+            return
+        if self._compressor is None:
+            self._compressor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tictactoe-telemetry-gzip"
+            )
+        self._pending = [future for future in self._pending if not future.done()]
+        self._pending.append(self._compressor.submit(self._gzip, target))
+
+    def _rotation_target(self) -> Path:
+        if self._rotations is None:
+            self._rotations = self._last_rotation()
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.localtime(self._clock()))
+        while True:
+            self._rotations += 1
+            target = self.path.with_name(
+                f"{self.path.stem}.{stamp}-{self._rotations}{self.path.suffix}"
+            )
+            if (
+                not target.exists()
+                and not target.with_name(target.name + ".gz").exists()
+            ):
+                return target
+
+    def _last_rotation(self) -> int:
+        pattern = re.compile(
+            rf"{re.escape(self.path.stem)}\.\d{{8}}T\d{{6}}-(\d+)"
+            rf"{re.escape(self.path.suffix)}(?:\.gz)?"
+        )
+        last = 0
+        for entry in self.path.parent.glob(f"{self.path.stem}.*"):
+            match = pattern.fullmatch(entry.name)
+            if match:
+                last = max(last, int(match.group(1)))
+        return last
+
+    def _gzip(self, source: Path) -> Path:
+        target = source.with_name(source.name + ".gz")
+        with source.open("rb") as raw, gzip.open(target, "wb") as packed:
+            shutil.copyfileobj(raw, packed)
+        source.unlink()
+        with self._lock:
+            self.rotated.append(target)
+        return target
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+
+__all__ = ["JsonLinesSink", "event_line"]
@@ -1,21 +1,52 @@
 """Domain module exposing the template-friendly placeholder layer."""
 
+from .bitboard import BitboardTicTacToe
+from .history import GameHistory
+from .kinarow import KInARowGame
+from .listeners import ListenerMonitor, ListenerStats
 from .logic import (
+    STANDARD_GEOMETRY,
+    BatchResult,
+    BoardGeometry,
+    CellChange,
     ExampleAction,
     ExampleActor,
     ExampleState,
     GameSnapshot,
     GameState,
+    GameTransaction,
     Player,
+    StateDelta,
     TicTacToe,
 )
+from .mcts import MCTSPlayer, MCTSResult, MCTSStats
+from .replay import ActionLog
+from .search import SearchEngine, SearchResult, SearchStats
 
 __all__ = [
     "TicTacToe",
+    "BitboardTicTacToe",
+    "KInARowGame",
+    "BoardGeometry",
+    "STANDARD_GEOMETRY",
+    "SearchEngine",
+    "SearchResult",
+    "SearchStats",
+    "MCTSPlayer",
+    "MCTSResult",
+    "MCTSStats",
     "ExampleState",
     "ExampleAction",
     "ExampleActor",
     "Player",
     "GameState",
     "GameSnapshot",
+    "StateDelta",
+    "CellChange",
+    "BatchResult",
+    "GameTransaction",
+    "GameHistory",
+    "ListenerMonitor",
+    "ListenerStats",
+    "ActionLog",
 ]
@@ -0,0 +1,262 @@
+"""NumPy-vectorized simulator that advances many games per step.
+
+Requires the optional ``batch`` extra (``pip install tictactoe[batch]``); the
+rest of the domain layer does not import this module.
+
+Boards are stored as a ``(B, cells)`` int8 array using the same cell codes as
+the solved-position table: 0 empty, 1 primary, 2 secondary. Each game keeps
+per-line stone counts for both players, so placing a stone adds one row of the
+``(cells, lines)`` incidence matrix and a win is any count reaching *k*.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+from .logic import STANDARD_GEOMETRY, BoardGeometry, GameState
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - exercised without the extra
+    raise ImportError(
+        "tictactoe.domain.batch requires NumPy; install tictactoe[batch]."
+    ) from exc
+
+EMPTY, PRIMARY, SECONDARY = 0, 1, 2
+# Per-game status codes stored in `BatchSimulator.status`.
+PLAYING, X_WON, O_WON, DRAW = 0, 1, 2, 3
+
+_STATUS_STATES = {
+    PLAYING: GameState.PLAYING,
+    X_WON: GameState.X_WON,
+    O_WON: GameState.O_WON,
+    DRAW: GameState.DRAW,
+}
+
+SeedLike = Union[int, "np.random.Generator", None]
+
+
+def line_matrix(geometry: BoardGeometry) -> npt.NDArray[np.int8]:
+    """Return the ``(cells, lines)`` int8 incidence matrix of winning lines."""
+
+    matrix: npt.NDArray[np.int8] = np.zeros(
+        (geometry.cells, len(geometry.lines)), dtype=np.int8
+    )
+    for index, line in enumerate(geometry.lines):
+        matrix[list(line), index] = 1
+    return matrix
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Aggregate outcome of a batch of games."""
+
+    games: int
+    x_wins: int
+    o_wins: int
+    draws: int
+    unfinished: int
+    total_plies: int
+
+    @property
+    def mean_length(self) -> float:
+        finished = self.games - self.unfinished
+        return self.total_plies / finished if finished else 0.0
+
+    def outcomes(self) -> Dict[GameState, int]:
+        """Counts keyed like the scalar engine's `GameState`."""
+
+        return {
+            GameState.PLAYING: self.unfinished,
+            GameState.X_WON: self.x_wins,
+            GameState.O_WON: self.o_wins,
+            GameState.DRAW: self.draws,
+        }
+
+    def __add__(self, other: BatchStats) -> BatchStats:
+        return BatchStats(
+            games=self.games + other.games,
+            x_wins=self.x_wins + other.x_wins,
+            o_wins=self.o_wins + other.o_wins,
+            draws=self.draws + other.draws,
+            unfinished=self.unfinished + other.unfinished,
+            total_plies=self.total_plies + other.total_plies,
+        )
+
+
+class BatchSimulator:
+    """Plays *batch_size* independent games in lockstep.
+
+    Every game starts with the primary player to move, exactly like the
+    scalar engines, and follows the same rules: a move on an occupied cell is
+    illegal, a completed line ends the game immediately, and a full board
+    without a line is a draw.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        geometry: BoardGeometry = STANDARD_GEOMETRY,
+        *,
+        seed: SeedLike = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+        self.batch_size = batch_size
+        self.geometry = geometry
+        self.rng = np.random.default_rng(seed)
+        self._lines = line_matrix(geometry)
+        self._rows = np.arange(batch_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every board back to the opening position."""
+
+        cells, lines = self._lines.shape
+        self.boards: npt.NDArray[np.int8] = np.zeros(
+            (self.batch_size, cells), dtype=np.int8
+        )
+        self.status: npt.NDArray[np.int8] = np.zeros(self.batch_size, dtype=np.int8)
+        self.plies: npt.NDArray[np.int32] = np.zeros(self.batch_size, dtype=np.int32)
+        self._counts: npt.NDArray[np.int16] = np.zeros(
+            (2, self.batch_size, lines), dtype=np.int16
+        )
+
+    @property
+    def active(self) -> npt.NDArray[np.bool_]:
+        """Boolean mask of games that are still being played."""
+
+        mask: npt.NDArray[np.bool_] = self.status == PLAYING
+        return mask
+
+    @property
+    def to_move(self) -> npt.NDArray[np.int8]:
+        """Cell code (1 or 2) of the player to move in every game."""
+
+        return (self.plies % 2 + 1).astype(np.int8)
+
+    def step(self, moves: npt.ArrayLike) -> None:
+        """Apply one move per game; entries for finished games are ignored.
+
+        Raises ValueError if an active game is handed an occupied or
+        out-of-range cell.
+        """
+
+        cells_by_game = np.asarray(moves, dtype=np.intp)
+        if cells_by_game.shape != (self.batch_size,):
+            raise ValueError(
+                f"Expected {self.batch_size} moves, got {cells_by_game.shape}."
+            )
+        rows = self._rows[self.active]
+        if not rows.size:
+            return
+        chosen = cells_by_game[rows]
+        cells = self.boards.shape[1]
+        if ((chosen < 0) | (chosen >= cells)).any():
+            raise ValueError(f"Moves must be between 0 and {cells - 1}.")
+        if self.boards[rows, chosen].any():
+            raise ValueError("Illegal move onto an occupied cell.")
+
+        player = self.plies[rows] % 2
+        self.boards[rows, chosen] = (player + 1).astype(np.int8)
+        self._counts[player, rows] += self._lines[chosen]
+        self.plies[rows] += 1
+
+        won = (self._counts[player, rows] >= self.geometry.k).any(axis=1)
+        full = self.plies[rows] == cells
+        self.status[rows[won]] = np.where(player[won] == 0, X_WON, O_WON)
+        self.status[rows[~won & full]] = DRAW
+
+    def random_moves(self) -> npt.NDArray[np.intp]:
+        """Draw a uniformly random empty cell for every game."""
+
+        noise = self.rng.random(self.boards.shape)
+        noise[self.boards != EMPTY] = -1.0
+        moves: npt.NDArray[np.intp] = noise.argmax(axis=1)
+        return moves
+
+    def play_random(self) -> BatchStats:
+        """Finish every game with uniformly random moves."""
+
+        while self.active.any():
+            self.step(self.random_moves())
+        return self.stats()
+
+    def play_script(self, moves: npt.ArrayLike) -> BatchStats:
+        """Apply a ``(B, T)`` move script column by column.
+
+        Games that end early ignore the rest of their row, so rows may be
+        padded with any value (e.g. -1).
+        """
+
+        script = np.asarray(moves, dtype=np.intp)
+        if script.ndim != 2 or script.shape[0] != self.batch_size:
+            raise ValueError(f"Expected a ({self.batch_size}, T) move script.")
+        for column in script.T:
+            if not self.active.any():
+                break
+            self.step(column)
+        return self.stats()
+
+    def winners(self) -> npt.NDArray[np.int8]:
+        """Recompute status codes from the boards alone via matmul.
+
+        Independent of the incremental counters; useful as a cross-check.
+        """
+
+        k = self.geometry.k
+        primary = (self.boards == PRIMARY).astype(np.int16) @ self._lines
+        secondary = (self.boards == SECONDARY).astype(np.int16) @ self._lines
+        status: npt.NDArray[np.int8] = np.full(self.batch_size, PLAYING, dtype=np.int8)
+        status[(self.boards != EMPTY).all(axis=1)] = DRAW
+        status[(secondary >= k).any(axis=1)] = O_WON
+        status[(primary >= k).any(axis=1)] = X_WON
+        return status
+
+    def states(self) -> list[GameState]:
+        """Per-game `GameState`, for comparisons with the scalar engines."""
+
+        return [_STATUS_STATES[int(code)] for code in self.status]
+
+    def stats(self) -> BatchStats:
+        counts = np.bincount(self.status, minlength=4)
+        finished = self.status != PLAYING
+        return BatchStats(
+            games=self.batch_size,
+            x_wins=int(counts[X_WON]),
+            o_wins=int(counts[O_WON]),
+            draws=int(counts[DRAW]),
+            unfinished=int(counts[PLAYING]),
+            total_plies=int(self.plies[finished].sum()),
+        )
+
+
+def simulate_random_games(
+    games: int,
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
+    *,
+    seed: SeedLike = None,
+    chunk_size: int = 1 << 16,
+) -> BatchStats:
+    """Play *games* uniformly random games in chunks and merge the stats."""
+
+    rng = np.random.default_rng(seed)
+    total: Optional[BatchStats] = None
+    remaining = games
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        simulator = BatchSimulator(size, geometry, seed=rng)
+        chunk = simulator.play_random()
+        total = chunk if total is None else total + chunk
+        remaining -= size
+    return total or BatchStats(0, 0, 0, 0, 0, 0)
+
+
+__all__ = [
+    "BatchSimulator",
+    "BatchStats",
+    "line_matrix",
+    "simulate_random_games",
+]
@@ -0,0 +1,249 @@
+"""Bitboard primitives plus a 3x3 engine that honours the `TicTacToe` contract."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, cast
+
+from .engine import WIN_STATES, GridEngine
+from .logic import (
+    RESET_ACTION,
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    BoardTuple,
+    ExampleAction,
+    GameState,
+    Player,
+)
+
+BOARD_CELLS = STANDARD_GEOMETRY.cells
+FULL_MASK = (1 << BOARD_CELLS) - 1
+
+
+@lru_cache(maxsize=None)
+def line_masks(geometry: BoardGeometry) -> Tuple[int, ...]:
+    """Bitmask for each window in ``geometry.lines``."""
+
+    return tuple(sum(1 << cell for cell in line) for line in geometry.lines)
+
+
+@lru_cache(maxsize=None)
+def cell_line_masks(geometry: BoardGeometry) -> Tuple[Tuple[int, ...], ...]:
+    """Masks of the windows through each cell, indexed by position."""
+
+    masks = line_masks(geometry)
+    return tuple(tuple(masks[line] for line in lines) for lines in geometry.cell_lines)
+
+
+@lru_cache(maxsize=None)
+def neighbor_masks(geometry: BoardGeometry) -> Tuple[int, ...]:
+    """Mask of each cell plus its eight neighbours, indexed by position."""
+
+    masks = []
+    for cell in range(geometry.cells):
+        row, column = geometry.row_column(cell)
+        mask = 0
+        for d_row in (-1, 0, 1):
+            for d_column in (-1, 0, 1):
+                r, c = row + d_row, column + d_column
+                if 0 <= r < geometry.height and 0 <= c < geometry.width:
+                    mask |= 1 << (r * geometry.width + c)
+        masks.append(mask)
+    return tuple(masks)
+
+
+def board_bitboards(board: Sequence[Optional[Player]]) -> Tuple[int, int]:
+    """Fold a board tuple into ``(primary, secondary)`` bitboards."""
+
+    primary = 0
+    secondary = 0
+    for position, cell in enumerate(board):
+        if cell is Player.PRIMARY:
+            primary |= 1 << position
+        elif cell is Player.SECONDARY:
+            secondary |= 1 << position
+    return primary, secondary
+
+
+class SymmetryMapper:
+    """Applies `BoardGeometry.symmetries` to bitboards a byte at a time.
+
+    Each symmetry owns one 256-entry table per byte of the board, so a
+    transform costs ``cells / 8`` lookups instead of one step per cell.
+    """
+
+    def __init__(self, geometry: BoardGeometry) -> None:
+        self.geometry = geometry
+        self.permutations = geometry.symmetries
+        self.inverse = tuple(
+            tuple(sorted(range(len(p)), key=p.__getitem__)) for p in self.permutations
+        )
+        chunks = (geometry.cells + 7) // 8
+        self._chunks = chunks
+        self._tables = tuple(
+            tuple(
+                tuple(
+                    sum(
+                        1 << permutation[chunk * 8 + bit]
+                        for bit in range(8)
+                        if value >> bit & 1 and chunk * 8 + bit < geometry.cells
+                    )
+                    for value in range(256)
+                )
+                for chunk in range(chunks)
+            )
+            for permutation in self.permutations
+        )
+
+    def transform(self, symmetry: int, bits: int) -> int:
+        """Return *bits* with every cell moved by symmetry *symmetry*."""
+
+        result = 0
+        for table in self._tables[symmetry]:
+            if not bits:
+                break
+            result |= table[bits & 0xFF]
+            bits >>= 8
+        return result
+
+    def canonical(self, first: int, second: int) -> Tuple[int, int]:
+        """Return ``(key, symmetry)`` for the smallest transformed position."""
+
+        shift = self.geometry.cells
+        best_key = -1
+        best_symmetry = 0
+        for symmetry in range(len(self.permutations)):
+            key = self.transform(symmetry, first) | (
+                self.transform(symmetry, second) << shift
+            )
+            if best_key < 0 or key < best_key:
+                best_key = key
+                best_symmetry = symmetry
+        return best_key, best_symmetry
+
+
+@lru_cache(maxsize=None)
+def symmetry_mapper(geometry: BoardGeometry) -> SymmetryMapper:
+    """Shared `SymmetryMapper` per geometry."""
+
+    return SymmetryMapper(geometry)
+
+
+WIN_MASKS: Tuple[int, ...] = line_masks(STANDARD_GEOMETRY)
+
+# Only the lines through the cell that was just played can complete a win.
+_MASKS_BY_CELL: Tuple[Tuple[int, ...], ...] = cell_line_masks(STANDARD_GEOMETRY)
+
+
+class BitboardTicTacToe(GridEngine):
+    """Standard 3x3 rules stored as one integer bitboard per player.
+
+    Bit ``n`` of each bitboard marks cell ``n``. The public `board` tuple is
+    only materialized when a caller reads it and is cached until the next
+    mutation, so simulations that never render pay no allocation cost.
+    """
+
+    def __init__(self) -> None:
+        self._primary_bits = 0
+        self._secondary_bits = 0
+        super().__init__(board_size=BOARD_CELLS)
+        self._notes = ()
+
+    @property
+    def bitboards(self) -> Tuple[int, int]:
+        """Return the ``(primary, secondary)`` bitboards."""
+
+        return self._primary_bits, self._secondary_bits
+
+    @property
+    def board(self) -> BoardTuple:
+        """Materialize (and cache) the tuple view of both bitboards."""
+
+        if self._board_cache is None:
+            primary = self._primary_bits
+            secondary = self._secondary_bits
+            self._board_cache = tuple(
+                (
+                    Player.PRIMARY
+                    if primary >> cell & 1
+                    else Player.SECONDARY if secondary >> cell & 1 else None
+                )
+                for cell in range(BOARD_CELLS)
+            )
+        return self._board_cache
+
+    def legal_moves(self) -> Tuple[int, ...]:
+        """Return the empty cells while the game is still in progress."""
+
+        if self.state is not GameState.PLAYING:
+            return ()
+        occupied = self._primary_bits | self._secondary_bits
+        return tuple(cell for cell in range(BOARD_CELLS) if not occupied >> cell & 1)
+
+    def is_legal(self, position: int) -> bool:
+        """Return True when *position* can be claimed by the current player."""
+
+        if self.state is not GameState.PLAYING:
+            return False
+        if position < 0 or position >= BOARD_CELLS:
+            return False
+        return not (self._primary_bits | self._secondary_bits) >> position & 1
+
+    def reset(self) -> None:
+        """Clear both bitboards and hand the first move to the primary actor."""
+
+        self._record_board_cleared()
+        self._primary_bits = 0
+        self._secondary_bits = 0
+        self.current_player = Player.PRIMARY
+        self.state = GameState.PLAYING
+        self._winner = None
+        self._state_changed(RESET_ACTION)
+
+    def _write_cell(self, position: int, value: Optional[Player]) -> None:
+        bit = 1 << position
+        self._primary_bits &= ~bit
+        self._secondary_bits &= ~bit
+        if value is Player.PRIMARY:
+            self._primary_bits |= bit
+        elif value is Player.SECONDARY:
+            self._secondary_bits |= bit
+
+    def _apply_move(
+        self, position: int, action: Optional[ExampleAction] = None
+    ) -> None:
+        player = cast(Player, self.current_player)
+        bit = 1 << position
+        if player is Player.PRIMARY:
+            self._primary_bits |= bit
+            bits = self._primary_bits
+            next_player = Player.SECONDARY
+        else:
+            self._secondary_bits |= bit
+            bits = self._secondary_bits
+            next_player = Player.PRIMARY
+        self._record_cell(position, None, player)
+
+        if any(bits & mask == mask for mask in _MASKS_BY_CELL[position]):
+            self.state = WIN_STATES[player]
+            self._winner = player
+            self.current_player = None
+        elif self._primary_bits | self._secondary_bits == FULL_MASK:
+            self.state = GameState.DRAW
+            self.current_player = None
+        else:
+            self.current_player = next_player
+        self._state_changed(action)
+
+
+__all__ = [
+    "BitboardTicTacToe",
+    "FULL_MASK",
+    "SymmetryMapper",
+    "WIN_MASKS",
+    "board_bitboards",
+    "cell_line_masks",
+    "line_masks",
+    "neighbor_masks",
+    "symmetry_mapper",
+]
@@ -0,0 +1,270 @@
+"""Versioned binary codec for `ExampleState` snapshots and ``grid.select`` actions.
+
+Streams start with a header naming the record kind and the board geometry,
+followed by fixed-width little-endian records::
+
+    header  <4sBBBB     magic (b"TTSB" states, b"TTAB" actions), format
+                        version, width, height, k
+    state   <BH + board status byte (bits 0-1 current player, 2-3 state,
+                        4-5 winner), ply (the stone count, checked against
+                        the board on decode), then the board at 2 bits per cell
+                        (0 empty, 1 primary, 2 secondary), four cells per
+                        byte, cell 0 in the low bits
+    action  <BBH        action kind (1 = grid.select), actor (0 none,
+                        1 primary, 2 secondary), position
+
+Packing works on whole byte strings: the board is mapped to one code byte per
+cell through a lookup table and folded four cells at a time with big-integer
+arithmetic on strided slices, so no per-cell Python objects are created.
+Records can be written to and read from any ``bytearray``/``memoryview``.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .logic import (
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    ExampleAction,
+    ExampleState,
+    GameState,
+    Player,
+)
+
+CODEC_VERSION = 1
+STATE_MAGIC = b"TTSB"
+ACTION_MAGIC = b"TTAB"
+HEADER = struct.Struct("<4sBBBB")
+STATE_PREFIX = struct.Struct("<BH")
+ACTION_RECORD = struct.Struct("<BBH")
+SELECT_KIND = 1
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_PLAYER_CODES = {None: 0, Player.PRIMARY: 1, Player.SECONDARY: 2}
+_CODE_PLAYERS: Tuple[Optional[Player], ...] = (None, Player.PRIMARY, Player.SECONDARY)
+_ACTOR_CODES = {None: 0, Player.PRIMARY.value: 1, Player.SECONDARY.value: 2}
+_CODE_ACTORS: Tuple[Optional[str], ...] = (
+    None,
+    Player.PRIMARY.value,
+    Player.SECONDARY.value,
+)
+_STATE_CODES = {
+    GameState.PLAYING: 0,
+    GameState.X_WON: 1,
+    GameState.O_WON: 2,
+    GameState.DRAW: 3,
+}
+_CODE_STATES = tuple(_STATE_CODES)
+
+
+class StateCodec:
+    """Fixed-width state records for one board geometry."""
+
+    def __init__(self, geometry: BoardGeometry = STANDARD_GEOMETRY) -> None:
+        self.geometry = geometry
+        self.cells = geometry.cells
+        self._padded = (geometry.cells + 3) // 4 * 4
+        self.board_size = self._padded // 4
+        self.record_size = STATE_PREFIX.size + self.board_size
+        # 0x03 in every byte of an unpacked quarter-board.
+        self._lane_mask = int.from_bytes(b"\x03" * self.board_size, "little")
+
+    @classmethod
+    def from_header(cls, buffer: Buffer, offset: int = 0) -> StateCodec:
+        geometry = _read_header(buffer, offset, STATE_MAGIC)
+        return cls(geometry)
+
+    def header(self) -> bytes:
+        return _header(STATE_MAGIC, self.geometry)
+
+    # ------------------------------------------------------------------
+    # Board packing
+    # ------------------------------------------------------------------
+    def pack_board(self, board: Sequence[Optional[Player]]) -> bytes:
+        """2-bit pack *board*; returns ``board_size`` bytes."""
+
+        codes = bytes(map(_PLAYER_CODES.__getitem__, board))
+        return self.pack_codes(codes)
+
+    def pack_codes(self, codes: bytes) -> bytes:
+        """Pack one code byte per cell (0/1/2) four cells to a byte."""
+
+        if len(codes) != self.cells:
+            raise ValueError(f"Expected {self.cells} cells, got {len(codes)}.")
+        codes = codes.ljust(self._padded, b"\0")
+        packed = 0
+        for lane in range(4):
+            # Lane n holds cells n, n+4, ... one per byte; values stay <= 3,
+            # so shifting by 2n never carries into the next byte.
+            packed |= int.from_bytes(codes[lane::4], "little") << (2 * lane)
+        return packed.to_bytes(self.board_size, "little")
+
+    def unpack_codes(self, packed: Buffer) -> bytes:
+        """Inverse of `pack_codes`: one code byte per cell."""
+
+        value = int.from_bytes(packed, "little")
+        codes = bytearray(self._padded)
+        for lane in range(4):
+            codes[lane::4] = ((value >> (2 * lane)) & self._lane_mask).to_bytes(
+                self.board_size, "little"
+            )
+        return bytes(codes[: self.cells])
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+    def pack_into(
+        self, buffer: Union[bytearray, memoryview], offset: int, state: ExampleState
+    ) -> None:
+        codes = bytes(map(_PLAYER_CODES.__getitem__, state.board))
+        status = (
+            _PLAYER_CODES[state.current_player]
+            | _STATE_CODES[state.state] << 2
+            | _PLAYER_CODES[state.winner] << 4
+        )
+        ply = self.cells - codes.count(0)
+        STATE_PREFIX.pack_into(buffer, offset, status, ply)
+        start = offset + STATE_PREFIX.size
+        buffer[start : start + self.board_size] = self.pack_codes(codes)
+
+    def unpack_from(self, buffer: Buffer, offset: int = 0) -> ExampleState:
+        """Decode one record. `version` and the Zobrist hashes stay 0.
+
+        Raises ValueError for player code 3 or a ply that disagrees with the
+        board, both of which only corrupt input produces.
+        """
+
+        status: int
+        ply: int
+        status, ply = STATE_PREFIX.unpack_from(buffer, offset)
+        start = offset + STATE_PREFIX.size
+        codes = self.unpack_codes(buffer[start : start + self.board_size])
+        if 3 in codes or status & 0x3 == 3 or status >> 4 & 0x3 == 3:
+            raise ValueError("Corrupt state record: unknown player code.")
+        if ply != self.cells - codes.count(0):
+            raise ValueError(f"Corrupt state record: ply {ply} does not match board.")
+        return ExampleState(
+            board=tuple(map(_CODE_PLAYERS.__getitem__, codes)),
+            current_player=_CODE_PLAYERS[status & 0x3],
+            state=_CODE_STATES[status >> 2 & 0x3],
+            winner=_CODE_PLAYERS[status >> 4 & 0x3],
+            geometry=self.geometry,
+        )
+
+    def ply_at(self, buffer: Buffer, offset: int = 0) -> int:
+        """Read only the ply of the record at *offset*."""
+
+        ply: int
+        _status, ply = STATE_PREFIX.unpack_from(buffer, offset)
+        return ply
+
+    def encode(self, states: Iterable[ExampleState]) -> bytearray:
+        """Header plus one record per state."""
+
+        items = list(states)
+        buffer = bytearray(HEADER.size + self.record_size * len(items))
+        buffer[: HEADER.size] = self.header()
+        offset = HEADER.size
+        for state in items:
+            self.pack_into(buffer, offset, state)
+            offset += self.record_size
+        return buffer
+
+    def decode(self, buffer: Buffer) -> Iterator[ExampleState]:
+        """Iterate the records that follow a header written by `encode`."""
+
+        view = memoryview(buffer)
+        end = len(view) - (len(view) - HEADER.size) % self.record_size
+        for offset in range(HEADER.size, end, self.record_size):
+            yield self.unpack_from(view, offset)
+
+
+def encode_state(state: ExampleState) -> bytes:
+    """Self-describing encoding of a single snapshot."""
+
+    return bytes(StateCodec(state.geometry).encode([state]))
+
+
+def decode_state(payload: Buffer) -> ExampleState:
+    return StateCodec.from_header(payload).unpack_from(payload, HEADER.size)
+
+
+def decode_states(payload: Buffer) -> Iterator[ExampleState]:
+    return StateCodec.from_header(payload).decode(payload)
+
+
+def encode_actions(
+    actions: Iterable[ExampleAction], geometry: BoardGeometry = STANDARD_GEOMETRY
+) -> bytearray:
+    """Header plus one `ACTION_RECORD` per ``grid.select`` action."""
+
+    items = list(actions)
+    buffer = bytearray(HEADER.size + ACTION_RECORD.size * len(items))
+    buffer[: HEADER.size] = _header(ACTION_MAGIC, geometry)
+    offset = HEADER.size
+    for action in items:
+        if action.name != "grid.select":
+            raise ValueError(f"Cannot encode action {action.name!r}.")
+        payload = action.payload or {}
+        position = payload.get("position")
+        if not isinstance(position, int) or not geometry.contains(position):
+            raise ValueError(f"Illegal position {position!r}.")
+        actor = _ACTOR_CODES.get(payload.get("actor"))
+        if actor is None:
+            raise ValueError(f"Unknown actor {payload.get('actor')!r}.")
+        ACTION_RECORD.pack_into(buffer, offset, SELECT_KIND, actor, position)
+        offset += ACTION_RECORD.size
+    return buffer
+
+
+def decode_actions(payload: Buffer) -> Tuple[BoardGeometry, Tuple[ExampleAction, ...]]:
+    geometry = _read_header(payload, 0, ACTION_MAGIC)
+    body = memoryview(payload)[HEADER.size :]
+    actions = []
+    for kind, actor, position in ACTION_RECORD.iter_unpack(body):
+        if kind != SELECT_KIND:
+            raise ValueError(f"Unknown action kind {kind}.")
+        if actor >= len(_CODE_ACTORS):
+            raise ValueError(f"Unknown actor code {actor}.")
+        name = _CODE_ACTORS[actor]
+        data = (
+            {"position": position}
+            if name is None
+            else {
+                "position": position,
+                "actor": name,
+            }
+        )
+        actions.append(ExampleAction(name="grid.select", payload=data))
+    return geometry, tuple(actions)
+
+
+def _header(magic: bytes, geometry: BoardGeometry) -> bytes:
+    return HEADER.pack(
+        magic, CODEC_VERSION, geometry.width, geometry.height, geometry.k
+    )
+
+
+def _read_header(buffer: Buffer, offset: int, magic: bytes) -> BoardGeometry:
+    found, version, width, height, k = HEADER.unpack_from(buffer, offset)
+    if found != magic:
+        raise ValueError("Not a tictactoe binary stream of the expected kind.")
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported codec version {version}.")
+    return BoardGeometry(width, height, k)
+
+
+__all__ = [
+    "ACTION_RECORD",
+    "CODEC_VERSION",
+    "HEADER",
+    "StateCodec",
+    "decode_actions",
+    "decode_state",
+    "decode_states",
+    "encode_actions",
+    "encode_state",
+]
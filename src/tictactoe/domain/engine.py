@@ -0,0 +1,61 @@
+"""Move handling shared by the concrete grid engines."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from tictactoe import tracing
+
+from .logic import ExampleAction, ExampleState, GameState, Player, TicTacToe
+
+WIN_STATES = {
+    Player.PRIMARY: GameState.X_WON,
+    Player.SECONDARY: GameState.O_WON,
+}
+
+
+class GridEngine(TicTacToe):
+    """Routes ``grid.select`` actions and `make_move` into `_apply_move`.
+
+    Subclasses provide `is_legal` and `_apply_move`, which places the current
+    player's token on a legal cell and ends with `_state_changed`.
+    """
+
+    def is_legal(self, position: int) -> bool:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def dispatch_action(self, action: ExampleAction) -> ExampleState:
+        """Apply ``grid.select`` actions; other names are rejected."""
+
+        if action.name != "grid.select":
+            raise ValueError(f"Unsupported action {action.name!r}")
+        payload = action.payload or {}
+        position = payload.get("position")
+        if not isinstance(position, int) or not self.is_legal(position):
+            raise ValueError(f"Illegal move {position!r}")
+        if tracing.ENABLED:
+            with tracing.span("dispatch_action", "domain", position=position):
+                self._apply_move(position, action)
+        else:
+            self._apply_move(position, action)
+        return self.snapshot
+
+    def make_move(self, position: int) -> bool:
+        """Claim *position* for the current player; False when illegal."""
+
+        if not self.is_legal(position):
+            return False
+        if tracing.ENABLED:
+            with tracing.span("make_move", "domain", position=position):
+                self._apply_move(position)
+        else:
+            self._apply_move(position)
+        return True
+
+    def _apply_move(
+        self, position: int, action: Optional[ExampleAction] = None
+    ) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+__all__ = ["GridEngine", "WIN_STATES"]
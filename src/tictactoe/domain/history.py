@@ -0,0 +1,262 @@
+"""Bounded undo/redo history built from `StateDelta` records."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Optional
+
+from .logic import (
+    RESET_ACTION,
+    BoardTuple,
+    CellChange,
+    ExampleAction,
+    GameState,
+    Player,
+    StateDelta,
+    TicTacToe,
+)
+
+UNDO_ACTION = ExampleAction(name="history.undo")
+REDO_ACTION = ExampleAction(name="history.redo")
+SEEK_ACTION = ExampleAction(name="history.seek")
+
+_WINNERS = {
+    GameState.X_WON: Player.PRIMARY,
+    GameState.O_WON: Player.SECONDARY,
+}
+
+
+@dataclass(frozen=True)
+class Keyframe:
+    """Full position captured every `keyframe_interval` plies."""
+
+    ply: int
+    board: BoardTuple
+    state: GameState
+    current_player: Optional[Player]
+    winner: Optional[Player]
+
+    @classmethod
+    def capture(cls, game: TicTacToe, ply: int) -> Keyframe:
+        """Record *game*'s current position as the keyframe for *ply*."""
+
+        return cls(
+            ply=ply,
+            board=game.board,
+            state=game.state,
+            current_player=game.current_player,
+            winner=game.get_winner(),
+        )
+
+    def restore(self, game: TicTacToe, action: ExampleAction) -> None:
+        """Overwrite *game* with this position, touching only differing cells."""
+
+        game._overwrite(
+            [
+                CellChange(position, before, after)
+                for position, (before, after) in enumerate(zip(game.board, self.board))
+                if before is not after
+            ],
+            state=self.state,
+            current_player=self.current_player,
+            winner=self.winner,
+            action=action,
+        )
+
+
+class GameHistory:
+    """Ring buffer of per-move deltas plus periodic keyframes.
+
+    Only the cells a move touched are stored, and the `CellChange` objects are
+    shared with any other delta consumer, so a long game on a large board
+    costs O(moves) rather than O(moves * cells). At most *capacity* deltas are
+    retained; older plies fall off the front together with their keyframes.
+    Undo and redo cost O(delta); `jump_to` starts from the nearest keyframe
+    when that is closer than stepping from the current ply.
+
+    Create instances through `TicTacToe.enable_history`.
+    """
+
+    def __init__(
+        self, game: TicTacToe, *, capacity: int = 256, keyframe_interval: int = 16
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1.")
+        if keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be at least 1.")
+        self._game = game
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        self._deltas: Deque[StateDelta] = deque()
+        self._keyframes: Dict[int, Keyframe] = {}
+        self._base_ply = 0
+        self._cursor = 0
+        self._replaying = False
+        self._capture_keyframe()
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    @property
+    def ply(self) -> int:
+        """Number of moves applied since the last reset."""
+
+        return self._cursor
+
+    @property
+    def oldest_ply(self) -> int:
+        """Earliest ply that can still be restored."""
+
+        return self._base_ply
+
+    @property
+    def newest_ply(self) -> int:
+        """Latest ply that can be restored (redo limit)."""
+
+        return self._base_ply + len(self._deltas)
+
+    @property
+    def keyframe_count(self) -> int:
+        return len(self._keyframes)
+
+    def can_undo(self) -> bool:
+        return self._cursor > self._base_ply
+
+    def can_redo(self) -> bool:
+        return self._cursor < self.newest_ply
+
+    def record(self, delta: StateDelta) -> None:
+        """Delta sink registered on the game; not meant to be called directly."""
+
+        if self._replaying:
+            return
+        if delta.action is RESET_ACTION:
+            self._deltas.clear()
+            self._keyframes.clear()
+            self._base_ply = self._cursor = 0
+            self._capture_keyframe()
+            return
+
+        # A new move discards the redo branch.
+        while self.newest_ply > self._cursor:
+            self._deltas.pop()
+            self._keyframes.pop(self.newest_ply + 1, None)
+        self._deltas.append(delta)
+        self._cursor += 1
+        if len(self._deltas) > self.capacity:
+            self._deltas.popleft()
+            self._keyframes.pop(self._base_ply, None)
+            self._base_ply += 1
+        if self._cursor % self.keyframe_interval == 0:
+            self._capture_keyframe()
+
+    def undo(self) -> bool:
+        """Step back one ply; False when nothing is left to undo."""
+
+        if not self.can_undo():
+            return False
+        with self._game.transaction():
+            self._step_back()
+        return True
+
+    def redo(self) -> bool:
+        """Re-apply the next undone ply; False when at the newest ply."""
+
+        if not self.can_redo():
+            return False
+        with self._game.transaction():
+            self._step_forward()
+        return True
+
+    def jump_to(self, ply: int) -> None:
+        """Restore *ply* with a single listener notification."""
+
+        if not self.oldest_ply <= ply <= self.newest_ply:
+            raise ValueError(
+                f"Ply {ply} is outside the retained range "
+                f"{self.oldest_ply}..{self.newest_ply}."
+            )
+        if ply == self._cursor:
+            return
+        with self._game.transaction():
+            keyframe = self._nearest_keyframe(ply)
+            if keyframe is not None and ply - keyframe.ply < abs(ply - self._cursor):
+                self._load_keyframe(keyframe)
+            while self._cursor > ply:
+                self._step_back()
+            while self._cursor < ply:
+                self._step_forward()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _delta_at(self, ply: int) -> StateDelta:
+        """Delta that produced *ply* from ``ply - 1``."""
+
+        return self._deltas[ply - self._base_ply - 1]
+
+    def _step_back(self) -> None:
+        delta = self._delta_at(self._cursor)
+        self._apply(
+            [
+                CellChange(change.position, change.current, change.previous)
+                for change in reversed(delta.cells)
+            ],
+            state=delta.previous_state,
+            current_player=delta.previous_player,
+            winner=_WINNERS.get(delta.previous_state),
+            action=UNDO_ACTION,
+        )
+        self._cursor -= 1
+
+    def _step_forward(self) -> None:
+        delta = self._delta_at(self._cursor + 1)
+        self._apply(
+            delta.cells,
+            state=delta.state,
+            current_player=delta.current_player,
+            winner=delta.winner,
+            action=REDO_ACTION,
+        )
+        self._cursor += 1
+
+    def _apply(self, changes: Iterable[CellChange], **status: Any) -> None:
+        self._replaying = True
+        try:
+            self._game._overwrite(changes, **status)
+        finally:
+            self._replaying = False
+
+    def _nearest_keyframe(self, ply: int) -> Optional[Keyframe]:
+        candidate = ply - ply % self.keyframe_interval
+        while candidate >= self._base_ply:
+            keyframe = self._keyframes.get(candidate)
+            if keyframe is not None:
+                return keyframe
+            candidate -= self.keyframe_interval
+        return None
+
+    def _load_keyframe(self, keyframe: Keyframe) -> None:
+        self._replaying = True
+        try:
+            # The offset lets other recorders (e.g. `ActionLog`) follow along.
+            keyframe.restore(
+                self._game,
+                ExampleAction(
+                    name=SEEK_ACTION.name,
+                    payload={
+                        "ply": keyframe.ply,
+                        "offset": keyframe.ply - self._cursor,
+                    },
+                ),
+            )
+        finally:
+            self._replaying = False
+        self._cursor = keyframe.ply
+
+    def _capture_keyframe(self) -> None:
+        self._keyframes[self._cursor] = Keyframe.capture(self._game, self._cursor)
+
+
+__all__ = ["GameHistory", "Keyframe", "REDO_ACTION", "SEEK_ACTION", "UNDO_ACTION"]
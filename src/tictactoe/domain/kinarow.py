@@ -0,0 +1,120 @@
+"""Generalized width x height, k-in-a-row engine with incremental win checks."""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple, cast
+
+from .engine import WIN_STATES, GridEngine
+from .logic import (
+    RESET_ACTION,
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    ExampleAction,
+    GameState,
+    Player,
+)
+
+
+class KInARowGame(GridEngine):
+    """Plays any `BoardGeometry`, e.g. 15x15 or 19x19 five-in-a-row.
+
+    Each player keeps one run counter per *k*-cell window. A move bumps the
+    counters of the windows through that cell only (at most ``4 * k``), so the
+    win check costs the same on a 3x3 board as on a 19x19 one.
+    """
+
+    def __init__(self, geometry: BoardGeometry = STANDARD_GEOMETRY) -> None:
+        self._filled = 0
+        self._counts: dict[Player, list[int]] = {}
+        self._cell_lines = geometry.cell_lines
+        self._k = geometry.k
+        super().__init__(geometry=geometry)
+        self._notes = ()
+
+    def line_count(self, player: Player, line: int) -> int:
+        """Return how many cells *player* holds in window *line*."""
+
+        return self._counts[player][line]
+
+    def legal_moves(self) -> Tuple[int, ...]:
+        """Return the empty cells while the game is still in progress."""
+
+        if self.state is not GameState.PLAYING:
+            return ()
+        return tuple(
+            position for position, cell in enumerate(self._board) if cell is None
+        )
+
+    def is_legal(self, position: int) -> bool:
+        """Return True when *position* can be claimed by the current player."""
+
+        if self.state is not GameState.PLAYING:
+            return False
+        if not self._geometry.contains(position):
+            return False
+        return self._board[position] is None
+
+    def reset(self) -> None:
+        """Clear the board and counters and hand the move to the primary actor."""
+
+        self._record_board_cleared()
+        line_total = len(self._geometry.lines)
+        self._board = [None] * self._board_size
+        self._filled = 0
+        self._counts = {
+            Player.PRIMARY: [0] * line_total,
+            Player.SECONDARY: [0] * line_total,
+        }
+        self.current_player = Player.PRIMARY
+        self.state = GameState.PLAYING
+        self._winner = None
+        self._state_changed(RESET_ACTION)
+
+    def _write_cell(self, position: int, value: Optional[Player]) -> None:
+        previous = self._board[position]
+        if previous is value:
+            return
+        lines = self._cell_lines[position]
+        if previous is not None:
+            counts = self._counts[previous]
+            for line in lines:
+                counts[line] -= 1
+            self._filled -= 1
+        if value is not None:
+            counts = self._counts[value]
+            for line in lines:
+                counts[line] += 1
+            self._filled += 1
+        self._board[position] = value
+
+    def _apply_move(
+        self, position: int, action: Optional[ExampleAction] = None
+    ) -> None:
+        player = cast(Player, self.current_player)
+        self._board[position] = player
+        self._record_cell(position, None, player)
+        self._filled += 1
+
+        counts = self._counts[player]
+        k = self._k
+        won = False
+        for line in self._cell_lines[position]:
+            counts[line] += 1
+            if counts[line] == k:
+                won = True
+
+        if won:
+            self.state = WIN_STATES[player]
+            self._winner = player
+            self.current_player = None
+        elif self._filled == self._board_size:
+            self.state = GameState.DRAW
+            self.current_player = None
+        else:
+            self.current_player = (
+                Player.SECONDARY if player is Player.PRIMARY else Player.PRIMARY
+            )
+        self._state_changed(action)
+
+
+__all__ = ["KInARowGame"]
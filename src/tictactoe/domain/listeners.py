@@ -0,0 +1,152 @@
+"""Per-listener timing for `TicTacToe` change notifications.
+
+`TicTacToe.enable_listener_monitoring` installs a `ListenerMonitor` that
+times every listener call and keeps cumulative `ListenerStats`. A call that
+takes longer than *slow_threshold* seconds is reported through *on_slow*;
+with ``offload=True`` that listener then receives later snapshots on a
+single background thread (so delivery order is kept) instead of blocking
+the mutation path. Only offload listeners that are safe to run off the
+caller's thread — Tk widgets, for instance, are not. Stats for a listener
+are dropped when it is removed from the game.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from tictactoe.tracing import callable_name
+
+Listener = Callable[[Any], None]
+
+_logger = logging.getLogger("tictactoe.domain")
+
+
+@dataclass
+class ListenerStats:
+    """Cumulative timing for one listener."""
+
+    name: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_calls: int = 0
+    offloaded: bool = False
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+SlowListenerHook = Callable[[ListenerStats, float], None]
+
+
+class ListenerMonitor:
+    """Times listener calls and moves slow ones off the notifying thread."""
+
+    def __init__(
+        self,
+        *,
+        slow_threshold: Optional[float] = None,
+        on_slow: Optional[SlowListenerHook] = None,
+        offload: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if slow_threshold is not None and slow_threshold < 0:
+            raise ValueError("slow_threshold must not be negative.")
+        if offload and slow_threshold is None:
+            raise ValueError("offload requires a slow_threshold.")
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow
+        self.offload = offload
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+        self._stats: Dict[Listener, ListenerStats] = {}
+
+    def stats(self) -> List[ListenerStats]:
+        """Snapshot of every listener's stats, slowest (by total) first."""
+
+        with self._lock:
+            return sorted(
+                (ListenerStats(**vars(stats)) for stats in self._stats.values()),
+                key=lambda stats: stats.total_seconds,
+                reverse=True,
+            )
+
+    def stats_for(self, listener: Listener) -> Optional[ListenerStats]:
+        with self._lock:
+            stats = self._stats.get(listener)
+            return None if stats is None else ListenerStats(**vars(stats))
+
+    def forget(self, listener: Listener) -> None:
+        """Drop the stats kept for *listener*."""
+
+        with self._lock:
+            self._stats.pop(listener, None)
+
+    def call(self, listener: Listener, snapshot: Any) -> None:
+        """Run *listener* (inline or offloaded) and record its timing."""
+
+        with self._lock:
+            stats = self._stats.get(listener)
+            if stats is None:
+                stats = self._stats[listener] = ListenerStats(callable_name(listener))
+            offloaded = stats.offloaded
+        if offloaded:
+            self._submit(self._run_offloaded, listener, stats, snapshot)
+            return
+        started = time.perf_counter()
+        try:
+            listener(snapshot)
+        finally:
+            self._record(stats, time.perf_counter() - started)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the background executor (if this monitor created it)."""
+
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _run_offloaded(
+        self, listener: Listener, stats: ListenerStats, snapshot: Any
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            listener(snapshot)
+        except Exception:
+            # Nobody is left to raise to on the worker thread.
+            _logger.exception("Offloaded listener %s raised", stats.name)
+        self._record(stats, time.perf_counter() - started)
+
+    def _record(self, stats: ListenerStats, elapsed: float) -> None:
+        with self._lock:
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            if elapsed > stats.max_seconds:
+                stats.max_seconds = elapsed
+            threshold = self.slow_threshold
+            slow = threshold is not None and elapsed > threshold
+            if not slow:
+                return
+            stats.slow_calls += 1
+            if self.offload:
+                stats.offloaded = True
+            report = ListenerStats(**vars(stats))
+        if self.on_slow is not None:
+            self.on_slow(report, elapsed)
+
+    def _submit(self, *args: Any) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tictactoe-listeners"
+            )
+        self._executor.submit(*args)
+
+
+__all__ = ["ListenerMonitor", "ListenerStats", "SlowListenerHook"]
@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Mapping, Optional, Tuple
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from tictactoe import tracing
+
+if TYPE_CHECKING:
+    from .history import GameHistory
+    from .listeners import ListenerMonitor, SlowListenerHook
 
 
 class ExampleActor(Enum):
@@ -17,6 +37,8 @@ class ExampleActor(Enum):
 # Backwards compatibility for older imports that still expect `Player`.
 Player = ExampleActor
 
+_PLAYER_INDEX = {Player.PRIMARY: 0, Player.SECONDARY: 1}
+
 
 class GameState(Enum):
     """High-level lifecycle markers rendered by the default UI."""
@@ -29,6 +51,194 @@ class GameState(Enum):
 
 BoardTuple = Tuple[Optional[Player], ...]
 
+_LINE_DIRECTIONS: tuple[tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def _line_windows(width: int, height: int, k: int) -> tuple[tuple[int, ...], ...]:
+    windows: list[tuple[int, ...]] = []
+    for row in range(height):
+        for column in range(width):
+            for d_row, d_column in _LINE_DIRECTIONS:
+                end_row = row + d_row * (k - 1)
+                end_column = column + d_column * (k - 1)
+                if not (0 <= end_row < height and 0 <= end_column < width):
+                    continue
+                windows.append(
+                    tuple(
+                        (row + d_row * step) * width + column + d_column * step
+                        for step in range(k)
+                    )
+                )
+    return tuple(windows)
+
+
+@lru_cache(maxsize=None)
+def _cell_windows(width: int, height: int, k: int) -> tuple[tuple[int, ...], ...]:
+    by_cell: list[list[int]] = [[] for _ in range(width * height)]
+    for index, window in enumerate(_line_windows(width, height, k)):
+        for cell in window:
+            by_cell[cell].append(index)
+    return tuple(tuple(indices) for indices in by_cell)
+
+
+@lru_cache(maxsize=None)
+def _symmetries(width: int, height: int) -> tuple[tuple[int, ...], ...]:
+    last_row, last_column = height - 1, width - 1
+    transforms: list[Callable[[int, int], tuple[int, int]]] = [
+        lambda row, column: (row, column),
+        lambda row, column: (row, last_column - column),
+        lambda row, column: (last_row - row, column),
+        lambda row, column: (last_row - row, last_column - column),
+    ]
+    if width == height:
+        transforms += [
+            lambda row, column: (column, row),
+            lambda row, column: (column, last_row - row),
+            lambda row, column: (last_column - column, row),
+            lambda row, column: (last_column - column, last_row - row),
+        ]
+    permutations: list[tuple[int, ...]] = []
+    for transform in transforms:
+        mapping: list[int] = []
+        for position in range(width * height):
+            row, column = transform(*divmod(position, width))
+            mapping.append(row * width + column)
+        permutations.append(tuple(mapping))
+    return tuple(permutations)
+
+
+@lru_cache(maxsize=None)
+def _zobrist_keys(width: int, height: int) -> tuple[tuple[int, int], ...]:
+    # String seeds are hashed with SHA-512, so keys are stable across runs and
+    # processes and can be stored in game databases.
+    rng = random.Random(f"tictactoe-zobrist-{width}x{height}")
+    return tuple(
+        (rng.getrandbits(64), rng.getrandbits(64)) for _ in range(width * height)
+    )
+
+
+@lru_cache(maxsize=None)
+def _zobrist_symmetry_keys(
+    width: int, height: int
+) -> tuple[tuple[tuple[int, ...], tuple[int, ...]], ...]:
+    """Per cell and player, the key of that cell under every symmetry."""
+
+    keys = _zobrist_keys(width, height)
+    permutations = _symmetries(width, height)
+    return tuple(
+        (
+            tuple(keys[permutation[cell]][0] for permutation in permutations),
+            tuple(keys[permutation[cell]][1] for permutation in permutations),
+        )
+        for cell in range(width * height)
+    )
+
+
+@dataclass(frozen=True)
+class BoardGeometry:
+    """Width, height, and win length (*k*) of a rectangular board.
+
+    Derived line tables are cached per geometry, so every engine, view, and
+    tool that shares a geometry also shares those immutable tables.
+    """
+
+    width: int = 3
+    height: int = 3
+    k: int = 3
+
+    def __post_init__(self) -> None:
+        if self.width < 1 or self.height < 1:
+            raise ValueError("Board dimensions must be positive.")
+        if self.k < 1 or self.k > max(self.width, self.height):
+            raise ValueError("Win length must fit on the board.")
+
+    @classmethod
+    def for_cells(cls, cells: int) -> BoardGeometry:
+        """Best-effort geometry for legacy ``board_size`` cell counts."""
+
+        side = math.isqrt(cells)
+        if side * side == cells:
+            return cls(side, side, min(3, side))
+        return cls(cells, 1, min(3, cells))
+
+    @classmethod
+    def parse(cls, text: str, k: int = 3) -> BoardGeometry:
+        """Parse ``"WIDTHxHEIGHT"`` labels such as ``"15x15"``."""
+
+        width, sep, height = text.strip().lower().partition("x")
+        if not sep:
+            raise ValueError(f"Board size must look like 3x3, got {text!r}.")
+        return cls(int(width), int(height), k)
+
+    @property
+    def cells(self) -> int:
+        return self.width * self.height
+
+    @property
+    def label(self) -> str:
+        return f"{self.width}x{self.height}"
+
+    @property
+    def lines(self) -> tuple[tuple[int, ...], ...]:
+        """Every horizontal, vertical, and diagonal window of *k* cells."""
+
+        return _line_windows(self.width, self.height, self.k)
+
+    @property
+    def cell_lines(self) -> tuple[tuple[int, ...], ...]:
+        """Indices into `lines` for the windows passing through each cell."""
+
+        return _cell_windows(self.width, self.height, self.k)
+
+    @property
+    def symmetries(self) -> tuple[tuple[int, ...], ...]:
+        """Cell permutations that preserve the rules, identity first.
+
+        Square boards have the eight rotations/reflections; rectangular boards
+        keep the four that do not swap width and height.
+        """
+
+        return _symmetries(self.width, self.height)
+
+    @property
+    def zobrist_keys(self) -> tuple[tuple[int, int], ...]:
+        """Deterministic 64-bit ``(primary, secondary)`` key per cell."""
+
+        return _zobrist_keys(self.width, self.height)
+
+    def zobrist_hash(self, board: Iterable[Optional[Player]]) -> int:
+        """Hash *board* from scratch; engines maintain it incrementally."""
+
+        return self._hash_cells(tuple(board), self.symmetries[0])
+
+    def symmetric_hash(self, board: Iterable[Optional[Player]]) -> int:
+        """Hash shared by every rotation/reflection of *board*."""
+
+        cells = tuple(board)
+        return min(
+            self._hash_cells(cells, permutation) for permutation in self.symmetries
+        )
+
+    def _hash_cells(
+        self, cells: Sequence[Optional[Player]], permutation: Sequence[int]
+    ) -> int:
+        keys = self.zobrist_keys
+        value = 0
+        for position, cell in enumerate(cells):
+            if cell is not None:
+                value ^= keys[permutation[position]][_PLAYER_INDEX[cell]]
+        return value
+
+    def row_column(self, position: int) -> tuple[int, int]:
+        return divmod(position, self.width)
+
+    def contains(self, position: int) -> bool:
+        return 0 <= position < self.cells
+
+
+STANDARD_GEOMETRY = BoardGeometry()
+
 
 @dataclass(frozen=True)
 class ExampleAction:
@@ -47,12 +257,123 @@ class ExampleState:
     state: GameState
     winner: Optional[Player]
     notes: tuple[str, ...] = ()
+    geometry: BoardGeometry = STANDARD_GEOMETRY
+    # Monotonic per-game counter; 0 marks snapshots built outside an engine.
+    # Bookkeeping only, so it does not take part in equality.
+    version: int = field(default=0, compare=False)
+    # 64-bit Zobrist keys of the board (0 outside engines, like `version`);
+    # see `BoardGeometry.zobrist_hash`. Derived from the board, so they stay
+    # out of equality as well.
+    zobrist_hash: int = field(default=0, compare=False)
+    symmetric_hash: int = field(default=0, compare=False)
 
 
 # Alias retained so the existing view/controller contracts remain unchanged.
 GameSnapshot = ExampleState
 
 
+@dataclass(frozen=True)
+class CellChange:
+    """One cell that a mutation overwrote."""
+
+    position: int
+    previous: Optional[Player]
+    current: Optional[Player]
+
+
+@dataclass(frozen=True)
+class StateDelta:
+    """What a single mutation changed, from `previous_*` to the new values."""
+
+    version: int
+    action: Optional[ExampleAction]
+    cells: tuple[CellChange, ...]
+    previous_state: GameState
+    state: GameState
+    previous_player: Optional[Player]
+    current_player: Optional[Player]
+    winner: Optional[Player]
+    # Number of mutations folded in by `merge`; the delta applies on top of
+    # `base_version`.
+    span: int = 1
+
+    @property
+    def base_version(self) -> int:
+        return self.version - self.span
+
+    @property
+    def status_changed(self) -> bool:
+        return (
+            self.state is not self.previous_state
+            or self.current_player is not self.previous_player
+        )
+
+    @classmethod
+    def merge(cls, deltas: Sequence[StateDelta]) -> StateDelta:
+        """Fold consecutive deltas into one; cells that ended unchanged drop out.
+
+        The merged delta keeps the first previous value of every cell and
+        status field and the last current one. Its `action` is only kept when
+        a single delta is merged.
+        """
+
+        if len(deltas) == 1:
+            return deltas[0]
+        first, last = deltas[0], deltas[-1]
+        cells: dict[int, CellChange] = {}
+        for delta in deltas:
+            for change in delta.cells:
+                earlier = cells.get(change.position)
+                if earlier is not None:
+                    change = CellChange(
+                        change.position, earlier.previous, change.current
+                    )
+                cells[change.position] = change
+        return cls(
+            version=last.version,
+            action=None,
+            cells=tuple(
+                change
+                for change in cells.values()
+                if change.previous is not change.current
+            ),
+            previous_state=first.previous_state,
+            state=last.state,
+            previous_player=first.previous_player,
+            current_player=last.current_player,
+            winner=last.winner,
+            span=sum(delta.span for delta in deltas),
+        )
+
+
+@dataclass
+class GameTransaction:
+    """Handle yielded by `TicTacToe.transaction`.
+
+    `deltas` fills up while the transaction runs when *collect_deltas* was
+    requested; `snapshot` is set once the transaction commits.
+    """
+
+    collect_deltas: bool = False
+    deltas: list[StateDelta] = field(default_factory=list)
+    snapshot: Optional[ExampleState] = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of `TicTacToe.dispatch_actions`."""
+
+    snapshot: ExampleState
+    deltas: tuple[StateDelta, ...] = ()
+
+
+BatchListener = Callable[[ExampleState, Tuple[StateDelta, ...]], None]
+DeltaListener = Callable[[StateDelta], None]
+
+# Attached to the delta that `TicTacToe.reset` produces.
+RESET_ACTION = ExampleAction(name="game.reset")
+
+
 PLACEHOLDER_NOTES: tuple[str, ...] = (
     "TODO: Replace ExampleState with your domain-specific data.",
     "TODO: Implement TicTacToe.dispatch_action to mutate that state.",
@@ -62,14 +383,41 @@ PLACEHOLDER_NOTES: tuple[str, ...] = (
 class TicTacToe:
     """Template-friendly shell that adopters replace with real business rules."""
 
-    def __init__(self, board_size: int = 9):
+    def __init__(
+        self, board_size: int = 9, *, geometry: Optional[BoardGeometry] = None
+    ):
         self._listeners: list[Callable[[ExampleState], None]] = []
-        self._board_size = board_size
-        self._board: list[Optional[Player]] = [None for _ in range(board_size)]
+        self._batch_listeners: list[BatchListener] = []
+        self._delta_listeners: list[DeltaListener] = []
+        self._unannounced: list[StateDelta] = []
+        if geometry is None:
+            geometry = (
+                STANDARD_GEOMETRY
+                if board_size == STANDARD_GEOMETRY.cells
+                else BoardGeometry.for_cells(board_size)
+            )
+        self._geometry = geometry
+        self._board_size = geometry.cells
+        self._board: list[Optional[Player]] = [None for _ in range(self._board_size)]
         self.current_player: Optional[Player] = None
         self.state: GameState = GameState.PLAYING
         self._winner: Optional[Player] = None
         self._notes: tuple[str, ...] = PLACEHOLDER_NOTES
+        self._version = 0
+        self._board_cache: Optional[BoardTuple] = None
+        self._snapshot_cache: Optional[ExampleState] = None
+        self._previous_state: GameState = self.state
+        self._previous_player: Optional[Player] = self.current_player
+        self._pending_cells: list[CellChange] = []
+        self._zobrist_cells = _zobrist_symmetry_keys(geometry.width, geometry.height)
+        # Board hash under each symmetry; index 0 is the identity.
+        self._hashes = [0] * len(geometry.symmetries)
+        self._delta_sinks: list[Callable[[StateDelta], None]] = []
+        self._history: Optional[GameHistory] = None
+        self._listener_monitor: Optional[ListenerMonitor] = None
+        self._track_deltas = False
+        self._batch_depth = 0
+        self._batch_dirty = False
         self.reset()
 
     def add_listener(self, listener: Callable[[ExampleState], None]) -> None:
@@ -82,24 +430,109 @@ class TicTacToe:
 
         if listener in self._listeners:
             self._listeners.remove(listener)
+            self._forget_listener(listener)
+
+    def add_delta_listener(self, listener: DeltaListener) -> None:
+        """Register a callback that receives a `StateDelta` per notification.
+
+        Delta listeners fire right after the snapshot listeners. Inside a
+        transaction they get one merged delta at commit, so the work they
+        do scales with the cells that changed rather than the board size.
+        """
+
+        if not self._delta_listeners:
+            self._attach_delta_sink(self._queue_delta)
+        self._delta_listeners.append(listener)
+
+    def remove_delta_listener(self, listener: DeltaListener) -> None:
+        """Remove a previously registered delta listener."""
+
+        if listener in self._delta_listeners:
+            self._delta_listeners.remove(listener)
+            self._forget_listener(listener)
+            if not self._delta_listeners:
+                self._detach_delta_sink(self._queue_delta)
+                self._unannounced.clear()
+
+    def add_batch_listener(self, listener: BatchListener) -> None:
+        """Register a callback run once per committed transaction.
+
+        Only the outermost transaction counts, and only if it changed
+        something; listeners run after the snapshot listeners. It receives
+        the final snapshot and the deltas collected by the transaction (empty
+        unless it was opened with ``collect_deltas``).
+        """
+
+        self._batch_listeners.append(listener)
+
+    def remove_batch_listener(self, listener: BatchListener) -> None:
+        """Remove a previously registered batch listener."""
+
+        if listener in self._batch_listeners:
+            self._batch_listeners.remove(listener)
+
+    @property
+    def geometry(self) -> BoardGeometry:
+        """Board dimensions and win length shared with views and tooling."""
+
+        return self._geometry
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every mutation; mirrored on `ExampleState`."""
+
+        return self._version
+
+    @property
+    def notes(self) -> tuple[str, ...]:
+        """Notes mirrored on `ExampleState`."""
+
+        return self._notes
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the board, updated on every cell write."""
+
+        return self._hashes[0]
+
+    @property
+    def symmetric_hash(self) -> int:
+        """Zobrist hash shared by all rotations/reflections of the board."""
+
+        return min(self._hashes)
 
     @property
     def board(self) -> BoardTuple:
-        """Expose an immutable view of the board placeholders."""
+        """Expose an immutable view of the board placeholders.
+
+        The tuple is cached until the next mutation.
+        """
 
-        return tuple(self._board)
+        if self._board_cache is None:
+            self._board_cache = tuple(self._board)
+        return self._board_cache
 
     @property
     def snapshot(self) -> ExampleState:
-        """Summarize the state that will eventually drive the UI."""
+        """Summarize the state that will eventually drive the UI.
 
-        return ExampleState(
-            board=self.board,
-            current_player=self.current_player,
-            state=self.state,
-            winner=self._winner,
-            notes=self._notes,
-        )
+        Snapshots are immutable, so the same instance is returned until the
+        next mutation bumps `version`.
+        """
+
+        if self._snapshot_cache is None:
+            self._snapshot_cache = ExampleState(
+                board=self.board,
+                current_player=self.current_player,
+                state=self.state,
+                winner=self._winner,
+                notes=self._notes,
+                geometry=self._geometry,
+                version=self._version,
+                zobrist_hash=self._hashes[0],
+                symmetric_hash=min(self._hashes),
+            )
+        return self._snapshot_cache
 
     def dispatch_action(self, action: ExampleAction) -> ExampleState:
         """Entry point adopters override with their business rules.
@@ -112,6 +545,48 @@ class TicTacToe:
             "TODO: Wire dispatch_action to your application's domain logic."
         )
 
+    def dispatch_actions(
+        self, actions: Iterable[ExampleAction], *, collect_deltas: bool = False
+    ) -> BatchResult:
+        """Apply *actions* in order and notify listeners once at the end.
+
+        With *collect_deltas* the per-action `StateDelta` records are returned
+        and handed to batch listeners alongside the final snapshot.
+        """
+
+        with self.transaction(collect_deltas=collect_deltas) as batch:
+            for action in actions:
+                self.dispatch_action(action)
+        return BatchResult(snapshot=self.snapshot, deltas=tuple(batch.deltas))
+
+    @contextmanager
+    def transaction(self, *, collect_deltas: bool = False) -> Iterator[GameTransaction]:
+        """Coalesce listener notifications for every mutation in the block.
+
+        Transactions nest; listeners fire once when the outermost one exits,
+        and only if something changed. Mutations applied before an exception
+        are kept and still announced.
+        """
+
+        batch = GameTransaction(collect_deltas=collect_deltas)
+        if collect_deltas:
+            self._attach_delta_sink(batch.deltas.append)
+        self._batch_depth += 1
+        try:
+            yield batch
+        finally:
+            self._batch_depth -= 1
+            if collect_deltas:
+                self._detach_delta_sink(batch.deltas.append)
+            batch.snapshot = self.snapshot
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._notify_listeners()
+                if self._batch_listeners:
+                    deltas = tuple(batch.deltas)
+                    for listener in list(self._batch_listeners):
+                        listener(batch.snapshot, deltas)
+
     def make_move(self, position: int) -> bool:
         """Legacy controller hook kept for backwards compatibility."""
 
@@ -128,23 +603,219 @@ class TicTacToe:
     def reset(self) -> None:
         """Return to the neutral placeholder state and notify observers."""
 
+        self._record_board_cleared()
         self._board = [None for _ in range(self._board_size)]
         self.current_player = None
         self.state = GameState.PLAYING
         self._winner = None
-        self._notify_listeners()
+        self._state_changed(RESET_ACTION)
+
+    @property
+    def history(self) -> Optional[GameHistory]:
+        """The attached `GameHistory`, if `enable_history` was called."""
+
+        return self._history
+
+    def enable_history(
+        self, *, capacity: int = 256, keyframe_interval: int = 16
+    ) -> GameHistory:
+        """Start recording undo/redo history (replacing any previous one)."""
+
+        from .history import GameHistory
+
+        if self._history is not None:
+            self._detach_delta_sink(self._history.record)
+        self._history = GameHistory(
+            self, capacity=capacity, keyframe_interval=keyframe_interval
+        )
+        self._attach_delta_sink(self._history.record)
+        return self._history
+
+    def disable_history(self) -> None:
+        """Stop recording history and drop everything recorded so far."""
+
+        if self._history is not None:
+            self._detach_delta_sink(self._history.record)
+            self._history = None
+
+    @property
+    def listener_monitor(self) -> Optional[ListenerMonitor]:
+        """The `ListenerMonitor` installed by `enable_listener_monitoring`."""
+
+        return self._listener_monitor
+
+    def enable_listener_monitoring(
+        self,
+        *,
+        slow_threshold: Optional[float] = None,
+        on_slow: Optional[SlowListenerHook] = None,
+        offload: bool = False,
+    ) -> ListenerMonitor:
+        """Time every listener call (replacing any previous monitor).
+
+        Calls slower than *slow_threshold* seconds are passed to *on_slow*;
+        with *offload* the listener is then notified from a background
+        thread. See `tictactoe.domain.listeners`.
+        """
+
+        from .listeners import ListenerMonitor
+
+        self.disable_listener_monitoring()
+        self._listener_monitor = ListenerMonitor(
+            slow_threshold=slow_threshold, on_slow=on_slow, offload=offload
+        )
+        return self._listener_monitor
+
+    def disable_listener_monitoring(self) -> None:
+        """Call listeners inline and untimed again."""
+
+        if self._listener_monitor is not None:
+            self._listener_monitor.shutdown(wait=False)
+            self._listener_monitor = None
 
     def get_winner(self) -> Optional[Player]:
         """Expose the winning token once custom rules set it."""
 
         return self._winner
 
-    def _notify_listeners(self) -> None:
-        """Notify all registered listeners of the latest snapshot."""
+    def _attach_delta_sink(self, sink: Callable[[StateDelta], None]) -> None:
+        self._delta_sinks.append(sink)
+        self._refresh_delta_tracking()
+
+    def _detach_delta_sink(self, sink: Callable[[StateDelta], None]) -> None:
+        if sink in self._delta_sinks:
+            self._delta_sinks.remove(sink)
+        self._refresh_delta_tracking()
+
+    def _write_cell(self, position: int, value: Optional[Player]) -> None:
+        """Low-level cell write used by history and replay.
 
-        if not self._listeners:
+        Engines override it to keep their indexes (bitboards, run counters)
+        in sync; status fields are restored separately by `_overwrite`.
+        """
+
+        self._board[position] = value
+
+    def _overwrite(
+        self,
+        changes: Iterable[CellChange],
+        *,
+        state: GameState,
+        current_player: Optional[Player],
+        winner: Optional[Player],
+        action: Optional[ExampleAction] = None,
+    ) -> None:
+        """Apply raw cell changes and a status as one mutation.
+
+        Bypasses the rules on purpose: history and replay use it to restore
+        positions that the rules already produced once.
+        """
+
+        for change in changes:
+            self._write_cell(change.position, change.current)
+            self._record_cell(change.position, change.previous, change.current)
+        self.state = state
+        self.current_player = current_player
+        self._winner = winner
+        self._state_changed(action)
+
+    def _record_cell(
+        self, position: int, previous: Optional[Player], current: Optional[Player]
+    ) -> None:
+        """Fold a cell overwrite into the hashes and the next `StateDelta`."""
+
+        keys = self._zobrist_cells[position]
+        hashes = self._hashes
+        for value in (previous, current):
+            if value is not None:
+                for index, key in enumerate(keys[_PLAYER_INDEX[value]]):
+                    hashes[index] ^= key
+        if self._track_deltas:
+            self._pending_cells.append(CellChange(position, previous, current))
+
+    def _record_board_cleared(self) -> None:
+        """Record every occupied cell as cleared; engines call it from reset."""
+
+        self._hashes = [0] * len(self._hashes)
+        if not self._track_deltas:
+            return
+        for position, cell in enumerate(self.board):
+            if cell is not None:
+                self._pending_cells.append(CellChange(position, cell, None))
+
+    def _refresh_delta_tracking(self) -> None:
+        self._track_deltas = bool(self._delta_sinks)
+        if not self._track_deltas:
+            self._pending_cells.clear()
+
+    def _state_changed(self, action: Optional[ExampleAction] = None) -> None:
+        """Bump the version, drop cached views, and notify listeners.
+
+        Engines call this once at the end of every mutation, after recording
+        overwritten cells through `_record_cell`.
+        """
+
+        self._version += 1
+        self._board_cache = None
+        self._snapshot_cache = None
+        if self._track_deltas:
+            self._publish_delta(action)
+        self._previous_state = self.state
+        self._previous_player = self.current_player
+        if self._batch_depth:
+            self._batch_dirty = True
             return
+        self._notify_listeners()
+
+    def _publish_delta(self, action: Optional[ExampleAction]) -> None:
+        delta = StateDelta(
+            version=self._version,
+            action=action,
+            cells=tuple(self._pending_cells),
+            previous_state=self._previous_state,
+            state=self.state,
+            previous_player=self._previous_player,
+            current_player=self.current_player,
+            winner=self._winner,
+        )
+        self._pending_cells.clear()
+        for sink in list(self._delta_sinks):
+            sink(delta)
+
+    def _queue_delta(self, delta: StateDelta) -> None:
+        self._unannounced.append(delta)
 
-        snapshot = self.snapshot
-        for listener in list(self._listeners):
-            listener(snapshot)
+    def _notify_listeners(self) -> None:
+        """Notify all registered listeners of the latest snapshot and delta."""
+
+        if self._listeners:
+            self._fan_out(list(self._listeners), self.snapshot)
+        if self._unannounced:
+            deltas = self._unannounced
+            self._unannounced = []
+            self._fan_out(list(self._delta_listeners), StateDelta.merge(deltas))
+
+    def _forget_listener(self, listener: Callable[[Any], None]) -> None:
+        monitor = self._listener_monitor
+        if monitor is None:
+            return
+        if listener not in self._listeners and listener not in self._delta_listeners:
+            monitor.forget(listener)
+
+    def _fan_out(self, listeners: Sequence[Callable[[Any], None]], value: Any) -> None:
+        monitor = self._listener_monitor
+        if not tracing.ENABLED:
+            if monitor is None:
+                for listener in listeners:
+                    listener(value)
+            else:
+                for listener in listeners:
+                    monitor.call(listener, value)
+            return
+        with tracing.span("notify_listeners", "domain", listeners=len(listeners)):
+            for listener in listeners:
+                with tracing.span(tracing.callable_name(listener), "listener"):
+                    if monitor is None:
+                        listener(value)
+                    else:
+                        monitor.call(listener, value)
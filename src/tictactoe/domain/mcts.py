@@ -0,0 +1,399 @@
+"""Monte Carlo tree search player for boards too large to search exhaustively."""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+from .bitboard import board_bitboards, cell_line_masks, neighbor_masks
+from .logic import BoardGeometry, GameState, Player, TicTacToe
+
+if TYPE_CHECKING:
+    from tictactoe.controller import ControllerHooks
+
+_DRAW = 0.5
+
+
+@dataclass
+class MCTSStats:
+    """Counters for one `MCTSPlayer.best_move` call."""
+
+    iterations: int = 0
+    playouts: int = 0
+    elapsed: float = 0.0
+    tree_size: int = 0
+    reused_nodes: int = 0
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class MCTSResult:
+    """Most-visited root move plus its visit count and mean value."""
+
+    move: int
+    visits: int
+    value: float
+    stats: MCTSStats = field(default_factory=MCTSStats)
+
+
+class _Node:
+    """Search node; *mine* is the side to move at this node."""
+
+    __slots__ = (
+        "move",
+        "parent",
+        "children",
+        "untried",
+        "visits",
+        "reward",
+        "mine",
+        "theirs",
+        "terminal",
+    )
+
+    def __init__(
+        self,
+        mine: int,
+        theirs: int,
+        move: int = -1,
+        parent: Optional[_Node] = None,
+        terminal: Optional[float] = None,
+    ) -> None:
+        self.mine = mine
+        self.theirs = theirs
+        self.move = move
+        self.parent = parent
+        self.children: List[_Node] = []
+        self.untried: Optional[List[int]] = None
+        self.visits = 0
+        # Accumulated reward for the player who made `move`.
+        self.reward = 0.0
+        self.terminal = terminal
+
+
+def playout(
+    geometry: BoardGeometry, mine: int, theirs: int, rng: random.Random
+) -> float:
+    """Finish the game with uniformly random moves.
+
+    Returns 1.0 when the side to move (owner of *mine*) wins, 0.0 when it
+    loses and 0.5 for a draw.
+    """
+
+    cell_masks = cell_line_masks(geometry)
+    occupied = mine | theirs
+    empty = [cell for cell in range(geometry.cells) if not occupied >> cell & 1]
+    rng.shuffle(empty)
+    boards = [mine, theirs]
+    side = 0
+    for move in empty:
+        placed = boards[side] | (1 << move)
+        boards[side] = placed
+        for mask in cell_masks[move]:
+            if placed & mask == mask:
+                return 1.0 if side == 0 else 0.0
+        side ^= 1
+    return _DRAW
+
+
+def _playout_batch(
+    dimensions: Tuple[int, int, int], mine: int, theirs: int, count: int, seed: int
+) -> float:
+    # Process-pool entry point: must stay importable and picklable.
+    geometry = BoardGeometry(*dimensions)
+    rng = random.Random(seed)
+    return sum(playout(geometry, mine, theirs, rng) for _ in range(count))
+
+
+class MCTSPlayer:
+    """UCT search over bitboards with subtree reuse between moves.
+
+    Each iteration selects a leaf with UCB1, expands one untried move, scores
+    it with *rollouts_per_leaf* random playouts, and backs the result up the
+    path. The search stops after *iterations* or once *time_budget* seconds
+    elapse, whichever comes first. On boards above 16 cells only moves next
+    to existing stones are expanded.
+
+    With *workers* above zero, the playouts of each leaf are split across a
+    `ProcessPoolExecutor`; that only pays off when *rollouts_per_leaf* is
+    large enough to amortise the inter-process round trip. Call `close` (or
+    use the player as a context manager) to shut the pool down.
+
+    When *controller_hooks* is given, every search emits a ``domain``
+    ``mcts_search`` event with playouts/sec and tree size.
+    """
+
+    def __init__(
+        self,
+        *,
+        iterations: Optional[int] = None,
+        time_budget: Optional[float] = 1.0,
+        exploration: float = math.sqrt(2),
+        rollouts_per_leaf: int = 1,
+        workers: int = 0,
+        reuse_tree: bool = True,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        controller_hooks: Optional[ControllerHooks] = None,
+    ) -> None:
+        if iterations is None and time_budget is None:
+            raise ValueError("MCTS needs an iteration or time budget.")
+        if rollouts_per_leaf < 1:
+            raise ValueError("rollouts_per_leaf must be at least 1.")
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.rollouts_per_leaf = rollouts_per_leaf
+        self.workers = workers
+        self.reuse_tree = reuse_tree
+        self.controller_hooks = controller_hooks
+        self.stats = MCTSStats()
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._executor: Optional[Executor] = None
+        self._root: Optional[_Node] = None
+        self._geometry: Optional[BoardGeometry] = None
+
+    def __enter__(self) -> MCTSPlayer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the rollout pool (if any) and drop the search tree."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._root = None
+
+    def best_move(self, game: TicTacToe) -> MCTSResult:
+        """Search the position held by *game* for its side to move."""
+
+        if game.state is not GameState.PLAYING or game.current_player is None:
+            raise ValueError("Cannot search a finished game.")
+        primary, secondary = board_bitboards(game.board)
+        if game.current_player is Player.PRIMARY:
+            mine, theirs = primary, secondary
+        else:
+            mine, theirs = secondary, primary
+        return self.search(game.geometry, mine, theirs)
+
+    def play(self, game: TicTacToe) -> MCTSResult:
+        """Search *game* and apply the chosen move through `make_move`."""
+
+        result = self.best_move(game)
+        game.make_move(result.move)
+        return result
+
+    def search(self, geometry: BoardGeometry, mine: int, theirs: int) -> MCTSResult:
+        """Search raw bitboards for the side owning *mine*."""
+
+        if geometry != self._geometry:
+            self._root = None
+            self._geometry = geometry
+            self._cells = geometry.cells
+            self._full = (1 << geometry.cells) - 1
+            self._cell_masks = cell_line_masks(geometry)
+            self._neighbors = neighbor_masks(geometry)
+        if not self._full & ~(mine | theirs):
+            raise ValueError("Cannot search a full board.")
+
+        self.stats = stats = MCTSStats()
+        root = self._reusable_root(mine, theirs)
+        if root is None:
+            root = _Node(mine, theirs)
+            stats.tree_size = 1
+        else:
+            root.parent = None
+            stats.reused_nodes = stats.tree_size = _subtree_size(root)
+        self._root = root
+
+        start = self._clock()
+        deadline = start + self.time_budget if self.time_budget is not None else None
+        while self.iterations is None or stats.iterations < self.iterations:
+            if deadline is not None and self._clock() >= deadline:
+                break
+            self._iterate(root, geometry)
+            stats.iterations += 1
+        stats.elapsed = self._clock() - start
+
+        best = max(root.children, key=lambda child: child.visits, default=None)
+        if best is None:
+            # Budget too small to expand anything: fall back to any legal move.
+            move = self._expand_moves(root)[0]
+            result = MCTSResult(move=move, visits=0, value=0.0, stats=stats)
+        else:
+            result = MCTSResult(
+                move=best.move,
+                visits=best.visits,
+                value=best.reward / best.visits if best.visits else 0.0,
+                stats=stats,
+            )
+        self._emit(result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _reusable_root(self, mine: int, theirs: int) -> Optional[_Node]:
+        """Find the current position among the previous tree's descendants."""
+
+        root = self._root
+        if not self.reuse_tree or root is None:
+            return None
+        frontier = [root]
+        # Our previous move plus the opponent's reply is two plies deep.
+        for _ in range(3):
+            for node in frontier:
+                if node.mine == mine and node.theirs == theirs:
+                    return node
+            frontier = [child for node in frontier for child in node.children]
+        return None
+
+    def _iterate(self, root: _Node, geometry: BoardGeometry) -> None:
+        node = root
+        # Selection.
+        while node.terminal is None:
+            untried = node.untried
+            if untried is None:
+                untried = self._expand_moves(node)
+            if untried:
+                node = self._expand(node, untried.pop())
+                break
+            node = self._select(node)
+
+        # Simulation.
+        if node.terminal is not None:
+            mover_reward, count = node.terminal, 1
+        else:
+            total, count = self._simulate(node, geometry)
+            mover_reward = count - total
+
+        # Backpropagation: rewards alternate between the two players.
+        self.stats.playouts += count
+        current: Optional[_Node] = node
+        reward = mover_reward
+        while current is not None:
+            current.visits += count
+            current.reward += reward
+            reward = count - reward
+            current = current.parent
+
+    def _expand_moves(self, node: _Node) -> List[int]:
+        occupied = node.mine | node.theirs
+        candidates = self._full & ~occupied
+        if occupied and self._cells > 16:
+            near = 0
+            remaining = occupied
+            while remaining:
+                low = remaining & -remaining
+                near |= self._neighbors[low.bit_length() - 1]
+                remaining ^= low
+            candidates = candidates & near or candidates
+        moves = [cell for cell in range(self._cells) if candidates >> cell & 1]
+        self._rng.shuffle(moves)
+        node.untried = moves
+        return moves
+
+    def _expand(self, node: _Node, move: int) -> _Node:
+        placed = node.mine | (1 << move)
+        terminal: Optional[float] = None
+        for mask in self._cell_masks[move]:
+            if placed & mask == mask:
+                terminal = 1.0
+                break
+        else:
+            if placed | node.theirs == self._full:
+                terminal = _DRAW
+        child = _Node(node.theirs, placed, move, node, terminal)
+        node.children.append(child)
+        self.stats.tree_size += 1
+        return child
+
+    def _select(self, node: _Node) -> _Node:
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        return max(
+            node.children,
+            key=lambda child: child.reward / child.visits
+            + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    def _simulate(self, node: _Node, geometry: BoardGeometry) -> Tuple[float, int]:
+        """Return (total reward for the side to move at *node*, playouts)."""
+
+        count = self.rollouts_per_leaf
+        if self.workers <= 0 or count < 2:
+            total = sum(
+                playout(geometry, node.mine, node.theirs, self._rng)
+                for _ in range(count)
+            )
+            return total, count
+        executor = self._pool()
+        dimensions = (geometry.width, geometry.height, geometry.k)
+        shares = _split(count, self.workers)
+        futures = [
+            executor.submit(
+                _playout_batch,
+                dimensions,
+                node.mine,
+                node.theirs,
+                share,
+                self._rng.getrandbits(63),
+            )
+            for share in shares
+        ]
+        return sum(future.result() for future in futures), count
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _emit(self, result: MCTSResult) -> None:
+        hooks = self.controller_hooks
+        if not hooks:
+            return
+        stats = result.stats
+        hooks.emit(
+            "domain",
+            "mcts_search",
+            move=result.move,
+            iterations=stats.iterations,
+            playouts=stats.playouts,
+            playouts_per_second=round(stats.playouts_per_second, 1),
+            tree_size=stats.tree_size,
+            reused_nodes=stats.reused_nodes,
+            elapsed=round(stats.elapsed, 6),
+        )
+
+
+def _subtree_size(node: _Node) -> int:
+    size = 0
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        size += 1
+        stack.extend(current.children)
+    return size
+
+
+def _split(total: int, parts: int) -> Sequence[int]:
+    base, extra = divmod(total, parts)
+    return [
+        base + (1 if index < extra else 0)
+        for index in range(parts)
+        if base or index < extra
+    ]
+
+
+__all__ = ["MCTSPlayer", "MCTSResult", "MCTSStats", "playout"]
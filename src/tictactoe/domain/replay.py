@@ -0,0 +1,277 @@
+"""Append-only action log with keyframes for deterministic replay and seeking."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .history import REDO_ACTION, UNDO_ACTION, Keyframe
+from .kinarow import KInARowGame
+from .logic import (
+    RESET_ACTION,
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    ExampleAction,
+    StateDelta,
+    TicTacToe,
+)
+
+SELECT_ACTION_NAME = "grid.select"
+REPLAY_ACTION = ExampleAction(name="log.seek")
+ACTION_LOG_FORMAT = "tictactoe-action-log"
+ACTION_LOG_VERSION = 1
+
+
+def select_action(position: int, **payload: Any) -> ExampleAction:
+    """Build the ``grid.select`` action that claims *position*."""
+
+    return ExampleAction(
+        name=SELECT_ACTION_NAME, payload={"position": position, **payload}
+    )
+
+
+class ActionLog:
+    """Event-sourced record of the actions applied to one game.
+
+    Entries are only ever appended. Every *keyframe_interval* plies the log
+    keeps the full position, so `seek` restores the nearest keyframe and then
+    re-dispatches at most ``keyframe_interval - 1`` actions instead of
+    replaying the whole game. Keyframes are captured while recording and
+    filled in lazily when a loaded log is replayed.
+
+    Undo/redo through `GameHistory` is navigation, not an action: undo moves
+    the last action onto a redo stack, redo (and keyframe seeks) move it back,
+    and a new action discards the stack. The log therefore always replays to
+    the recorded game's live position. Navigating to before the ply where
+    recording started stops the recording (see `detach`).
+    """
+
+    def __init__(
+        self,
+        geometry: BoardGeometry = STANDARD_GEOMETRY,
+        *,
+        actions: Iterable[ExampleAction] = (),
+        keyframe_interval: int = 16,
+    ) -> None:
+        if keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be at least 1.")
+        self.geometry = geometry
+        self.keyframe_interval = keyframe_interval
+        self._actions: List[ExampleAction] = list(actions)
+        self._redo: List[ExampleAction] = []
+        self._keyframes: Dict[int, Keyframe] = {}
+        self._game: Optional[TicTacToe] = None
+        self._replaying = False
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    @property
+    def actions(self) -> tuple[ExampleAction, ...]:
+        return tuple(self._actions)
+
+    @property
+    def keyframe_count(self) -> int:
+        return len(self._keyframes)
+
+    def append(self, action: ExampleAction) -> None:
+        """Add *action* to the end of the log."""
+
+        self._actions.append(action)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def attach(self, game: TicTacToe) -> None:
+        """Record every action *game* applies from now on.
+
+        The current position becomes ply 0, so the log must be empty.
+        """
+
+        if self._actions:
+            raise ValueError("Only an empty action log can start recording.")
+        if game.geometry != self.geometry:
+            raise ValueError("Game geometry does not match the action log.")
+        self.detach()
+        self._game = game
+        self._redo = []
+        self._keyframes = {0: Keyframe.capture(game, 0)}
+        game._attach_delta_sink(self.record)
+
+    def detach(self) -> None:
+        """Stop recording; the log and its keyframes are kept."""
+
+        if self._game is not None:
+            self._game._detach_delta_sink(self.record)
+            self._game = None
+
+    def record(self, delta: StateDelta) -> None:
+        """Delta sink registered by `attach`; not meant to be called directly."""
+
+        if self._replaying or self._game is None:
+            return
+        action = delta.action
+        if action is None:
+            # `make_move` carries no action; rebuild the equivalent select.
+            placed = [change for change in delta.cells if change.previous is None]
+            if len(placed) != 1:
+                return
+            action = select_action(placed[0].position)
+        elif action.name.startswith("history."):
+            self._navigate(action)
+            return
+        if self._redo:
+            # A new action after undo replaces the undone branch.
+            self._redo.clear()
+            ply = len(self._actions)
+            self._keyframes = {
+                key: frame for key, frame in self._keyframes.items() if key <= ply
+            }
+        self._actions.append(action)
+        ply = len(self._actions)
+        if ply % self.keyframe_interval == 0:
+            self._keyframes[ply] = Keyframe.capture(self._game, ply)
+
+    def _navigate(self, action: ExampleAction) -> None:
+        if action.name == UNDO_ACTION.name:
+            steps = -1
+        elif action.name == REDO_ACTION.name:
+            steps = 1
+        else:
+            steps = int((action.payload or {}).get("offset", 0))
+        target = len(self._actions) + steps
+        if target < 0 or target > len(self._actions) + len(self._redo):
+            # The game moved somewhere this log cannot express.
+            self.detach()
+            return
+        while len(self._actions) > target:
+            self._redo.append(self._actions.pop())
+        while len(self._actions) < target:
+            self._actions.append(self._redo.pop())
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+    def new_game(self) -> TicTacToe:
+        """Return a fresh engine for the log's geometry."""
+
+        return KInARowGame(self.geometry)
+
+    def replay(self, game: Optional[TicTacToe] = None) -> TicTacToe:
+        """Apply the whole log to *game* (default: a fresh engine)."""
+
+        return self.seek(len(self._actions), game)
+
+    def seek(self, ply: int, game: Optional[TicTacToe] = None) -> TicTacToe:
+        """Restore the position after the first *ply* actions.
+
+        *game* defaults to a fresh engine; listeners on it are notified once.
+        Raises ValueError for plies outside the log and for actions the
+        engine rejects.
+        """
+
+        if not 0 <= ply <= len(self._actions):
+            raise ValueError(f"Ply {ply} is outside the log range 0..{len(self)}.")
+        if game is None:
+            game = self.new_game()
+        if game.geometry != self.geometry:
+            raise ValueError("Game geometry does not match the action log.")
+
+        self._replaying = True
+        try:
+            with game.transaction():
+                keyframe = self._nearest_keyframe(ply)
+                if keyframe is None:
+                    game.reset()
+                    start = 0
+                else:
+                    keyframe.restore(game, REPLAY_ACTION)
+                    start = keyframe.ply
+                for index in range(start, ply):
+                    _dispatch(game, self._actions[index])
+                    applied = index + 1
+                    if (
+                        applied % self.keyframe_interval == 0
+                        and applied not in self._keyframes
+                    ):
+                        self._keyframes[applied] = Keyframe.capture(game, applied)
+        finally:
+            self._replaying = False
+        return game
+
+    def _nearest_keyframe(self, ply: int) -> Optional[Keyframe]:
+        candidate = ply - ply % self.keyframe_interval
+        while candidate >= 0:
+            keyframe = self._keyframes.get(candidate)
+            if keyframe is not None:
+                return keyframe
+            candidate -= self.keyframe_interval
+        return None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def to_lines(self) -> List[str]:
+        """Serialize as JSON lines: a header followed by one action per line."""
+
+        header = {
+            "format": ACTION_LOG_FORMAT,
+            "version": ACTION_LOG_VERSION,
+            "board": self.geometry.label,
+            "win_length": self.geometry.k,
+        }
+        lines = [json.dumps(header)]
+        lines.extend(
+            json.dumps({"name": action.name, "payload": dict(action.payload or {})})
+            for action in self._actions
+        )
+        return lines
+
+    @classmethod
+    def from_lines(
+        cls, lines: Sequence[str], *, keyframe_interval: int = 16
+    ) -> ActionLog:
+        rows = [json.loads(line) for line in lines if line.strip()]
+        if not rows:
+            raise ValueError("Action log is empty.")
+        header = rows[0]
+        if (
+            header.get("format") != ACTION_LOG_FORMAT
+            or header.get("version") != ACTION_LOG_VERSION
+        ):
+            raise ValueError("Unsupported action log format.")
+        geometry = BoardGeometry.parse(header["board"], int(header["win_length"]))
+        actions = (
+            ExampleAction(name=row["name"], payload=row.get("payload") or None)
+            for row in rows[1:]
+        )
+        return cls(geometry, actions=actions, keyframe_interval=keyframe_interval)
+
+    def write(self, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text("\n".join(self.to_lines()) + "\n", encoding="utf-8")
+
+    @classmethod
+    def read(cls, source: Path, *, keyframe_interval: int = 16) -> ActionLog:
+        return cls.from_lines(
+            source.read_text(encoding="utf-8").splitlines(),
+            keyframe_interval=keyframe_interval,
+        )
+
+
+def _dispatch(game: TicTacToe, action: ExampleAction) -> None:
+    if action.name == RESET_ACTION.name:
+        game.reset()
+    else:
+        game.dispatch_action(action)
+
+
+__all__ = [
+    "ACTION_LOG_FORMAT",
+    "ACTION_LOG_VERSION",
+    "ActionLog",
+    "REPLAY_ACTION",
+    "SELECT_ACTION_NAME",
+    "select_action",
+]
@@ -0,0 +1,367 @@
+"""Negamax/alpha-beta move search for the `TicTacToe` engines."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .bitboard import (
+    board_bitboards,
+    cell_line_masks,
+    line_masks,
+    neighbor_masks,
+    symmetry_mapper,
+)
+from .logic import STANDARD_GEOMETRY, BoardGeometry, GameState, Player, TicTacToe
+from .solved import Outcome, load_solved_table
+
+WIN_SCORE = 1_000_000
+# Scores beyond this are forced wins/losses whose distance is encoded in them.
+_MATE_THRESHOLD = WIN_SCORE - 10_000
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+_DEADLINE_CHECK_MASK = 0x3FF
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the recursion once the time budget is spent."""
+
+
+@dataclass
+class SearchStats:
+    """Counters collected while searching, reset for every `best_move` call."""
+
+    depth: int = 0
+    nodes: int = 0
+    elapsed: float = 0.0
+    tt_probes: int = 0
+    tt_hits: int = 0
+    tt_entries: int = 0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Best move found for the side to move plus the search statistics."""
+
+    move: int
+    score: int
+    depth: int
+    stats: SearchStats = field(default_factory=SearchStats)
+
+
+@dataclass
+class _Entry:
+    depth: int
+    flag: int
+    value: int
+    move: int
+
+
+class SearchEngine:
+    """Iterative-deepening negamax with alpha-beta pruning.
+
+    The transposition table is keyed by the canonical form of the position, so
+    all eight rotations/reflections of a square board share one entry. Stored
+    best moves live in canonical coordinates and are mapped back through the
+    inverse symmetry on probe.
+
+    Standard 3x3 positions are answered from the shipped solved-position table
+    (see `tictactoe.domain.solved`) unless *use_solved_table* is False.
+    """
+
+    def __init__(
+        self,
+        *,
+        time_budget: Optional[float] = 1.0,
+        max_depth: Optional[int] = None,
+        table_size: int = 1 << 20,
+        clock: Callable[[], float] = time.perf_counter,
+        use_solved_table: bool = True,
+    ) -> None:
+        self.time_budget = time_budget
+        self.use_solved_table = use_solved_table
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self._clock = clock
+        self._table: Dict[int, _Entry] = {}
+        self._table_geometry: Optional[BoardGeometry] = None
+        self.stats = SearchStats()
+        self._deadline: Optional[float] = None
+
+    def clear(self) -> None:
+        """Drop every cached transposition entry."""
+
+        self._table.clear()
+
+    def best_move(self, game: TicTacToe) -> SearchResult:
+        """Search the position held by *game* for its side to move."""
+
+        if game.state is not GameState.PLAYING or game.current_player is None:
+            raise ValueError("Cannot search a finished game.")
+        primary, secondary = board_bitboards(game.board)
+        if self.use_solved_table and game.geometry == STANDARD_GEOMETRY:
+            solved = self._probe_solved(primary, secondary)
+            if solved is not None:
+                return solved
+        if game.current_player is Player.PRIMARY:
+            mine, theirs = primary, secondary
+        else:
+            mine, theirs = secondary, primary
+        return self.search(game.geometry, mine, theirs)
+
+    def play(self, game: TicTacToe) -> SearchResult:
+        """Search *game* and apply the chosen move through `make_move`."""
+
+        result = self.best_move(game)
+        game.make_move(result.move)
+        return result
+
+    def search(self, geometry: BoardGeometry, mine: int, theirs: int) -> SearchResult:
+        """Search raw bitboards for the side owning *mine*."""
+
+        self._prepare(geometry)
+        self.stats = SearchStats()
+        start = self._clock()
+        self._deadline = (
+            start + self.time_budget if self.time_budget is not None else None
+        )
+        empty = self._full & ~(mine | theirs)
+        remaining = bin(empty).count("1")
+        if not remaining:
+            raise ValueError("Cannot search a full board.")
+        limit = remaining if self.max_depth is None else min(self.max_depth, remaining)
+
+        best_move = self._ordered_moves(mine, theirs, empty, None)[0]
+        best_score = 0
+        completed = 0
+        for depth in range(1, limit + 1):
+            try:
+                score, move = self._root(mine, theirs, depth, best_move)
+            except _SearchTimeout:
+                break
+            best_move, best_score, completed = move, score, depth
+            if abs(score) >= _MATE_THRESHOLD:
+                break
+
+        self.stats.depth = completed
+        self.stats.elapsed = self._clock() - start
+        self.stats.tt_entries = len(self._table)
+        return SearchResult(
+            move=best_move, score=best_score, depth=completed, stats=self.stats
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _probe_solved(self, primary: int, secondary: int) -> Optional[SearchResult]:
+        try:
+            entry = load_solved_table().probe_bitboards(primary, secondary)
+        except FileNotFoundError:
+            return None
+        if entry is None or entry.move is None:
+            return None
+        if entry.outcome is Outcome.WIN:
+            score = WIN_SCORE - entry.distance
+        elif entry.outcome is Outcome.LOSS:
+            score = -(WIN_SCORE - entry.distance)
+        else:
+            score = 0
+        self.stats = SearchStats(depth=entry.distance)
+        return SearchResult(
+            move=entry.move, score=score, depth=entry.distance, stats=self.stats
+        )
+
+    def _prepare(self, geometry: BoardGeometry) -> None:
+        if geometry == self._table_geometry:
+            return
+        self._table.clear()
+        self._table_geometry = geometry
+        self._cells = geometry.cells
+        self._full = (1 << geometry.cells) - 1
+        self._lines = line_masks(geometry)
+        self._cell_masks = cell_line_masks(geometry)
+        self._mapper = symmetry_mapper(geometry)
+        self._neighbors = neighbor_masks(geometry)
+        center_row = (geometry.height - 1) / 2
+        center_column = (geometry.width - 1) / 2
+        self._center_order = tuple(
+            sorted(
+                range(geometry.cells),
+                key=lambda cell: abs(cell // geometry.width - center_row)
+                + abs(cell % geometry.width - center_column),
+            )
+        )
+
+    def _root(self, mine: int, theirs: int, depth: int, hint: int) -> Tuple[int, int]:
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        empty = self._full & ~(mine | theirs)
+        best_move = hint
+        best_score = -WIN_SCORE - 1
+        for move in self._ordered_moves(mine, theirs, empty, hint):
+            score = self._score_move(mine, theirs, move, depth, alpha, beta, 0)
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+        self._store(mine, theirs, depth, _EXACT, best_score, best_move, 0)
+        return best_score, best_move
+
+    def _score_move(
+        self,
+        mine: int,
+        theirs: int,
+        move: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        placed = mine | (1 << move)
+        for mask in self._cell_masks[move]:
+            if placed & mask == mask:
+                return WIN_SCORE - (ply + 1)
+        if placed | theirs == self._full:
+            return 0
+        return -self._negamax(theirs, placed, depth - 1, -beta, -alpha, ply + 1)
+
+    def _negamax(
+        self, mine: int, theirs: int, depth: int, alpha: int, beta: int, ply: int
+    ) -> int:
+        stats = self.stats
+        stats.nodes += 1
+        if (
+            self._deadline is not None
+            and not stats.nodes & _DEADLINE_CHECK_MASK
+            and self._clock() >= self._deadline
+        ):
+            raise _SearchTimeout
+        if depth <= 0:
+            return self._evaluate(mine, theirs)
+
+        original_alpha = alpha
+        key, symmetry = self._mapper.canonical(mine, theirs)
+        stats.tt_probes += 1
+        entry = self._table.get(key)
+        hint: Optional[int] = None
+        if entry is not None:
+            stats.tt_hits += 1
+            hint = self._mapper.inverse[symmetry][entry.move]
+            if entry.depth >= depth:
+                value = _from_table(entry.value, ply)
+                if entry.flag == _EXACT:
+                    return value
+                if entry.flag == _LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        empty = self._full & ~(mine | theirs)
+        best_score = -WIN_SCORE - 1
+        best_move = -1
+        for move in self._ordered_moves(mine, theirs, empty, hint):
+            score = self._score_move(mine, theirs, move, depth, alpha, beta, ply)
+            if score > best_score:
+                best_score, best_move = score, move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = _UPPER
+        elif best_score >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._store_canonical(key, symmetry, depth, flag, best_score, best_move, ply)
+        return best_score
+
+    def _store(
+        self,
+        mine: int,
+        theirs: int,
+        depth: int,
+        flag: int,
+        value: int,
+        move: int,
+        ply: int,
+    ) -> None:
+        key, symmetry = self._mapper.canonical(mine, theirs)
+        self._store_canonical(key, symmetry, depth, flag, value, move, ply)
+
+    def _store_canonical(
+        self,
+        key: int,
+        symmetry: int,
+        depth: int,
+        flag: int,
+        value: int,
+        move: int,
+        ply: int,
+    ) -> None:
+        if len(self._table) >= self.table_size and key not in self._table:
+            self._table.clear()
+        canonical_move = self._mapper.permutations[symmetry][move]
+        self._table[key] = _Entry(depth, flag, _to_table(value, ply), canonical_move)
+
+    def _ordered_moves(
+        self, mine: int, theirs: int, empty: int, hint: Optional[int]
+    ) -> List[int]:
+        occupied = mine | theirs
+        candidates = empty
+        if occupied and self._cells > 16:
+            # Large boards: only consider cells touching existing stones.
+            near = 0
+            remaining = occupied
+            while remaining:
+                low = remaining & -remaining
+                near |= self._neighbors[low.bit_length() - 1]
+                remaining ^= low
+            candidates = empty & near or empty
+        moves = [cell for cell in self._center_order if candidates >> cell & 1]
+        if hint is not None and candidates >> hint & 1:
+            moves.remove(hint)
+            moves.insert(0, hint)
+        return moves
+
+    def _evaluate(self, mine: int, theirs: int) -> int:
+        """Static score: open windows weighted by how full they are."""
+
+        score = 0
+        for mask in self._lines:
+            own = mine & mask
+            other = theirs & mask
+            if own and not other:
+                score += 1 << (2 * bin(own).count("1"))
+            elif other and not own:
+                score -= 1 << (2 * bin(other).count("1"))
+        return max(-_MATE_THRESHOLD + 1, min(_MATE_THRESHOLD - 1, score))
+
+
+def _to_table(value: int, ply: int) -> int:
+    if value >= _MATE_THRESHOLD:
+        return value + ply
+    if value <= -_MATE_THRESHOLD:
+        return value - ply
+    return value
+
+
+def _from_table(value: int, ply: int) -> int:
+    if value >= _MATE_THRESHOLD:
+        return value - ply
+    if value <= -_MATE_THRESHOLD:
+        return value + ply
+    return value
+
+
+__all__ = ["SearchEngine", "SearchResult", "SearchStats", "WIN_SCORE"]
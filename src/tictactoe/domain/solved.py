@@ -0,0 +1,181 @@
+"""Memory-mapped lookups into the precomputed 3x3 solved-position table.
+
+The table lives in ``tictactoe/assets/solved_3x3.bin`` and is produced by
+``python -m tictactoe.tools.solve_positions``. Positions are indexed by their
+base-3 encoding (empty=0, primary=1, secondary=2 per cell), so a lookup is a
+single probe into the mapped file.
+
+File layout (little-endian)::
+
+    header  <4sBBBBII  magic b"TTTS", format version, width, height, k,
+                       entry count (3**cells), reachable position count
+    entries <H * count bits 0-3 best move (15 = none), bits 4-5 outcome for
+                       the side to move, bits 6-9 plies until the game ends;
+                       0xFFFF marks unreachable positions
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+from .bitboard import board_bitboards
+from .logic import STANDARD_GEOMETRY, GameState, Player, TicTacToe
+
+SOLVED_TABLE_FILENAME = "solved_3x3.bin"
+SOLVED_TABLE_MAGIC = b"TTTS"
+SOLVED_TABLE_VERSION = 1
+HEADER = struct.Struct("<4sBBBBII")
+ENTRY = struct.Struct("<H")
+UNREACHABLE = 0xFFFF
+NO_MOVE = 0xF
+
+_CELLS = STANDARD_GEOMETRY.cells
+_POW3 = tuple(3**cell for cell in range(_CELLS))
+# Base-3 contribution of every possible bitboard, so indexing is two lookups.
+_PRIMARY_INDEX: Tuple[int, ...] = tuple(
+    sum(_POW3[cell] for cell in range(_CELLS) if bits >> cell & 1)
+    for bits in range(1 << _CELLS)
+)
+_SECONDARY_INDEX: Tuple[int, ...] = tuple(2 * value for value in _PRIMARY_INDEX)
+
+
+class Outcome(Enum):
+    """Game-theoretic value from the perspective of the side to move."""
+
+    LOSS = 0
+    DRAW = 1
+    WIN = 2
+
+
+@dataclass(frozen=True)
+class SolvedEntry:
+    """Decoded table entry for one position."""
+
+    move: Optional[int]
+    outcome: Outcome
+    distance: int
+
+
+def position_index(primary: int, secondary: int) -> int:
+    """Return the base-3 table index of a pair of 3x3 bitboards."""
+
+    return _PRIMARY_INDEX[primary] + _SECONDARY_INDEX[secondary]
+
+
+def encode_entry(move: Optional[int], outcome: Outcome, distance: int) -> int:
+    """Pack an entry into the 16-bit on-disk representation."""
+
+    encoded_move = NO_MOVE if move is None else move
+    return encoded_move | outcome.value << 4 | distance << 6
+
+
+def decode_entry(raw: int) -> Optional[SolvedEntry]:
+    """Unpack a 16-bit entry, returning None for unreachable positions."""
+
+    if raw == UNREACHABLE:
+        return None
+    move = raw & 0xF
+    return SolvedEntry(
+        move=None if move == NO_MOVE else move,
+        outcome=Outcome(raw >> 4 & 0x3),
+        distance=raw >> 6 & 0xF,
+    )
+
+
+class SolvedTable:
+    """Read-only view over the solved-position file."""
+
+    def __init__(self, data: Union[mmap.mmap, bytes]) -> None:
+        magic, version, width, height, k, count, reachable = HEADER.unpack_from(data, 0)
+        if magic != SOLVED_TABLE_MAGIC or version != SOLVED_TABLE_VERSION:
+            raise ValueError("Unsupported solved-position table format.")
+        if (width, height, k) != (
+            STANDARD_GEOMETRY.width,
+            STANDARD_GEOMETRY.height,
+            STANDARD_GEOMETRY.k,
+        ):
+            raise ValueError("Solved-position table does not describe a 3x3 board.")
+        if len(data) < HEADER.size + count * ENTRY.size:
+            raise ValueError("Solved-position table is truncated.")
+        self._data = data
+        self.entry_count = count
+        self.reachable = reachable
+
+    @classmethod
+    def open(cls, path: Path) -> SolvedTable:
+        """Memory-map the table stored at *path*."""
+
+        with path.open("rb") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data)
+
+    def probe_index(self, index: int) -> Optional[SolvedEntry]:
+        (raw,) = ENTRY.unpack_from(self._data, HEADER.size + index * ENTRY.size)
+        return decode_entry(raw)
+
+    def probe_bitboards(self, primary: int, secondary: int) -> Optional[SolvedEntry]:
+        return self.probe_index(position_index(primary, secondary))
+
+    def probe(self, board: Sequence[Optional[Player]]) -> Optional[SolvedEntry]:
+        """Look up a board tuple such as `ExampleState.board`."""
+
+        return self.probe_bitboards(*board_bitboards(board))
+
+    def best_move(self, game: TicTacToe) -> Optional[int]:
+        """Best move for *game*'s side to move, or None when finished."""
+
+        if game.geometry != STANDARD_GEOMETRY or game.state is not GameState.PLAYING:
+            return None
+        bitboards = getattr(game, "bitboards", None)
+        entry = (
+            self.probe_bitboards(*bitboards)
+            if bitboards is not None
+            else self.probe(game.board)
+        )
+        return entry.move if entry else None
+
+
+def _locate_table() -> Tuple[Optional[Path], Optional[bytes]]:
+    source_candidate = (
+        Path(__file__).resolve().parent.parent / "assets" / SOLVED_TABLE_FILENAME
+    )
+    if source_candidate.exists():
+        return source_candidate, None
+    files_fn = getattr(resources, "files", None)
+    if files_fn is None:
+        return None, None
+    try:
+        resource = files_fn("tictactoe") / "assets" / SOLVED_TABLE_FILENAME
+        return None, resource.read_bytes()
+    except (ModuleNotFoundError, FileNotFoundError):
+        return None, None
+
+
+@lru_cache(maxsize=1)
+def load_solved_table() -> SolvedTable:
+    """Lazily open the shipped table; the mapping is shared process-wide."""
+
+    path, payload = _locate_table()
+    if path is not None:
+        return SolvedTable.open(path)
+    if payload is not None:
+        return SolvedTable(payload)
+    raise FileNotFoundError(SOLVED_TABLE_FILENAME)
+
+
+__all__ = [
+    "Outcome",
+    "SolvedEntry",
+    "SolvedTable",
+    "decode_entry",
+    "encode_entry",
+    "load_solved_table",
+    "position_index",
+]
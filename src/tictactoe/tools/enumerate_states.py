@@ -0,0 +1,393 @@
+"""Enumerate every reachable position of a board for capacity planning.
+
+Positions are explored breadth-first one ply at a time. A position at ply
+*n* always holds *n* stones, so layers never overlap; finished layers are
+sorted and streamed to disk. Visited positions are marked in one bit per
+base-3 index (``3**cells`` bits, 5.4 MB for 4x4) and each layer's keys live
+in a packed ``array('Q')``; boards whose bitmap would exceed
+`VISITED_BITMAP_LIMIT` bits fall back to a set of keys.
+With symmetry folding (the default) each position is stored once, in the
+canonical form chosen by `tictactoe.domain.bitboard.SymmetryMapper`::
+
+    python -m tictactoe.tools.enumerate_states --board 4x4 --win-length 3 \\
+        --output artifacts/states_4x4.bin
+
+File layout (little-endian)::
+
+    header  <4sBBBBBBI  magic b"TTTE", format version, width, height, k,
+                        key size in bytes, flags (bit 0: symmetry folded),
+                        ply count (cells + 1)
+    offsets <Q * (plies + 1)  index of the first record of every ply plus the
+                        total record count
+    records key size * count  canonical keys ``primary | secondary << cells``
+                        sorted ascending within each ply
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+from array import array
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from tictactoe.domain.bitboard import cell_line_masks, symmetry_mapper
+from tictactoe.domain.logic import STANDARD_GEOMETRY, BoardGeometry, GameState
+
+__all__ = [
+    "EnumerationResult",
+    "PlyCounts",
+    "StateFile",
+    "enumerate_states",
+    "main",
+]
+
+STATE_FILE_MAGIC = b"TTTE"
+STATE_FILE_VERSION = 1
+HEADER = struct.Struct("<4sBBBBBBI")
+OFFSET = struct.Struct("<Q")
+FLAG_FOLDED = 0x1
+# 2**29 bits is a 64 MiB bitmap, enough for boards of up to 18 cells.
+VISITED_BITMAP_LIMIT = 1 << 29
+
+
+@dataclass(frozen=True)
+class PlyCounts:
+    """Positions with a given number of stones, split by outcome."""
+
+    ply: int
+    playing: int
+    x_won: int
+    o_won: int
+    draw: int
+
+    @property
+    def total(self) -> int:
+        return self.playing + self.x_won + self.o_won + self.draw
+
+
+@dataclass(frozen=True)
+class EnumerationResult:
+    """Per-ply statistics of a finished enumeration."""
+
+    geometry: BoardGeometry
+    folded: bool
+    plies: Tuple[PlyCounts, ...]
+
+    @property
+    def total(self) -> int:
+        return sum(counts.total for counts in self.plies)
+
+    def outcomes(self) -> dict[GameState, int]:
+        return {
+            GameState.PLAYING: sum(counts.playing for counts in self.plies),
+            GameState.X_WON: sum(counts.x_won for counts in self.plies),
+            GameState.O_WON: sum(counts.o_won for counts in self.plies),
+            GameState.DRAW: sum(counts.draw for counts in self.plies),
+        }
+
+
+def _base3_tables(cells: int) -> Tuple[Tuple[int, ...], ...]:
+    """Per byte of a bitboard, the base-3 value of its set cells."""
+
+    return tuple(
+        tuple(
+            sum(3 ** (chunk * 8 + bit) for bit in range(8) if value >> bit & 1)
+            for value in range(256)
+        )
+        for chunk in range((cells + 7) // 8)
+    )
+
+
+def _visited_marker(cells: int) -> Callable[[int], bool]:
+    """Return ``mark(key)``: True the first time *key* is seen."""
+
+    if 3**cells > VISITED_BITMAP_LIMIT:
+        seen: Set[int] = set()
+
+        def mark_in_set(key: int) -> bool:
+            if key in seen:
+                return False
+            seen.add(key)
+            return True
+
+        return mark_in_set
+
+    bitmap = bytearray((3**cells + 7) // 8)
+    tables = _base3_tables(cells)
+    full = (1 << cells) - 1
+
+    def mark(key: int) -> bool:
+        # Base-3 index: primary cells count 1, secondary cells 2.
+        index = 0
+        primary, secondary = key & full, key >> cells
+        for table in tables:
+            index += table[primary & 0xFF] + 2 * table[secondary & 0xFF]
+            primary >>= 8
+            secondary >>= 8
+        byte, bit = index >> 3, 1 << (index & 7)
+        if bitmap[byte] & bit:
+            return False
+        bitmap[byte] |= bit
+        return True
+
+    return mark
+
+
+def _layers(
+    geometry: BoardGeometry, fold: bool
+) -> Iterator[Tuple[int, Sequence[int], Sequence[int], Sequence[int]]]:
+    """Yield ``(ply, playing, won, drawn)`` keys one layer at a time."""
+
+    cells = geometry.cells
+    full = (1 << cells) - 1
+    cell_masks = cell_line_masks(geometry)
+    mapper = symmetry_mapper(geometry)
+    mark = _visited_marker(cells)
+    # Keys are 2 * cells bits wide; wider ones need Python ints.
+    packed = 2 * cells <= 64
+
+    def key_of(primary: int, secondary: int) -> int:
+        if fold:
+            return mapper.canonical(primary, secondary)[0]
+        return primary | secondary << cells
+
+    def layer() -> MutableSequence[int]:
+        return array("Q") if packed else []
+
+    playing = layer()
+    playing.append(0)
+    mark(0)
+    yield 0, playing, layer(), layer()
+    for ply in range(1, cells + 1):
+        next_playing = layer()
+        won = layer()
+        drawn = layer()
+        primary_moves = ply % 2 == 1
+        for key in playing:
+            primary, secondary = key & full, key >> cells
+            mover = primary if primary_moves else secondary
+            empty = full & ~(primary | secondary)
+            while empty:
+                bit = empty & -empty
+                empty ^= bit
+                placed = mover | bit
+                if primary_moves:
+                    child = key_of(placed, secondary)
+                else:
+                    child = key_of(primary, placed)
+                if not mark(child):
+                    continue
+                cell = bit.bit_length() - 1
+                if any(placed & mask == mask for mask in cell_masks[cell]):
+                    won.append(child)
+                elif ply == cells:
+                    drawn.append(child)
+                else:
+                    next_playing.append(child)
+        yield ply, next_playing, won, drawn
+        playing = next_playing
+        if not playing:
+            break
+
+
+def enumerate_states(
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
+    *,
+    fold_symmetry: bool = True,
+    output: Optional[BinaryIO] = None,
+) -> EnumerationResult:
+    """Count reachable positions and optionally stream them to *output*.
+
+    *output* must be seekable: the offset table is patched once every layer
+    has been written.
+    """
+
+    cells = geometry.cells
+    key_size = (2 * cells + 7) // 8
+    ply_count = cells + 1
+    offsets: List[int] = [0] * (ply_count + 1)
+    if output is not None:
+        start = output.tell()
+        output.write(b"\0" * (HEADER.size + OFFSET.size * len(offsets)))
+
+    written = 0
+    plies: List[PlyCounts] = []
+    for ply, playing, won, drawn in _layers(geometry, fold_symmetry):
+        x_won = len(won) if ply % 2 == 1 else 0
+        plies.append(
+            PlyCounts(
+                ply=ply,
+                playing=len(playing),
+                x_won=x_won,
+                o_won=len(won) - x_won,
+                draw=len(drawn),
+            )
+        )
+        offsets[ply] = written
+        if output is not None:
+            layer = sorted(chain(playing, won, drawn))
+            output.write(b"".join(key.to_bytes(key_size, "little") for key in layer))
+        written += len(playing) + len(won) + len(drawn)
+    for ply in range(len(plies), ply_count + 1):
+        offsets[ply] = written
+
+    if output is not None:
+        end = output.tell()
+        output.seek(start)
+        output.write(
+            HEADER.pack(
+                STATE_FILE_MAGIC,
+                STATE_FILE_VERSION,
+                geometry.width,
+                geometry.height,
+                geometry.k,
+                key_size,
+                FLAG_FOLDED if fold_symmetry else 0,
+                ply_count,
+            )
+        )
+        output.write(b"".join(OFFSET.pack(value) for value in offsets))
+        output.seek(end)
+    return EnumerationResult(geometry, fold_symmetry, tuple(plies))
+
+
+class StateFile:
+    """Read-only, memory-mappable view over an enumerated state file."""
+
+    def __init__(self, data: Union[mmap.mmap, bytes]) -> None:
+        magic, version, width, height, k, key_size, flags, ply_count = (
+            HEADER.unpack_from(data, 0)
+        )
+        if magic != STATE_FILE_MAGIC or version != STATE_FILE_VERSION:
+            raise ValueError("Unsupported state file format.")
+        self._data = data
+        self.geometry = BoardGeometry(width, height, k)
+        self.key_size = key_size
+        self.folded = bool(flags & FLAG_FOLDED)
+        self._offsets: List[int] = [
+            OFFSET.unpack_from(data, HEADER.size + index * OFFSET.size)[0]
+            for index in range(ply_count + 1)
+        ]
+        self._records = HEADER.size + OFFSET.size * (ply_count + 1)
+        if len(data) < self._records + key_size * self._offsets[-1]:
+            raise ValueError("State file is truncated.")
+
+    @classmethod
+    def open(cls, path: Path) -> StateFile:
+        with path.open("rb") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data)
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def ply_range(self, ply: int) -> range:
+        """Record indices holding positions with *ply* stones."""
+
+        return range(self._offsets[ply], self._offsets[ply + 1])
+
+    def key(self, index: int) -> int:
+        offset = self._records + index * self.key_size
+        return int.from_bytes(self._data[offset : offset + self.key_size], "little")
+
+    def __contains__(self, key: object) -> bool:
+        """Binary search the layer implied by the key's stone count.
+
+        In a folded file any orientation of a stored position is found: the
+        key is mapped to its canonical form first.
+        """
+
+        cells = self.geometry.cells
+        if not isinstance(key, int) or key < 0 or key >> 2 * cells:
+            return False
+        if self.folded:
+            full = (1 << cells) - 1
+            key = symmetry_mapper(self.geometry).canonical(key & full, key >> cells)[0]
+        ply = bin(key).count("1")
+        if ply >= len(self._offsets) - 1:
+            return False
+        records = self.ply_range(ply)
+        low, high = records.start, records.stop
+        while low < high:
+            middle = (low + high) // 2
+            value = self.key(middle)
+            if value < key:
+                low = middle + 1
+            elif value > key:
+                high = middle
+            else:
+                return True
+        return False
+
+
+def render_result(result: EnumerationResult) -> str:
+    lines = [
+        f"Board {result.geometry.label} k={result.geometry.k} "
+        f"({'symmetry folded' if result.folded else 'all orientations'})",
+        f"{'ply':>4} {'playing':>12} {'x_won':>10} {'o_won':>10} {'draw':>8} "
+        f"{'total':>12}",
+    ]
+    for counts in result.plies:
+        lines.append(
+            f"{counts.ply:>4} {counts.playing:>12} {counts.x_won:>10} "
+            f"{counts.o_won:>10} {counts.draw:>8} {counts.total:>12}"
+        )
+    lines.append(f"Total reachable positions: {result.total}")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Enumerate every reachable position of a board."
+    )
+    parser.add_argument(
+        "--board", default=STANDARD_GEOMETRY.label, help="WIDTHxHEIGHT (default 3x3)."
+    )
+    parser.add_argument("--win-length", type=int, default=STANDARD_GEOMETRY.k)
+    parser.add_argument(
+        "--no-symmetry",
+        action="store_true",
+        help="Count every orientation separately instead of folding symmetries.",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Binary file receiving the canonical states."
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    try:
+        geometry = BoardGeometry.parse(args.board, args.win_length)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+    fold = not args.no_symmetry
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("wb") as handle:
+            result = enumerate_states(geometry, fold_symmetry=fold, output=handle)
+    else:
+        result = enumerate_states(geometry, fold_symmetry=fold)
+    print(render_result(result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,253 @@
+"""Opt-in profiling for every frontend launched through ``tictactoe.__main__``.
+
+``python -m tictactoe --ui cli --profile cprofile,sample`` (or
+``TICTACTOE_PROFILE=cprofile,sample``) wraps the frontend's ``main`` in a
+`ProfileSession`. Modes can be combined; ``all`` enables every one:
+
+    cprofile     deterministic profile saved as ``<label>.pstats``
+    sample       wall-clock stack sampling from a background thread, saved
+                 as collapsed stacks (``<label>.collapsed.txt``) that
+                 flamegraph.pl, speedscope, or inferno render directly
+    tracemalloc  top allocation sites at exit (``<label>.alloc.txt``)
+
+Reports go to ``TICTACTOE_PROFILE_DIR`` when set, otherwise next to
+``TICTACTOE_AUTOMATION_OUTPUT``, otherwise to the working directory.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+PROFILE_ENV_VAR = "TICTACTOE_PROFILE"
+PROFILE_DIR_ENV_VAR = "TICTACTOE_PROFILE_DIR"
+AUTOMATION_OUTPUT_ENV_VAR = "TICTACTOE_AUTOMATION_OUTPUT"
+MODES = ("cprofile", "sample", "tracemalloc")
+
+
+def parse_modes(text: str) -> Tuple[str, ...]:
+    """Parse a comma-separated mode list; ``all`` selects every mode."""
+
+    modes: List[str] = []
+    for item in text.split(","):
+        mode = item.strip().lower()
+        if not mode:
+            continue
+        if mode == "all":
+            return MODES
+        if mode not in MODES:
+            raise ValueError(
+                f"Unknown profiling mode {mode!r}. Choose from: {', '.join(MODES)}."
+            )
+        if mode not in modes:
+            modes.append(mode)
+    return tuple(modes)
+
+
+def profile_output_dir() -> Path:
+    explicit = os.environ.get(PROFILE_DIR_ENV_VAR, "").strip()
+    if explicit:
+        return Path(explicit)
+    automation = os.environ.get(AUTOMATION_OUTPUT_ENV_VAR, "").strip()
+    if automation:
+        return Path(automation).parent
+    return Path.cwd()
+
+
+class SamplingProfiler:
+    """Sample one thread's stack every *interval* seconds from a daemon thread."""
+
+    def __init__(self, *, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.samples = 0
+        self._stacks: Counter[Tuple[str, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="tictactoe-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self) -> Dict[str, int]:
+        """``root;caller;callee -> samples``, the flamegraph input format."""
+
+        return {";".join(stack): count for stack, count in self._stacks.items()}
+
+    def write(self, path: Path) -> Path:
+        lines = [
+            f"{stack} {count}" for stack, count in sorted(self.collapsed().items())
+        ]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        return path
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self._stacks[_stack(frame)] += 1
+            self.samples += 1
+
+
+def _stack(frame: Optional[FrameType]) -> Tuple[str, ...]:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    names.reverse()
+    return tuple(name.replace(";", ":") for name in names)
+
+
+class ProfileSession:
+    """Run the selected profilers around a block and write their reports."""
+
+    def __init__(
+        self,
+        modes: Sequence[str],
+        *,
+        label: str = "tictactoe",
+        output_dir: Optional[Path] = None,
+        interval: float = 0.005,
+        top: int = 25,
+    ) -> None:
+        unknown = [mode for mode in modes if mode not in MODES]
+        if unknown:
+            raise ValueError(f"Unknown profiling modes: {', '.join(unknown)}.")
+        self.modes = tuple(modes)
+        self.label = label
+        self.output_dir = output_dir or profile_output_dir()
+        self.top = top
+        self.reports: List[Path] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[SamplingProfiler] = None
+        self._interval = interval
+        self._started_tracemalloc = False
+        self._started = 0.0
+
+    def __enter__(self) -> ProfileSession:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        if "tracemalloc" in self.modes and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            self._started_tracemalloc = True
+        if "sample" in self.modes:
+            self._sampler = SamplingProfiler(interval=self._interval)
+            self._sampler.start()
+        if "cprofile" in self.modes:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> List[Path]:
+        """Stop every profiler and write the reports; returns their paths."""
+
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / self.label
+        if self._profile is not None:
+            path = base.with_name(base.name + ".pstats")
+            self._profile.dump_stats(str(path))
+            self.reports.append(path)
+            self._profile = None
+        if self._sampler is not None:
+            path = base.with_name(base.name + ".collapsed.txt")
+            self.reports.append(self._sampler.write(path))
+            self._sampler = None
+        if "tracemalloc" in self.modes and tracemalloc.is_tracing():
+            path = base.with_name(base.name + ".alloc.txt")
+            self.reports.append(self._write_allocations(path))
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        return self.reports
+
+    def _write_allocations(self, path: Path) -> Path:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"# {self.label}: {time.perf_counter() - self._started:.3f}s, "
+            f"current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB",
+            f"# top {self.top} allocation sites by size",
+        ]
+        for rank, stat in enumerate(snapshot.statistics("lineno")[: self.top], 1):
+            frame = stat.traceback[0]
+            lines.append(
+                f"{rank:>3}. {stat.size / 1024:10.1f} KiB {stat.count:>8} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+
+Runner = Callable[[], Any]
+
+
+def profiled(
+    runner: Runner,
+    modes: Sequence[str],
+    *,
+    label: str,
+    output_dir: Optional[Path] = None,
+) -> Runner:
+    """Wrap *runner* so each call runs inside a `ProfileSession`."""
+
+    @functools.wraps(runner)
+    def wrapper() -> Any:
+        session = ProfileSession(
+            modes, label=f"{label}-{os.getpid()}", output_dir=output_dir
+        )
+        try:
+            with session:
+                return runner()
+        finally:
+            for path in session.reports:
+                print(f"Profile written to {path}", file=sys.stderr)
+
+    return wrapper
+
+
+__all__ = [
+    "MODES",
+    "PROFILE_DIR_ENV_VAR",
+    "PROFILE_ENV_VAR",
+    "ProfileSession",
+    "SamplingProfiler",
+    "parse_modes",
+    "profile_output_dir",
+    "profiled",
+]
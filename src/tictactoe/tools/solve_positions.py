@@ -0,0 +1,162 @@
+"""Solve every reachable 3x3 position and write the binary lookup table.
+
+The output feeds `tictactoe.domain.solved`, which memory-maps the file so
+best-move queries become a single index probe. Regenerate the shipped asset
+after changing the rules or the file layout::
+
+    python -m tictactoe.tools.solve_positions
+"""
+
+from __future__ import annotations
+
+import argparse
+from array import array
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from tictactoe.domain.bitboard import FULL_MASK, cell_line_masks
+from tictactoe.domain.logic import STANDARD_GEOMETRY
+from tictactoe.domain.solved import (
+    ENTRY,
+    HEADER,
+    SOLVED_TABLE_FILENAME,
+    SOLVED_TABLE_MAGIC,
+    SOLVED_TABLE_VERSION,
+    UNREACHABLE,
+    Outcome,
+    encode_entry,
+    position_index,
+)
+
+__all__ = ["build_table", "main", "solve_positions"]
+
+_CELLS = STANDARD_GEOMETRY.cells
+_CELL_MASKS = cell_line_masks(STANDARD_GEOMETRY)
+
+# (outcome, distance, best move) for the side to move.
+Solution = Tuple[Outcome, int, Optional[int]]
+
+
+def _rank(outcome: Outcome, distance: int) -> Tuple[int, int]:
+    # Prefer wins, then draws; win fast, lose slowly.
+    if outcome is Outcome.WIN:
+        return (2, -distance)
+    if outcome is Outcome.LOSS:
+        return (0, distance)
+    return (1, 0)
+
+
+def solve_positions() -> Dict[Tuple[int, int], Solution]:
+    """Return the solution of every reachable position keyed by bitboards.
+
+    Keys are ``(primary, secondary)`` bitboards. Terminal positions map to
+    ``(LOSS, 0, None)`` when the previous move won and ``(DRAW, 0, None)``
+    when the board filled up.
+    """
+
+    solutions: Dict[Tuple[int, int], Solution] = {}
+
+    def solve(primary: int, secondary: int, primary_to_move: bool) -> Solution:
+        key = (primary, secondary)
+        cached = solutions.get(key)
+        if cached is not None:
+            return cached
+        mine, theirs = (primary, secondary) if primary_to_move else (secondary, primary)
+        candidates: list[Solution] = []
+        for move in range(_CELLS):
+            bit = 1 << move
+            if (mine | theirs) & bit:
+                continue
+            placed = mine | bit
+            if any(placed & mask == mask for mask in _CELL_MASKS[move]):
+                candidate: Solution = (Outcome.WIN, 1, move)
+                child = None
+            elif placed | theirs == FULL_MASK:
+                candidate = (Outcome.DRAW, 1, move)
+                child = None
+            else:
+                child = (
+                    solve(placed, theirs, False)
+                    if primary_to_move
+                    else solve(theirs, placed, True)
+                )
+                flipped = {
+                    Outcome.WIN: Outcome.LOSS,
+                    Outcome.LOSS: Outcome.WIN,
+                    Outcome.DRAW: Outcome.DRAW,
+                }[child[0]]
+                candidate = (flipped, child[1] + 1, move)
+            if child is None:
+                # Record the terminal child so the table covers it as well.
+                terminal = (placed, theirs) if primary_to_move else (theirs, placed)
+                solutions[terminal] = (
+                    (Outcome.LOSS, 0, None)
+                    if candidate[0] is Outcome.WIN
+                    else (Outcome.DRAW, 0, None)
+                )
+            candidates.append(candidate)
+        best = max(candidates, key=lambda solution: _rank(solution[0], solution[1]))
+        solutions[key] = best
+        return best
+
+    solve(0, 0, True)
+    return solutions
+
+
+def build_table() -> bytes:
+    """Serialize the solved positions into the on-disk table format."""
+
+    solutions = solve_positions()
+    count = 3**_CELLS
+    entries = array("H", [UNREACHABLE]) * count
+    for (primary, secondary), (outcome, distance, move) in solutions.items():
+        entries[position_index(primary, secondary)] = encode_entry(
+            move, outcome, distance
+        )
+    header = HEADER.pack(
+        SOLVED_TABLE_MAGIC,
+        SOLVED_TABLE_VERSION,
+        STANDARD_GEOMETRY.width,
+        STANDARD_GEOMETRY.height,
+        STANDARD_GEOMETRY.k,
+        count,
+        len(solutions),
+    )
+    body = b"".join(ENTRY.pack(value) for value in entries)
+    return header + body
+
+
+def _default_output() -> Path:
+    return Path(__file__).resolve().parent.parent / "assets" / SOLVED_TABLE_FILENAME
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Solve every reachable 3x3 position and write the compact lookup "
+            "table used by tictactoe.domain.solved."
+        )
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Destination file (default: the packaged {SOLVED_TABLE_FILENAME}).",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    destination = args.output or _default_output()
+    payload = build_table()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_bytes(payload)
+    print(f"Wrote {len(payload)} bytes to {destination}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,375 @@
+"""Self-play tournaments between registered players, sharded across processes.
+
+Every game is described by a `GameSpec` carrying its own seed, so a result
+depends only on ``(base seed, game index)`` and never on which worker played
+it. Results stream to a JSON-lines file in game order while ratings are
+updated incrementally::
+
+    python -m tictactoe.tools.tournament --players random search mcts \\
+        --games 200 --workers 8 --output artifacts/tournament.jsonl
+
+Players are looked up by name in `PLAYERS` inside each worker, so custom
+entries must be registered at import time of a module the workers import.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import (
+    IO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from tictactoe.domain.kinarow import KInARowGame
+from tictactoe.domain.logic import STANDARD_GEOMETRY, BoardGeometry, GameState
+from tictactoe.domain.mcts import MCTSPlayer
+from tictactoe.domain.search import SearchEngine
+
+__all__ = [
+    "EloTable",
+    "GameResult",
+    "GameSpec",
+    "PLAYERS",
+    "Rating",
+    "main",
+    "play_game",
+    "register_player",
+    "run_tournament",
+    "schedule",
+]
+
+MoveChooser = Callable[[KInARowGame], int]
+PlayerFactory = Callable[[int], MoveChooser]
+
+PLAYERS: Dict[str, PlayerFactory] = {}
+
+
+def register_player(name: str, factory: PlayerFactory) -> None:
+    """Make *factory* (seed -> move chooser) available under *name*."""
+
+    PLAYERS[name] = factory
+
+
+def _random_player(seed: int) -> MoveChooser:
+    rng = random.Random(seed)
+    return lambda game: rng.choice(game.legal_moves())
+
+
+def _search_player(seed: int) -> MoveChooser:
+    # Depth-limited rather than timed so results do not depend on load.
+    engine = SearchEngine(time_budget=None, max_depth=4)
+    return lambda game: engine.best_move(game).move
+
+
+def _mcts_player(seed: int) -> MoveChooser:
+    player = MCTSPlayer(iterations=300, time_budget=None, seed=seed)
+    return lambda game: player.best_move(game).move
+
+
+register_player("random", _random_player)
+register_player("search", _search_player)
+register_player("mcts", _mcts_player)
+
+
+@dataclass(frozen=True)
+class GameSpec:
+    """One scheduled game; *primary* moves first."""
+
+    index: int
+    primary: str
+    secondary: str
+    seed: int
+    width: int
+    height: int
+    k: int
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """Outcome of a `GameSpec`; *score* is from the primary player's side."""
+
+    index: int
+    primary: str
+    secondary: str
+    seed: int
+    state: str
+    score: float
+    plies: int
+    moves: Tuple[int, ...]
+
+
+def game_seed(base_seed: int, index: int) -> int:
+    """Deterministic per-game seed, independent of scheduling order."""
+
+    return random.Random(f"tictactoe-tournament-{base_seed}-{index}").getrandbits(63)
+
+
+def schedule(
+    players: Sequence[str],
+    *,
+    games: int,
+    mode: str = "round-robin",
+    seed: int = 0,
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
+) -> List[GameSpec]:
+    """Build the list of games for a tournament.
+
+    ``round-robin`` pairs every player with every other; ``gauntlet`` pairs
+    the first player against each of the rest. Each pairing plays *games*
+    games with colours alternating.
+    """
+
+    unknown = [name for name in players if name not in PLAYERS]
+    if unknown:
+        raise ValueError(f"Unknown players: {', '.join(unknown)}.")
+    if len(players) < 2:
+        raise ValueError("A tournament needs at least two players.")
+    if mode == "round-robin":
+        pairings = [
+            (players[i], players[j])
+            for i in range(len(players))
+            for j in range(i + 1, len(players))
+        ]
+    elif mode == "gauntlet":
+        pairings = [(players[0], rival) for rival in players[1:]]
+    else:
+        raise ValueError(f"Unknown tournament mode {mode!r}.")
+
+    specs: List[GameSpec] = []
+    for first, second in pairings:
+        for game in range(games):
+            primary, secondary = (first, second) if game % 2 == 0 else (second, first)
+            index = len(specs)
+            specs.append(
+                GameSpec(
+                    index=index,
+                    primary=primary,
+                    secondary=secondary,
+                    seed=game_seed(seed, index),
+                    width=geometry.width,
+                    height=geometry.height,
+                    k=geometry.k,
+                )
+            )
+    return specs
+
+
+_SCORES = {GameState.X_WON: 1.0, GameState.O_WON: 0.0, GameState.DRAW: 0.5}
+
+
+def play_game(spec: GameSpec) -> GameResult:
+    """Play one game to the end; runs inside worker processes."""
+
+    game = KInARowGame(BoardGeometry(spec.width, spec.height, spec.k))
+    seeds = random.Random(spec.seed)
+    choosers = (
+        PLAYERS[spec.primary](seeds.getrandbits(63)),
+        PLAYERS[spec.secondary](seeds.getrandbits(63)),
+    )
+    moves: List[int] = []
+    while game.state is GameState.PLAYING:
+        move = choosers[len(moves) % 2](game)
+        if not game.make_move(move):
+            raise ValueError(f"Player returned illegal move {move!r}.")
+        moves.append(move)
+    return GameResult(
+        index=spec.index,
+        primary=spec.primary,
+        secondary=spec.secondary,
+        seed=spec.seed,
+        state=game.state.value,
+        score=_SCORES[game.state],
+        plies=len(moves),
+        moves=tuple(moves),
+    )
+
+
+@dataclass(frozen=True)
+class Rating:
+    """Elo estimate with a confidence interval derived from the score rate."""
+
+    name: str
+    elo: float
+    lower: float
+    upper: float
+    games: int
+    score: float
+
+
+def _elo_from_score(score: float) -> float:
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+class EloTable:
+    """Online Elo ratings plus running score moments for confidence bounds.
+
+    Each `update` is O(1): the rating moves by ``k_factor * (actual -
+    expected)`` and the per-player count, sum, and sum of squares of game
+    scores are extended. The interval brackets the rating by the Elo spread
+    that a ``z``-sigma change in the player's mean score would imply.
+    """
+
+    def __init__(
+        self, *, initial: float = 1500.0, k_factor: float = 16.0, z: float = 1.96
+    ) -> None:
+        self.initial = initial
+        self.k_factor = k_factor
+        self.z = z
+        self._ratings: Dict[str, float] = {}
+        self._moments: Dict[str, List[float]] = {}
+
+    def update(self, primary: str, secondary: str, score: float) -> None:
+        """Record a game where *primary* scored *score* (1, 0.5 or 0)."""
+
+        first = self._ratings.setdefault(primary, self.initial)
+        second = self._ratings.setdefault(secondary, self.initial)
+        expected = 1.0 / (1.0 + 10 ** ((second - first) / 400.0))
+        delta = self.k_factor * (score - expected)
+        self._ratings[primary] = first + delta
+        self._ratings[secondary] = second - delta
+        for name, value in ((primary, score), (secondary, 1.0 - score)):
+            moments = self._moments.setdefault(name, [0.0, 0.0, 0.0])
+            moments[0] += 1
+            moments[1] += value
+            moments[2] += value * value
+
+    def rating(self, name: str) -> Rating:
+        count, total, squares = self._moments.get(name, (0.0, 0.0, 0.0))
+        elo = self._ratings.get(name, self.initial)
+        if not count:
+            return Rating(name, elo, -math.inf, math.inf, 0, 0.0)
+        mean = total / count
+        variance = max(squares / count - mean * mean, 0.0)
+        margin = self.z * math.sqrt(variance / count)
+        centre = _elo_from_score(mean)
+        lower = elo - (centre - _elo_from_score(mean - margin))
+        upper = elo + (_elo_from_score(mean + margin) - centre)
+        return Rating(name, elo, lower, upper, int(count), mean)
+
+    def standings(self) -> List[Rating]:
+        return sorted(
+            (self.rating(name) for name in self._ratings),
+            key=lambda rating: rating.elo,
+            reverse=True,
+        )
+
+
+def _results(
+    specs: Sequence[GameSpec], workers: int, chunk_size: int
+) -> Iterator[GameResult]:
+    if workers <= 1:
+        yield from map(play_game, specs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # `map` keeps game order; chunking amortises the per-task IPC cost.
+        yield from executor.map(play_game, specs, chunksize=chunk_size)
+
+
+def run_tournament(
+    specs: Sequence[GameSpec],
+    *,
+    workers: int = 1,
+    output: Optional[IO[str]] = None,
+    table: Optional[EloTable] = None,
+    chunk_size: Optional[int] = None,
+) -> EloTable:
+    """Play *specs*, streaming each result to *output* as one JSON line."""
+
+    table = table or EloTable()
+    if chunk_size is None:
+        chunk_size = max(1, len(specs) // (max(workers, 1) * 8))
+    for result in _results(specs, workers, chunk_size):
+        table.update(result.primary, result.secondary, result.score)
+        if output is not None:
+            output.write(json.dumps(asdict(result)) + "\n")
+            output.flush()
+    return table
+
+
+def render_standings(standings: Iterable[Rating]) -> str:
+    lines = [f"{'player':<12} {'elo':>7} {'95% CI':>17} {'games':>6} {'score':>6}"]
+    for rating in standings:
+        interval = f"[{rating.lower:7.1f}, {rating.upper:7.1f}]"
+        lines.append(
+            f"{rating.name:<12} {rating.elo:7.1f} {interval:>17} "
+            f"{rating.games:6d} {rating.score:6.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run a self-play tournament and report Elo ratings."
+    )
+    parser.add_argument(
+        "--players",
+        nargs="+",
+        default=["random", "search", "mcts"],
+        help=f"Registered player names (available: {', '.join(sorted(PLAYERS))}).",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("round-robin", "gauntlet"),
+        default="round-robin",
+        help="Gauntlet pairs the first player against every other one.",
+    )
+    parser.add_argument(
+        "--games", type=int, default=20, help="Games per pairing (default: 20)."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes (default: 1)."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Base seed.")
+    parser.add_argument(
+        "--board", default=STANDARD_GEOMETRY.label, help="WIDTHxHEIGHT."
+    )
+    parser.add_argument("--win-length", type=int, default=STANDARD_GEOMETRY.k)
+    parser.add_argument(
+        "--output", type=Path, help="JSON-lines file receiving every game result."
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        geometry = BoardGeometry.parse(args.board, args.win_length)
+        specs = schedule(
+            args.players,
+            games=args.games,
+            mode=args.mode,
+            seed=args.seed,
+            geometry=geometry,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("w", encoding="utf-8") as handle:
+            table = run_tournament(specs, workers=args.workers, output=handle)
+    else:
+        table = run_tournament(specs, workers=args.workers)
+    print(render_standings(table.standings()), file=sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,207 @@
+"""Lightweight tracing spans exported as Chrome/Perfetto trace-event JSON.
+
+Spans nest through a `contextvars.ContextVar`, so a click handled by the
+controller, the engine's ``make_move``, listener fan-out, and the view's
+``render`` end up as one tree without passing anything explicitly::
+
+    tracer = start_tracing()
+    ...  # play
+    stop_tracing()
+    tracer.write(Path("artifacts/trace.json"))  # open in ui.perfetto.dev
+
+While no tracer is active `span` returns a shared no-op context manager.
+Per-move paths go further and test ``tracing.ENABLED`` first, so disabled
+tracing costs them one module attribute read.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "tictactoe_span", default=None
+)
+_tracer: Optional[Tracer] = None
+# Mirrors ``_tracer is not None`` for hot paths that read it as
+# ``tracing.ENABLED`` and skip the ``with`` block entirely.
+ENABLED = False
+
+
+class Span:
+    """One timed region; used as a context manager."""
+
+    __slots__ = (
+        "_token",
+        "_tracer",
+        "args",
+        "category",
+        "end",
+        "name",
+        "parent_id",
+        "span_id",
+        "start",
+        "thread_id",
+    )
+
+    def __init__(
+        self, tracer: Tracer, name: str, category: str, args: Dict[str, Any]
+    ) -> None:
+        self._tracer = tracer
+        self._token: Optional[contextvars.Token[Optional[Span]]] = None
+        self.name = name
+        self.category = category
+        self.args = args
+        self.span_id = next(tracer._ids)
+        self.parent_id: Optional[int] = None
+        self.thread_id = 0
+        self.start = 0
+        self.end = 0
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end - self.start
+
+    def __enter__(self) -> Span:
+        parent = _current.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.thread_id = threading.get_ident()
+        self._token = _current.set(self)
+        self.start = self._tracer.clock()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.end = self._tracer.clock()
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        if exc_info[0] is not None:
+            self.args["error"] = exc_info[0].__name__
+        self._tracer._finished.append(self)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects finished spans in a bounded buffer (oldest dropped first)."""
+
+    def __init__(self, *, capacity: int = 100_000, clock: Any = None) -> None:
+        self.clock = clock or time.perf_counter_ns
+        self._ids = itertools.count(1)
+        self._finished: Deque[Span] = deque(maxlen=capacity)
+
+    def span(self, name: str, category: str = "app", **args: Any) -> Span:
+        return Span(self, name, category, args)
+
+    @property
+    def spans(self) -> List[Span]:
+        return list(self._finished)
+
+    def clear(self) -> None:
+        self._finished.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Trace-event JSON object with one complete (``ph: X``) event per span."""
+
+        pid = os.getpid()
+        events = []
+        for item in sorted(self._finished, key=lambda span: span.start):
+            args = dict(item.args)
+            args["span_id"] = item.span_id
+            if item.parent_id is not None:
+                args["parent_id"] = item.parent_id
+            events.append(
+                {
+                    "name": item.name,
+                    "cat": item.category,
+                    "ph": "X",
+                    "ts": item.start / 1000.0,
+                    "dur": item.duration_ns / 1000.0,
+                    "pid": pid,
+                    "tid": item.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8"
+        )
+        return path
+
+
+def start_tracing(tracer: Optional[Tracer] = None) -> Tracer:
+    """Make *tracer* (or a new one) receive every span; returns it."""
+
+    global _tracer, ENABLED
+    _tracer = tracer or Tracer()
+    ENABLED = True
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop collecting; returns the tracer that was active, if any."""
+
+    global _tracer, ENABLED
+    tracer, _tracer = _tracer, None
+    ENABLED = False
+    return tracer
+
+
+def active_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def span(name: str, category: str = "app", **args: Any) -> Any:
+    """Context manager timing *name*; a no-op while tracing is off."""
+
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def callable_name(target: Any) -> str:
+    """Readable span name for a listener or callback."""
+
+    name = getattr(target, "__qualname__", None)
+    if name is None:
+        name = type(target).__qualname__
+    return str(name)
+
+
+__all__ = [
+    "ENABLED",
+    "Span",
+    "Tracer",
+    "active_tracer",
+    "callable_name",
+    "current_span",
+    "span",
+    "start_tracing",
+    "stop_tracing",
+]
@@ -10,10 +10,17 @@ from typing import Any, Iterable, Mapping, MutableMapping, Sequence
 
 from tictactoe.controller import (
     ControllerHooks,
+    configure_hooks,
     logging_hooks,
     telemetry_logging_requested,
 )
-from tictactoe.domain.logic import ExampleAction, TicTacToe
+from tictactoe.domain.logic import (
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    ExampleAction,
+    TicTacToe,
+)
+from tictactoe.domain.replay import ActionLog
 
 
 @dataclass(frozen=True)
@@ -30,7 +37,8 @@ _CLI_TELEMETRY_ENV_VAR = "TICTACTOE_CLI_LOGGING"
 
 
 def _env_controller_hooks(flag: str = _CLI_TELEMETRY_ENV_VAR) -> ControllerHooks | None:
-    return logging_hooks() if telemetry_logging_requested(flag) else None
+    hooks = logging_hooks() if telemetry_logging_requested(flag) else None
+    return configure_hooks(hooks, flag)
 
 
 def _emit_view_event(
@@ -82,6 +90,32 @@ def _build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional path that will receive the automation summary as JSON.",
     )
+    parser.add_argument(
+        "--action-log",
+        type=Path,
+        help="Optional path that will receive the applied actions as JSON lines.",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        help="Replay a recorded action log instead of running a script.",
+    )
+    parser.add_argument(
+        "--seek",
+        type=int,
+        help="With --replay, stop after this many actions (default: all).",
+    )
+    parser.add_argument(
+        "--board",
+        default=STANDARD_GEOMETRY.label,
+        help="Board dimensions as WIDTHxHEIGHT (default: 3x3).",
+    )
+    parser.add_argument(
+        "--win-length",
+        type=positive_int,
+        default=STANDARD_GEOMETRY.k,
+        help="Cells in a row required to win (default: 3).",
+    )
     parser.add_argument(
         "--label",
         default="cli-script",
@@ -95,7 +129,7 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def parse_script(script: str) -> list[int]:
+def parse_script(script: str, geometry: BoardGeometry = STANDARD_GEOMETRY) -> list[int]:
     """Convert comma separated positions into integers with validation."""
 
     tokens = [token.strip() for token in script.split(",") if token.strip()]
@@ -104,23 +138,45 @@ def parse_script(script: str) -> list[int]:
     moves: list[int] = []
     for token in tokens:
         value = int(token)
-        if value < 0 or value > 8:
-            raise ValueError("Moves must be between 0 and 8.")
+        if not geometry.contains(value):
+            raise ValueError(f"Moves must be between 0 and {geometry.cells - 1}.")
         moves.append(value)
     return moves
 
 
+def positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1."""
+
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text!r}")
+    return value
+
+
+def resolve_geometry(board: str, win_length: int) -> BoardGeometry:
+    """Build the geometry described by ``--board``/``--win-length`` flags."""
+
+    return BoardGeometry.parse(board, win_length)
+
+
 def _load_script_from_file(path: Path) -> str:
     if not path.exists():  # pragma: no cover - defensive
         raise FileNotFoundError(path)
     return path.read_text(encoding="utf-8")
 
 
-def _resolve_moves(script: str | None, script_file: Path | None) -> list[int] | None:
+def _resolve_moves(
+    script: str | None,
+    script_file: Path | None,
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
+) -> list[int] | None:
     if script:
-        return parse_script(script)
+        return parse_script(script, geometry)
     if script_file:
-        return parse_script(_load_script_from_file(script_file))
+        return parse_script(_load_script_from_file(script_file), geometry)
     return None
 
 
@@ -129,6 +185,7 @@ def build_automation_summary(
     *,
     label: str,
     metadata: Mapping[str, str] | None = None,
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
 ) -> AutomationSummary:
     """Wrap the provided moves inside ExampleAction placeholders."""
 
@@ -144,13 +201,14 @@ def build_automation_summary(
     )
     base_metadata: MutableMapping[str, str] = {
         "action_count": str(len(actions)),
-        "board_size": "3x3",
+        "board_size": geometry.label,
+        "win_length": str(geometry.k),
     }
     if metadata:
         base_metadata.update(metadata)
 
     notes = (
-        "TODO: Replace ExampleAction with calls into your domain layer.",
+        "Actions are dispatched to the domain engine; see final_state/winner.",
         "TODO: Extend AutomationSummary to capture the outputs your CI needs.",
     )
     return AutomationSummary(
@@ -217,6 +275,49 @@ def _print_placeholder_help() -> None:
             print(f"  * {note}")
 
 
+def outcome_metadata(game: TicTacToe) -> dict[str, str]:
+    """Describe where a played or replayed game ended up.
+
+    ``ply`` counts the moves on the board, which stays correct after seeks,
+    undo, and resets in the log.
+    """
+
+    winner = game.get_winner()
+    return {
+        "ply": str(sum(cell is not None for cell in game.board)),
+        "final_state": game.state.value,
+        "winner": winner.value if winner else "none",
+    }
+
+
+def _publish_summary(
+    summary: AutomationSummary,
+    *,
+    quiet: bool,
+    output_json: Path | None,
+    controller_hooks: ControllerHooks | None,
+) -> None:
+    label = summary.label
+    if not quiet:
+        rendered = render_summary(summary)
+        print(rendered)
+        _emit_view_event(
+            controller_hooks,
+            "summary_rendered",
+            label=label,
+            line_count=rendered.count("\n") + 1,
+        )
+
+    if output_json:
+        write_summary_json(summary, output_json)
+        _emit_view_event(
+            controller_hooks,
+            "summary_written",
+            label=label,
+            path=str(output_json),
+        )
+
+
 def run_script(
     moves: Iterable[int],
     *,
@@ -224,7 +325,14 @@ def run_script(
     quiet: bool = False,
     output_json: Path | None = None,
     controller_hooks: ControllerHooks | None = None,
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
+    action_log: Path | None = None,
 ) -> AutomationSummary:
+    """Play *moves* on a fresh engine and summarize the result.
+
+    Raises ValueError when a move is illegal in the position it reaches.
+    """
+
     moves_tuple = tuple(moves)
     _emit_view_event(
         controller_hooks,
@@ -232,7 +340,22 @@ def run_script(
         label=label,
         action_count=len(moves_tuple),
     )
-    summary = build_automation_summary(moves_tuple, label=label)
+    actions = build_automation_summary(
+        moves_tuple, label=label, geometry=geometry
+    ).actions
+    log = ActionLog(geometry)
+    game = log.new_game()
+    log.attach(game)
+    try:
+        game.dispatch_actions(actions)
+    finally:
+        log.detach()
+    summary = build_automation_summary(
+        moves_tuple,
+        label=label,
+        metadata=outcome_metadata(game),
+        geometry=geometry,
+    )
     _emit_domain_event(
         controller_hooks,
         "automation_summary_ready",
@@ -240,25 +363,68 @@ def run_script(
         action_count=len(summary.actions),
     )
 
-    if not quiet:
-        rendered = render_summary(summary)
-        print(rendered)
+    _publish_summary(
+        summary,
+        quiet=quiet,
+        output_json=output_json,
+        controller_hooks=controller_hooks,
+    )
+    if action_log:
+        log.write(action_log)
         _emit_view_event(
-            controller_hooks,
-            "summary_rendered",
-            label=label,
-            line_count=rendered.count("\n") + 1,
+            controller_hooks, "action_log_written", label=label, path=str(action_log)
         )
 
-    if output_json:
-        write_summary_json(summary, output_json)
-        _emit_view_event(
-            controller_hooks,
-            "summary_written",
-            label=label,
-            path=str(output_json),
-        )
+    return summary
+
 
+def replay_log(
+    source: Path,
+    *,
+    label: str,
+    ply: int | None = None,
+    quiet: bool = False,
+    output_json: Path | None = None,
+    controller_hooks: ControllerHooks | None = None,
+) -> AutomationSummary:
+    """Deterministically replay a recorded action log up to *ply* actions."""
+
+    log = ActionLog.read(source)
+    target = len(log) if ply is None else ply
+    _emit_view_event(
+        controller_hooks,
+        "replay_started",
+        label=label,
+        action_count=len(log),
+        ply=target,
+    )
+    game = log.seek(target)
+    applied = log.actions[:target]
+    metadata: dict[str, str] = {
+        "action_count": str(len(applied)),
+        "board_size": log.geometry.label,
+        "win_length": str(log.geometry.k),
+        "replayed_from": str(source),
+        **outcome_metadata(game),
+    }
+    summary = AutomationSummary(
+        label=label,
+        actions=applied,
+        metadata=metadata,
+        notes=("Replayed from a recorded action log.",),
+    )
+    _emit_domain_event(
+        controller_hooks,
+        "automation_summary_ready",
+        label=label,
+        action_count=len(summary.actions),
+    )
+    _publish_summary(
+        summary,
+        quiet=quiet,
+        output_json=output_json,
+        controller_hooks=controller_hooks,
+    )
     return summary
 
 
@@ -271,8 +437,24 @@ def main(
     args = parser.parse_args(argv)
     hooks = controller_hooks or _env_controller_hooks()
 
+    if args.replay:
+        try:
+            replay_log(
+                args.replay,
+                label=args.label,
+                ply=args.seek,
+                quiet=args.quiet,
+                output_json=args.output_json,
+                controller_hooks=hooks,
+            )
+        except (OSError, ValueError) as exc:
+            _report_controller_error(hooks, exc, action="replay_log")
+            raise SystemExit(str(exc)) from exc
+        return 0
+
     try:
-        moves = _resolve_moves(args.script, args.script_file)
+        geometry = resolve_geometry(args.board, args.win_length)
+        moves = _resolve_moves(args.script, args.script_file, geometry)
     except ValueError as exc:
         _report_controller_error(hooks, exc, action="parse_script")
         raise SystemExit(str(exc)) from exc
@@ -281,13 +463,19 @@ def main(
         _print_placeholder_help()
         return 0
 
-    run_script(
-        moves,
-        label=args.label,
-        quiet=args.quiet,
-        output_json=args.output_json,
-        controller_hooks=hooks,
-    )
+    try:
+        run_script(
+            moves,
+            label=args.label,
+            quiet=args.quiet,
+            output_json=args.output_json,
+            controller_hooks=hooks,
+            geometry=geometry,
+            action_log=args.action_log,
+        )
+    except ValueError as exc:
+        _report_controller_error(hooks, exc, action="run_script")
+        raise SystemExit(str(exc)) from exc
     return 0
 
 
@@ -295,8 +483,12 @@ __all__ = [
     "AutomationSummary",
     "build_automation_summary",
     "main",
+    "outcome_metadata",
+    "positive_int",
     "parse_script",
     "render_summary",
+    "replay_log",
+    "resolve_geometry",
     "run_script",
     "write_summary_json",
 ]
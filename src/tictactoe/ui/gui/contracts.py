@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Protocol, runtime_checkable
 
-from tictactoe.domain.logic import GameSnapshot
+from tictactoe.domain.logic import GameSnapshot, StateDelta
 
 
 @runtime_checkable
@@ -44,7 +44,11 @@ class ResetControl(Protocol):
 
 
 class GameViewPort(Protocol):
-    """High-level facade the controller and tests interact with."""
+    """High-level facade the controller and tests interact with.
+
+    This is all a view must provide. Incremental repainting is the separate,
+    optional `SupportsDeltaRender` capability.
+    """
 
     def build(self) -> None: ...
 
@@ -61,3 +65,15 @@ class GameViewPort(Protocol):
     def status_text(self) -> str: ...
 
     def reset_button_label(self) -> str: ...
+
+
+@runtime_checkable
+class SupportsDeltaRender(Protocol):
+    """Optional view capability: repaint from a `StateDelta` in O(changed).
+
+    `render_delta` returns False when the view is not at the delta's base
+    version; the controller then falls back to a full `render`. Views without
+    it keep receiving full snapshots.
+    """
+
+    def render_delta(self, delta: StateDelta) -> bool: ...
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Callable, List, Sequence
+from typing import Callable, List, Optional, Sequence
 
+from tictactoe import tracing
 from tictactoe.config import GameViewConfig
-from tictactoe.domain.logic import GameSnapshot, GameState
+from tictactoe.domain.logic import (
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    GameSnapshot,
+    GameState,
+    Player,
+    StateDelta,
+)
 from tictactoe.ui.gui.contracts import GameViewPort
 
 
@@ -20,14 +28,19 @@ class HeadlessGameView(GameViewPort):
         on_cell_click: Callable[[int], None],
         on_reset: Callable[[], None],
         view_config: GameViewConfig | None = None,
+        geometry: BoardGeometry = STANDARD_GEOMETRY,
     ) -> None:
         del ctk_module, root  # unused but kept for signature compatibility
         self._on_cell_click = on_cell_click
         self._on_reset = on_reset
         self.config = view_config or GameViewConfig()
+        self.geometry = geometry
 
         self._built = False
-        self._cells: List[dict[str, str]] = [self._make_empty_cell() for _ in range(9)]
+        self._rendered_version = 0
+        self._cells: List[dict[str, str]] = [
+            self._make_empty_cell() for _ in range(geometry.cells)
+        ]
         self._status_text = ""
         self._reset_label = self.config.text.reset_button
 
@@ -40,9 +53,26 @@ class HeadlessGameView(GameViewPort):
     def render(self, snapshot: GameSnapshot) -> None:
         if not self.is_ready():
             return
+        if snapshot.version and snapshot.version == self._rendered_version:
+            return
+
+        with tracing.span("render", "view", version=snapshot.version):
+            self._render_board(snapshot.board)
+            self._status_text = self._status_message(snapshot)
+        self._rendered_version = snapshot.version
+
+    def render_delta(self, delta: StateDelta) -> bool:
+        if not self.is_ready() or delta.base_version != self._rendered_version:
+            return False
 
-        self._render_board(snapshot.board)
-        self._status_text = self._status_message(snapshot)
+        with tracing.span("render_delta", "view", version=delta.version):
+            cells = self._cells
+            for change in delta.cells:
+                self._render_cell(cells[change.position], change.current)
+            if delta.status_changed:
+                self._status_text = self._status_message(delta)
+        self._rendered_version = delta.version
+        return True
 
     def cell_count(self) -> int:
         self._ensure_built()
@@ -76,14 +106,15 @@ class HeadlessGameView(GameViewPort):
     # ------------------------------------------------------------------
     def _render_board(self, board: Sequence) -> None:
         for position in range(len(self._cells)):
-            cell_value = board[position]
-            target = self._cells[position]
-            if cell_value is None:
-                target.update(text="", state="normal")
-            else:
-                target.update(text=cell_value.value, state="disabled")
-
-    def _status_message(self, snapshot: GameSnapshot) -> str:
+            self._render_cell(self._cells[position], board[position])
+
+    def _render_cell(self, target: dict[str, str], cell: Optional[Player]) -> None:
+        if cell is None:
+            target.update(text="", state="normal")
+        else:
+            target.update(text=cell.value, state="disabled")
+
+    def _status_message(self, snapshot: GameSnapshot | StateDelta) -> str:
         if snapshot.state == GameState.PLAYING:
             player = snapshot.current_player.value if snapshot.current_player else "?"
             return self.config.text.turn_message_template.format(player=player)
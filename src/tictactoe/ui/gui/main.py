@@ -4,17 +4,28 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple, cast
 
+from tictactoe import tracing
 from tictactoe.config import GameViewConfig, WindowConfig, deserialize_game_view_config
 from tictactoe.controller import (
     ControllerHooks,
+    configure_hooks,
     logging_hooks,
     telemetry_logging_requested,
 )
-from tictactoe.domain.logic import GameSnapshot, TicTacToe
+from tictactoe.domain.listeners import ListenerStats
+from tictactoe.domain.logic import (
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    GameSnapshot,
+    GameState,
+    Player,
+    StateDelta,
+    TicTacToe,
+)
 from tictactoe.ui.gui import bootstrap
-from tictactoe.ui.gui.contracts import GameViewPort
+from tictactoe.ui.gui.contracts import GameViewPort, SupportsDeltaRender
 from tictactoe.ui.gui.theme import apply_default_theme
 from tictactoe.ui.gui.view import GameView
 
@@ -22,6 +33,7 @@ bootstrap.configure_windows_app_model()
 
 _THEME_PAYLOAD_ENV_VAR = "TICTACTOE_THEME_PAYLOAD"
 _GUI_TELEMETRY_ENV_VAR = "TICTACTOE_GUI_LOGGING"
+_SLOW_LISTENER_ENV_VAR = "TICTACTOE_SLOW_LISTENER_MS"
 
 
 def _telemetry_logging_requested() -> bool:
@@ -41,10 +53,28 @@ def _theme_from_env() -> Optional[GameViewConfig]:
     except Exception:
         return None
 
+
+def _slow_listener_threshold_from_env() -> Optional[float]:
+    raw = os.environ.get(_SLOW_LISTENER_ENV_VAR, "").strip()
+    if not raw:
+        return None
+    try:
+        milliseconds = float(raw)
+    except ValueError:
+        return None
+    return milliseconds / 1000.0 if milliseconds >= 0 else None
+
+
 GameFactory = Callable[[], TicTacToe]
 
 
 class ViewFactory(Protocol):
+    """Builds the view; the result only has to satisfy `GameViewPort`.
+
+    Views that also implement `SupportsDeltaRender` are repainted from
+    deltas, all others from full snapshots.
+    """
+
     def __call__(
         self,
         *,
@@ -53,6 +83,7 @@ class ViewFactory(Protocol):
         on_cell_click: Callable[[int], None],
         on_reset: Callable[[], None],
         view_config: GameViewConfig,
+        geometry: BoardGeometry = STANDARD_GEOMETRY,
     ) -> GameViewPort: ...
 
 
@@ -63,6 +94,7 @@ def _build_default_view(
     on_cell_click: Callable[[int], None],
     on_reset: Callable[[], None],
     view_config: GameViewConfig,
+    geometry: BoardGeometry = STANDARD_GEOMETRY,
 ) -> GameView:
     """Create the default GameView instance."""
 
@@ -72,9 +104,30 @@ def _build_default_view(
         on_cell_click=on_cell_click,
         on_reset=on_reset,
         view_config=view_config,
+        geometry=geometry,
     )
 
 
+def _snapshot_payload(snapshot: GameSnapshot) -> Dict[str, Any]:
+    return _status_payload(
+        snapshot.state, snapshot.current_player, snapshot.winner, snapshot.notes
+    )
+
+
+def _status_payload(
+    state: GameState,
+    current_player: Optional[Player],
+    winner: Optional[Player],
+    notes: Tuple[str, ...],
+) -> Dict[str, Any]:
+    return {
+        "state": state.value,
+        "current_player": current_player.value if current_player else None,
+        "winner": winner.value if winner else None,
+        "notes": len(notes),
+    }
+
+
 class TicTacToeGUI:
     """Main GUI application for Tic Tac Toe."""
 
@@ -92,11 +145,19 @@ class TicTacToeGUI:
         self._game_factory = game_factory or TicTacToe
         self._view_factory = view_factory or _build_default_view
         self._controller_hooks = controller_hooks
+        # Resolved once so disabled events cost one attribute check per call.
+        self._click_events = bool(
+            controller_hooks and controller_hooks.enabled("view", "cell_click")
+        )
+        self._snapshot_events = bool(
+            controller_hooks and controller_hooks.enabled("domain", "snapshot")
+        )
         self.window_config = window_config or WindowConfig()
         env_view_config = _theme_from_env()
         self.view_config = view_config or env_view_config or GameViewConfig()
 
         self.game = self._game_factory()
+        self._monitor_listeners(_slow_listener_threshold_from_env())
         self._ctk_env = bootstrap.load_customtkinter()
         self.ctk = self._ctk_env.module
         self._ctk_headless = self._ctk_env.headless
@@ -113,12 +174,17 @@ class TicTacToeGUI:
             self.root, self.icon_path, headless=self._ctk_headless
         )
 
+        view_kwargs: Dict[str, Any] = {}
+        if self.game.geometry != STANDARD_GEOMETRY:
+            # Only non-3x3 games need it, so older factories keep working.
+            view_kwargs["geometry"] = self.game.geometry
         self.view = self._view_factory(
             ctk_module=self.ctk,
             root=self.root,
             on_cell_click=self._on_cell_click,
             on_reset=self._reset_game,
             view_config=self.view_config,
+            **view_kwargs,
         )
         self.view.build()
         self._emit_view_event(
@@ -127,9 +193,35 @@ class TicTacToeGUI:
             theme=self.view_config.text.title,
         )
 
-        self.game.add_listener(self._on_game_updated)
+        if isinstance(self.view, SupportsDeltaRender):
+            self.game.add_delta_listener(self._on_game_delta)
+        else:
+            self.game.add_listener(self._on_game_updated)
         self._on_game_updated(self.game.snapshot)
 
+    def _monitor_listeners(self, threshold: Optional[float]) -> None:
+        """Report listeners slower than *threshold* seconds as telemetry."""
+
+        hooks = self._controller_hooks
+        if threshold is None or not (
+            hooks and hooks.enabled("domain", "slow_listener")
+        ):
+            return
+
+        def on_slow(stats: ListenerStats, seconds: float) -> None:
+            hooks.emit(
+                "domain",
+                "slow_listener",
+                listener=stats.name,
+                elapsed=seconds,
+                calls=stats.calls,
+                slow_calls=stats.slow_calls,
+                total_seconds=stats.total_seconds,
+            )
+
+        # Listeners here touch Tk widgets, so they stay on the UI thread.
+        self.game.enable_listener_monitoring(slow_threshold=threshold, on_slow=on_slow)
+
     def _create_root(self):
         """Create the root window with fallback to headless widgets."""
 
@@ -141,30 +233,47 @@ class TicTacToeGUI:
 
     def _on_cell_click(self, position: int):
         """Handle cell button click."""
-        self._emit_view_event("cell_click", position=position)
-        try:
-            self.game.make_move(position)
-        except Exception as exc:
-            self._report_controller_error(exc, action="cell_click", position=position)
-            raise
+        if self._click_events:
+            self._emit_view_event("cell_click", position=position)
+        with tracing.span("cell_click", "controller", position=position):
+            try:
+                self.game.make_move(position)
+            except Exception as exc:
+                self._report_controller_error(
+                    exc, action="cell_click", position=position
+                )
+                raise
 
     def _on_game_updated(self, snapshot: GameSnapshot) -> None:
         """Render the latest game snapshot to the UI widgets."""
 
-        self._emit_domain_event(
-            "snapshot",
-            state=snapshot.state.value,
-            current_player=snapshot.current_player.value
-            if snapshot.current_player
-            else None,
-            winner=snapshot.winner.value if snapshot.winner else None,
-            notes=len(snapshot.notes),
-        )
+        hooks = self._controller_hooks
+        if self._snapshot_events and hooks is not None:
+            hooks.emit_lazy("domain", "snapshot", lambda: _snapshot_payload(snapshot))
         if not self.view.is_ready():
             return
 
         self.view.render(snapshot)
 
+    def _on_game_delta(self, delta: StateDelta) -> None:
+        """Repaint only what *delta* changed, or everything if out of step."""
+
+        hooks = self._controller_hooks
+        if self._snapshot_events and hooks is not None:
+            # Built from the delta's status fields: the full snapshot would
+            # copy the board on every move.
+            notes = self.game.notes
+            hooks.emit_lazy(
+                "domain",
+                "snapshot",
+                lambda: _status_payload(
+                    delta.state, delta.current_player, delta.winner, notes
+                ),
+            )
+        view = cast(SupportsDeltaRender, self.view)
+        if not view.render_delta(delta):
+            self.view.render(self.game.snapshot)
+
     def _reset_game(self):
         """Reset the game to initial state."""
         self._emit_view_event("reset_requested")
@@ -202,7 +311,10 @@ class TicTacToeGUI:
 
 def main():
     """Entry point for the GUI application."""
-    hooks = logging_hooks() if _telemetry_logging_requested() else None
+    hooks = configure_hooks(
+        logging_hooks() if _telemetry_logging_requested() else None,
+        _GUI_TELEMETRY_ENV_VAR,
+    )
     app = TicTacToeGUI(controller_hooks=hooks)
     app.run()
 
@@ -4,8 +4,16 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, Optional, Sequence, cast
 
+from tictactoe import tracing
 from tictactoe.config import FontSpec, GameViewConfig
-from tictactoe.domain.logic import GameSnapshot, GameState, Player
+from tictactoe.domain.logic import (
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    GameSnapshot,
+    GameState,
+    Player,
+    StateDelta,
+)
 from tictactoe.ui.gui.contracts import (
     CellButton,
     GameViewPort,
@@ -25,12 +33,14 @@ class GameView(GameViewPort):
         on_cell_click: Callable[[int], None],
         on_reset: Callable[[], None],
         view_config: GameViewConfig | None = None,
+        geometry: BoardGeometry = STANDARD_GEOMETRY,
     ) -> None:
         self.ctk: Any = ctk_module
         self.root: Any = root
         self._on_cell_click = on_cell_click
         self._on_reset = on_reset
         self.config = view_config or GameViewConfig()
+        self.geometry = geometry
 
         self.title_label: SupportsText | None = None
         self.status_label: SupportsText | None = None
@@ -38,6 +48,7 @@ class GameView(GameViewPort):
         self.reset_button: ResetControl | None = None
         self.buttons: list[CellButton] = []
         self._built = False
+        self._rendered_version = 0
 
     def build(self) -> None:
         """Construct all widgets for the application."""
@@ -78,10 +89,11 @@ class GameView(GameViewPort):
         self._built = True
 
     def _build_board(self, font_button: Any) -> None:
-        """Create the 3x3 grid of buttons."""
+        """Create one button per cell of the configured geometry."""
 
         self.buttons = []
-        for position in range(9):
+        width = self.geometry.width
+        for position in range(self.geometry.cells):
             button_kwargs = self._cell_button_color_kwargs()
             button = self.ctk.CTkButton(
                 self.board_frame,
@@ -93,8 +105,8 @@ class GameView(GameViewPort):
                 **button_kwargs,
             )
             button.grid(
-                row=position // 3,
-                column=position % 3,
+                row=position // width,
+                column=position % width,
                 padx=self.config.layout.cell_spacing,
                 pady=self.config.layout.cell_spacing,
             )
@@ -116,15 +128,41 @@ class GameView(GameViewPort):
         reset_button.pack(pady=self.config.layout.reset_padding)
 
     def render(self, snapshot: GameSnapshot) -> None:
-        """Update the widget state to reflect the game snapshot."""
+        """Update the widget state to reflect the game snapshot.
+
+        Versioned snapshots that were already rendered are skipped.
+        """
 
         if not self.is_ready():
             return
+        if snapshot.version and snapshot.version == self._rendered_version:
+            return
 
         self._ensure_built()
 
-        self._render_board(snapshot.board)
-        self._render_status(snapshot)
+        with tracing.span("render", "view", version=snapshot.version):
+            self._render_board(snapshot.board)
+            self._render_status(snapshot)
+        self._rendered_version = snapshot.version
+
+    def render_delta(self, delta: StateDelta) -> bool:
+        """Repaint only the cells (and status) that *delta* changed.
+
+        Returns False without touching any widget when the view is not at
+        ``delta.base_version``; the caller then falls back to `render`.
+        """
+
+        if not self.is_ready() or delta.base_version != self._rendered_version:
+            return False
+
+        with tracing.span("render_delta", "view", version=delta.version):
+            buttons = self.buttons
+            for change in delta.cells:
+                self._render_cell(buttons[change.position], change.current)
+            if delta.status_changed:
+                self._render_status(delta)
+        self._rendered_version = delta.version
+        return True
 
     def is_ready(self) -> bool:
         """Return True once build() has produced the widget tree."""
@@ -155,13 +193,15 @@ class GameView(GameViewPort):
 
     def _render_board(self, board: Sequence[Optional[Player]]) -> None:
         for position, button in enumerate(self.buttons):
-            cell = board[position]
-            if cell is None:
-                button.configure(text="", state="normal")
-            else:
-                button.configure(text=cell.value, state="disabled")
+            self._render_cell(button, board[position])
+
+    def _render_cell(self, button: CellButton, cell: Optional[Player]) -> None:
+        if cell is None:
+            button.configure(text="", state="normal")
+        else:
+            button.configure(text=cell.value, state="disabled")
 
-    def _render_status(self, snapshot: GameSnapshot) -> None:
+    def _render_status(self, snapshot: GameSnapshot | StateDelta) -> None:
         text = self._status_message(snapshot)
         if self.status_label is None:
             raise RuntimeError("status label is not initialized")
@@ -209,7 +249,7 @@ class GameView(GameViewPort):
             return {}
         return {"fg_color": self.config.colors.board_background}
 
-    def _status_message(self, snapshot: GameSnapshot) -> str:
+    def _status_message(self, snapshot: GameSnapshot | StateDelta) -> str:
         if snapshot.state == GameState.PLAYING:
             player = snapshot.current_player.value if snapshot.current_player else "?"
             return self.config.text.turn_message_template.format(player=player)
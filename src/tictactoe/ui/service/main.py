@@ -9,6 +9,7 @@ from typing import Sequence
 
 from tictactoe.controller import (
     ControllerHooks,
+    configure_hooks,
     logging_hooks,
     telemetry_logging_requested,
 )
@@ -19,13 +20,18 @@ _ENV_SCRIPT_FILE = "TICTACTOE_SCRIPT_FILE"
 _ENV_OUTPUT = "TICTACTOE_AUTOMATION_OUTPUT"
 _ENV_LABEL = "TICTACTOE_AUTOMATION_LABEL"
 _ENV_QUIET = "TICTACTOE_AUTOMATION_QUIET"
+_ENV_BOARD = "TICTACTOE_BOARD"
+_ENV_WIN_LENGTH = "TICTACTOE_WIN_LENGTH"
+_ENV_REPLAY = "TICTACTOE_REPLAY"
+_ENV_ACTION_LOG = "TICTACTOE_ACTION_LOG"
 _SERVICE_TELEMETRY_ENV_VAR = "TICTACTOE_SERVICE_LOGGING"
 
 
 def _service_controller_hooks(
     flag: str = _SERVICE_TELEMETRY_ENV_VAR,
 ) -> ControllerHooks | None:
-    return logging_hooks() if telemetry_logging_requested(flag) else None
+    hooks = logging_hooks() if telemetry_logging_requested(flag) else None
+    return configure_hooks(hooks, flag)
 
 
 def _emit_view_event(hooks: ControllerHooks | None, action: str, **payload) -> None:
@@ -70,6 +76,30 @@ def _build_parser() -> argparse.ArgumentParser:
             "'service-run'."
         ),
     )
+    parser.add_argument(
+        "--action-log",
+        type=Path,
+        help="Write the applied actions as JSON lines (falls back to env).",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        help="Replay a recorded action log instead of a script (falls back to env).",
+    )
+    parser.add_argument(
+        "--seek",
+        type=int,
+        help="With --replay, stop after this many actions (default: all).",
+    )
+    parser.add_argument(
+        "--board",
+        help="Board dimensions as WIDTHxHEIGHT (falls back to env, then 3x3).",
+    )
+    parser.add_argument(
+        "--win-length",
+        type=cli_main.positive_int,
+        help="Cells in a row required to win (falls back to env, then 3).",
+    )
     parser.add_argument(
         "--quiet",
         dest="quiet",
@@ -125,6 +155,23 @@ def main(
     else:
         quiet = args.quiet
 
+    replay_path = args.replay or _env_path(os.environ.get(_ENV_REPLAY))
+    if replay_path:
+        _emit_view_event(hooks, "replay_resolved", label=label, path=str(replay_path))
+        try:
+            cli_main.replay_log(
+                replay_path,
+                label=label,
+                ply=args.seek,
+                quiet=quiet,
+                output_json=output_path,
+                controller_hooks=hooks,
+            )
+        except (OSError, ValueError) as exc:
+            _report_controller_error(hooks, exc, action="replay_log")
+            raise SystemExit(str(exc)) from exc
+        return 0
+
     script_text = _resolve_script_text(script_value, script_file)
     if not script_text:
         _emit_view_event(hooks, "no_script_provided")
@@ -142,20 +189,31 @@ def main(
         label=label,
     )
 
+    board = args.board or os.environ.get(_ENV_BOARD) or "3x3"
+
     try:
-        moves = cli_main.parse_script(script_text)
+        win_length = args.win_length or int(os.environ.get(_ENV_WIN_LENGTH) or 3)
+        geometry = cli_main.resolve_geometry(board, win_length)
+        moves = cli_main.parse_script(script_text, geometry)
     except ValueError as exc:  # pragma: no cover - validated in CLI tests
         _report_controller_error(hooks, exc, action="parse_script")
         raise SystemExit(str(exc)) from exc
 
     output = output_path if output_path else None
-    cli_main.run_script(
-        moves,
-        label=label,
-        quiet=quiet,
-        output_json=output,
-        controller_hooks=hooks,
-    )
+    action_log = args.action_log or _env_path(os.environ.get(_ENV_ACTION_LOG))
+    try:
+        cli_main.run_script(
+            moves,
+            label=label,
+            quiet=quiet,
+            output_json=output,
+            controller_hooks=hooks,
+            geometry=geometry,
+            action_log=action_log,
+        )
+    except ValueError as exc:
+        _report_controller_error(hooks, exc, action="run_script")
+        raise SystemExit(str(exc)) from exc
     return 0
 
 
@@ -0,0 +1,315 @@
+"""Host many concurrent games in one service process.
+
+Sessions are keyed by id and hold only per-game state. Everything immutable
+is shared: engines built for the same `BoardGeometry` reuse its cached line,
+mask, and Zobrist tables, and sessions reference the frozen theme objects in
+`NAMED_THEMES` instead of cloning them through `get_theme`.
+
+Idle sessions expire after *ttl* seconds and the least recently used session
+is evicted once *max_sessions* are live. Expiry is checked lazily on every
+access, so no background thread is needed.
+
+`SessionManager.stats` never walks live games: each session is charged the
+measured size of a fresh game of its kind when it is created, and the total
+is kept as a running sum. `SessionManager.session_footprint` measures one
+session exactly, including anything it has grown since.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from tictactoe.config.gui import NAMED_THEMES, GameViewConfig
+from tictactoe.domain.bitboard import BitboardTicTacToe
+from tictactoe.domain.kinarow import KInARowGame
+from tictactoe.domain.logic import (
+    STANDARD_GEOMETRY,
+    BoardGeometry,
+    ExampleAction,
+    ExampleState,
+    TicTacToe,
+)
+
+GameFactory = Callable[[BoardGeometry], TicTacToe]
+
+
+def default_game_factory(geometry: BoardGeometry) -> TicTacToe:
+    """Bitboards for 3x3 (smallest footprint), run counters otherwise."""
+
+    if geometry == STANDARD_GEOMETRY:
+        return BitboardTicTacToe()
+    return KInARowGame(geometry)
+
+
+@dataclass
+class GameSession:
+    """One hosted game plus its bookkeeping."""
+
+    session_id: str
+    game: TicTacToe
+    theme: GameViewConfig
+    created_at: float
+    last_seen: float
+    estimated_bytes: int = 0
+    lock: threading.RLock = field(
+        default_factory=threading.RLock, repr=False, compare=False
+    )
+
+
+@dataclass(frozen=True)
+class SessionStats:
+    """Point-in-time view of the manager for dashboards and health checks."""
+
+    live: int
+    created: int
+    expired: int
+    evicted: int
+    bytes_per_session: float
+    total_bytes: int
+
+
+class SessionManager:
+    """Thread-safe registry of game sessions with LRU/TTL eviction."""
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = 10_000,
+        ttl: Optional[float] = 900.0,
+        factory: GameFactory = default_game_factory,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1.")
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._factory = factory
+        self._clock = clock
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+        self._lock = threading.RLock()
+        self._created = 0
+        self._expired = 0
+        self._evicted = 0
+        self._total_bytes = 0
+        # One pristine game per geometry: its reachable objects are the
+        # shared baseline that `session_footprint` leaves out, and the size
+        # of a fresh session of that kind is what `stats` charges for it.
+        self._baselines: Dict[Tuple[type, BoardGeometry], _Baseline] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        with self._lock:
+            self._expire()
+            return session_id in self._sessions
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._expire()
+            return iter(list(self._sessions))
+
+    def create(
+        self,
+        session_id: Optional[str] = None,
+        *,
+        geometry: BoardGeometry = STANDARD_GEOMETRY,
+        theme: str = "light",
+    ) -> GameSession:
+        """Start a new game; raises ValueError if *session_id* is taken."""
+
+        try:
+            theme_config = NAMED_THEMES[theme.strip().lower()]
+        except KeyError as exc:
+            raise ValueError(f"Unknown theme {theme!r}.") from exc
+        # Built and sized before taking the lock; only the first game of each
+        # kind pays for a walk.
+        game = self._factory(geometry)
+        game_bytes = self._baseline(game).game_bytes
+        with self._lock:
+            self._expire()
+            session_id = session_id or uuid.uuid4().hex
+            if session_id in self._sessions:
+                raise ValueError(f"Session {session_id!r} already exists.")
+            now = self._clock()
+            session = GameSession(
+                session_id=session_id,
+                game=game,
+                theme=theme_config,
+                created_at=now,
+                last_seen=now,
+            )
+            session.estimated_bytes = sys.getsizeof(session) + game_bytes
+            self._sessions[session_id] = session
+            self._total_bytes += session.estimated_bytes
+            self._created += 1
+            while len(self._sessions) > self.max_sessions:
+                _, evicted = self._sessions.popitem(last=False)
+                self._total_bytes -= evicted.estimated_bytes
+                self._evicted += 1
+            return session
+
+    def get(self, session_id: str) -> GameSession:
+        """Return a live session and mark it as recently used.
+
+        Raises KeyError for unknown, closed, or expired sessions.
+        """
+
+        with self._lock:
+            self._expire()
+            session = self._sessions[session_id]
+            session.last_seen = self._clock()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def dispatch(self, session_id: str, action: ExampleAction) -> ExampleState:
+        """Route *action* to the session's game and return the new snapshot.
+
+        Actions on one session are serialised by its own lock, so different
+        sessions never wait on each other's moves.
+        """
+
+        session = self.get(session_id)
+        with session.lock:
+            return session.game.dispatch_action(action)
+
+    def close(self, session_id: str) -> bool:
+        """Drop a session; False if it was not live."""
+
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            self._total_bytes -= session.estimated_bytes
+            return True
+
+    def evict_idle(self) -> int:
+        """Expire idle sessions now and return how many were dropped."""
+
+        with self._lock:
+            return self._expire()
+
+    def session_footprint(self, session_id: str) -> int:
+        """Approximate bytes owned by one session, excluding shared tables.
+
+        Walks the session's objects, so it is meant for diagnostics rather
+        than for polling every session.
+        """
+
+        with self._lock:
+            session = self._sessions[session_id]
+        with session.lock:
+            return self._footprint(session)
+
+    def stats(self) -> SessionStats:
+        """Counters plus the running size estimate; O(1) under the lock."""
+
+        with self._lock:
+            self._expire()
+            total = self._total_bytes
+            live = len(self._sessions)
+            return SessionStats(
+                live=live,
+                created=self._created,
+                expired=self._expired,
+                evicted=self._evicted,
+                bytes_per_session=total / live if live else 0.0,
+                total_bytes=total,
+            )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _expire(self) -> int:
+        if self.ttl is None:
+            return 0
+        cutoff = self._clock() - self.ttl
+        dropped = 0
+        # Ordered by last use, so stop at the first session that is fresh.
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_seen > cutoff:
+                break
+            del self._sessions[session_id]
+            self._total_bytes -= session.estimated_bytes
+            dropped += 1
+        self._expired += dropped
+        return dropped
+
+    def _baseline(self, game: TicTacToe) -> _Baseline:
+        key = (type(game), game.geometry)
+        baseline = self._baselines.get(key)
+        if baseline is None:
+            probe = self._factory(game.geometry)
+            shared = _reachable_ids(probe)
+            size = _deep_sizeof(game, shared)
+            # Racing creators may both measure; either result is equivalent.
+            baseline = self._baselines.setdefault(key, _Baseline(probe, shared, size))
+        return baseline
+
+    def _footprint(self, session: GameSession) -> int:
+        shared = self._baseline(session.game).shared
+        return sys.getsizeof(session) + _deep_sizeof(session.game, shared)
+
+
+@dataclass(frozen=True)
+class _Baseline:
+    probe: TicTacToe
+    shared: Set[int]
+    game_bytes: int
+
+
+def _children(obj: Any) -> Iterator[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    else:
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is not None:
+            yield attributes
+        for name in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, name):
+                yield getattr(obj, name)
+
+
+def _walk(root: Any, skip: Set[int]) -> Iterator[Any]:
+    seen: Set[int] = set()
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        ident = id(obj)
+        if ident in seen or ident in skip or isinstance(obj, type):
+            continue
+        seen.add(ident)
+        yield obj
+        stack.extend(_children(obj))
+
+
+def _reachable_ids(root: Any) -> Set[int]:
+    # The probe is kept alive, so its ids stay unique: anything a session
+    # game reaches that is also in this set is genuinely shared (geometry
+    # tables, enums, interned values).
+    return {id(obj) for obj in _walk(root, set())}
+
+
+def _deep_sizeof(root: Any, shared: Set[int]) -> int:
+    return sum(sys.getsizeof(obj) for obj in _walk(root, shared))
+
+
+__all__ = [
+    "GameFactory",
+    "GameSession",
+    "SessionManager",
+    "SessionStats",
+    "default_game_factory",
+]
@@ -0,0 +1,84 @@
+"""Tests for the NumPy batch simulator."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tictactoe.domain import BoardGeometry, KInARowGame  # noqa: E402
+from tictactoe.domain.batch import (  # noqa: E402
+    BatchSimulator,
+    BatchStats,
+    simulate_random_games,
+)
+from tictactoe.domain.logic import GameState  # noqa: E402
+
+
+def _random_script(geometry: BoardGeometry, games: int, seed: int) -> np.ndarray:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(games):
+        order = list(range(geometry.cells))
+        rng.shuffle(order)
+        rows.append(order)
+    return np.array(rows)
+
+
+def _scalar_states(geometry: BoardGeometry, script: np.ndarray) -> list[GameState]:
+    states = []
+    for row in script:
+        game = KInARowGame(geometry)
+        for move in row:
+            if not game.make_move(int(move)):
+                break
+        states.append(game.state)
+    return states
+
+
+@pytest.mark.parametrize(
+    "geometry", [BoardGeometry(), BoardGeometry(4, 4, 3), BoardGeometry(5, 4, 4)]
+)
+def test_scripted_games_match_scalar_engine(geometry) -> None:
+    script = _random_script(geometry, 300, seed=7)
+    simulator = BatchSimulator(len(script), geometry)
+
+    stats = simulator.play_script(script)
+
+    expected = _scalar_states(geometry, script)
+    assert simulator.states() == expected
+    assert stats.outcomes()[GameState.X_WON] == expected.count(GameState.X_WON)
+    assert stats.unfinished == 0
+    assert (simulator.winners() == simulator.status).all()
+
+
+def test_random_play_finishes_and_is_seeded() -> None:
+    first = simulate_random_games(5000, seed=3, chunk_size=2048)
+    second = simulate_random_games(5000, seed=3, chunk_size=2048)
+
+    assert first == second
+    assert first.games == 5000 and first.unfinished == 0
+    assert first.x_wins + first.o_wins + first.draws == 5000
+    # Random 3x3 play: X wins ~58%, O ~29%, draws ~13%.
+    assert 0.54 < first.x_wins / 5000 < 0.62
+    assert 5 <= first.mean_length <= 9
+
+
+def test_step_rejects_occupied_cells_and_ignores_finished_games() -> None:
+    simulator = BatchSimulator(2)
+    simulator.play_script(np.array([[0, 3, 1, 4, 2], [0, 1, 2, 3, 4]]))
+    assert list(simulator.status) == [1, 0]
+
+    with pytest.raises(ValueError):
+        simulator.step(np.array([5, 0]))
+    simulator.step(np.array([-1, 5]))
+    assert simulator.plies.tolist() == [5, 6]
+
+
+def test_stats_add() -> None:
+    left = BatchStats(2, 1, 0, 1, 0, 14)
+    right = BatchStats(1, 0, 1, 0, 0, 6)
+
+    assert (left + right).mean_length == pytest.approx(20 / 3)
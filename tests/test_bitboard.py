@@ -0,0 +1,68 @@
+"""Behavioral tests for the bitboard-backed domain engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.domain import BitboardTicTacToe
+from tictactoe.domain.logic import ExampleAction, ExampleState, GameState, Player
+
+
+def test_bitboard_engine_starts_with_primary_actor() -> None:
+    game = BitboardTicTacToe()
+    snapshot = game.snapshot
+
+    assert isinstance(snapshot, ExampleState)
+    assert snapshot.board == tuple([None] * 9)
+    assert snapshot.current_player is Player.PRIMARY
+    assert snapshot.state is GameState.PLAYING
+    assert game.legal_moves() == tuple(range(9))
+
+
+def test_bitboard_engine_detects_row_win_and_notifies() -> None:
+    game = BitboardTicTacToe()
+    seen: list[ExampleState] = []
+    game.add_listener(seen.append)
+
+    for position in (0, 3, 1, 4, 2):
+        assert game.make_move(position)
+
+    assert game.state is GameState.X_WON
+    assert game.get_winner() is Player.PRIMARY
+    assert game.board[:3] == (Player.PRIMARY,) * 3
+    assert len(seen) == 5
+    assert not game.make_move(8)
+
+
+def test_bitboard_engine_detects_draw() -> None:
+    game = BitboardTicTacToe()
+    for position in (0, 1, 2, 4, 3, 5, 7, 6, 8):
+        game.make_move(position)
+
+    assert game.state is GameState.DRAW
+    assert game.get_winner() is None
+    assert game.legal_moves() == ()
+
+
+def test_bitboard_board_tuple_is_cached_until_mutation() -> None:
+    game = BitboardTicTacToe()
+    first = game.board
+
+    assert game.board is first
+    game.make_move(4)
+    assert game.board is not first
+    assert game.board[4] is Player.PRIMARY
+
+
+def test_bitboard_dispatch_rejects_illegal_moves() -> None:
+    game = BitboardTicTacToe()
+    game.dispatch_action(ExampleAction("grid.select", {"position": 0}))
+
+    with pytest.raises(ValueError):
+        game.dispatch_action(ExampleAction("grid.select", {"position": 0}))
+    with pytest.raises(ValueError):
+        game.dispatch_action(ExampleAction("demo"))
+
+    game.reset()
+    assert game.bitboards == (0, 0)
+    assert game.current_player is Player.PRIMARY
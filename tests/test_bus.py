@@ -0,0 +1,93 @@
+"""Tests for the telemetry event bus."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent
+from tictactoe.controller.bus import EventBus, parse_pattern
+
+
+def _topics(events):
+    return [f"{event.channel}.{event.action}" for event in events]
+
+
+def test_wildcards_route_to_every_matching_subscriber() -> None:
+    bus = EventBus()
+    views, snapshots, everything, exact = [], [], [], []
+    bus.subscribe("view.*", views.append)
+    bus.subscribe("*.snapshot", snapshots.append)
+    bus.subscribe("*", everything.append)
+    bus.subscribe("view.cell_click", exact.append)
+    hooks = bus.hooks()
+
+    hooks.emit("view", "cell_click", position=3)
+    hooks.emit("domain", "snapshot", state="playing")
+    hooks.emit("view", "snapshot")
+    hooks.emit("metrics", "flush")
+
+    assert _topics(views) == ["view.cell_click", "view.snapshot"]
+    assert _topics(snapshots) == ["domain.snapshot", "view.snapshot"]
+    assert _topics(exact) == ["view.cell_click"]
+    assert len(everything) == 4
+
+
+def test_routes_are_cached_and_invalidated() -> None:
+    bus = EventBus()
+    first = []
+    bus.subscribe("view.*", first.append)
+    assert len(bus.handlers_for("view", "cell_click")) == 1
+    cached = bus.handlers_for("view", "cell_click")
+    assert bus.handlers_for("view", "cell_click") is cached
+
+    second = []
+    subscription = bus.subscribe("view.cell_click", second.append)
+    assert len(bus.handlers_for("view", "cell_click")) == 2
+    assert subscription.unsubscribe()
+    assert not subscription.unsubscribe()
+    bus.publish(TelemetryEvent("view", "cell_click"))
+    assert len(first) == 1 and not second
+
+
+def test_failing_subscriber_does_not_block_others() -> None:
+    bus = EventBus()
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("subscriber bug")
+
+    bus.subscribe("domain.*", broken)
+    bus.subscribe("domain.*", seen.append)
+    bus.hooks().emit("domain", "snapshot")
+    assert _topics(seen) == ["domain.snapshot"]
+
+
+def test_errors_and_existing_hooks_stay_compatible() -> None:
+    bus = EventBus()
+    logged, failures = [], []
+    bus.subscribe_hooks(
+        ControllerHooks(
+            view=logged.append,
+            error=lambda exc, event: failures.append((exc, event)),
+        )
+    )
+    errors = []
+    bus.subscribe("error.*", errors.append)
+    hooks = bus.hooks()
+
+    hooks.emit("view", "reset_requested")
+    boom = RuntimeError("boom")
+    hooks.emit_error(boom, action="cell_click", position=2)
+
+    assert _topics(logged) == ["view.reset_requested"]
+    assert errors[0].payload["exception"] is boom
+    exc, event = failures[0]
+    assert exc is boom and dict(event.payload) == {"position": 2}
+
+
+def test_invalid_patterns_are_rejected() -> None:
+    assert parse_pattern("view.*") == ("view", None)
+    assert parse_pattern("*") == (None, None)
+    for pattern in ("view", "vi*.click", ".click", "view."):
+        with pytest.raises(ValueError):
+            parse_pattern(pattern)
@@ -162,6 +162,27 @@ def test_cli_script_invalid_move():
     assert "Moves must be between" in str(excinfo.value)
 
 
+def test_cli_script_accepts_custom_board(tmp_path):
+    outfile = tmp_path / "summary.json"
+    cli_main.main(
+        [
+            "--script",
+            "0,224",
+            "--board",
+            "15x15",
+            "--win-length",
+            "5",
+            "--quiet",
+            "--output-json",
+            str(outfile),
+        ]
+    )
+
+    data = json.loads(outfile.read_text(encoding="utf-8"))
+    assert data["metadata"]["board_size"] == "15x15"
+    assert data["metadata"]["win_length"] == "5"
+
+
 def test_cli_script_file_argument(tmp_path, capsys):
     script_file = tmp_path / "moves.txt"
     script_file.write_text("1,2,3", encoding="utf-8")
@@ -268,3 +289,76 @@ def test_service_global_logging_flag(monkeypatch):
     service_main.main(["--script", "0", "--verbose"])
 
     assert ("view", "script_resolved") in events
+
+
+def test_cli_script_applies_moves_and_records_log(tmp_path):
+    outfile = tmp_path / "summary.json"
+    log_file = tmp_path / "game.jsonl"
+    cli_main.main(
+        [
+            "--script",
+            "0,3,1,4,2",
+            "--quiet",
+            "--output-json",
+            str(outfile),
+            "--action-log",
+            str(log_file),
+        ]
+    )
+
+    data = json.loads(outfile.read_text(encoding="utf-8"))
+    assert data["metadata"]["final_state"] == "x_won"
+    assert data["metadata"]["winner"] == "Actor A"
+    assert len(log_file.read_text(encoding="utf-8").splitlines()) == 6
+
+
+def test_cli_script_rejects_move_after_win():
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.main(["--script", "0,3,1,4,2,5", "--quiet"])
+
+    assert "Illegal move" in str(excinfo.value)
+
+
+def test_cli_replay_seeks_recorded_log(tmp_path):
+    log_file = tmp_path / "game.jsonl"
+    cli_main.main(["--script", "0,3,1,4,2", "--quiet", "--action-log", str(log_file)])
+    outfile = tmp_path / "replay.json"
+
+    cli_main.main(
+        [
+            "--replay",
+            str(log_file),
+            "--seek",
+            "4",
+            "--quiet",
+            "--output-json",
+            str(outfile),
+        ]
+    )
+
+    data = json.loads(outfile.read_text(encoding="utf-8"))
+    assert data["metadata"]["ply"] == "4"
+    assert data["metadata"]["final_state"] == "playing"
+    assert len(data["actions"]) == 4
+
+
+def test_service_replays_log_from_environment(monkeypatch, tmp_path):
+    log_file = tmp_path / "game.jsonl"
+    cli_main.main(["--script", "0,3,1,4,2", "--quiet", "--action-log", str(log_file)])
+    monkeypatch.delenv("TICTACTOE_SCRIPT", raising=False)
+    monkeypatch.setenv("TICTACTOE_REPLAY", str(log_file))
+    monkeypatch.setenv("TICTACTOE_AUTOMATION_OUTPUT", str(tmp_path / "svc.json"))
+
+    service_main.main([])
+
+    data = json.loads((tmp_path / "svc.json").read_text(encoding="utf-8"))
+    assert data["metadata"]["winner"] == "Actor A"
+
+
+@pytest.mark.parametrize("frontend", [cli_main, service_main])
+def test_win_length_must_be_positive(frontend, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        frontend.main(["--script", "0", "--win-length", "0", "--quiet"])
+
+    assert excinfo.value.code == 2
+    assert "expected a positive integer" in capsys.readouterr().err
@@ -0,0 +1,98 @@
+"""Tests for the binary state/action codec."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tictactoe.domain import BoardGeometry, KInARowGame
+from tictactoe.domain.codec import (
+    HEADER,
+    StateCodec,
+    decode_actions,
+    decode_state,
+    decode_states,
+    encode_actions,
+    encode_state,
+)
+from tictactoe.domain.logic import ExampleAction, GameState
+from tictactoe.domain.replay import select_action
+
+
+def _random_snapshots(geometry: BoardGeometry, count: int, seed: int):
+    rng = random.Random(seed)
+    snapshots = []
+    for _ in range(count):
+        game = KInARowGame(geometry)
+        for _ in range(rng.randrange(geometry.cells + 1)):
+            if game.state is not GameState.PLAYING:
+                break
+            game.make_move(rng.choice(game.legal_moves()))
+        snapshots.append(game.snapshot)
+    return snapshots
+
+
+@pytest.mark.parametrize(
+    "geometry", [BoardGeometry(), BoardGeometry(7, 5, 4), BoardGeometry(15, 15, 5)]
+)
+def test_states_round_trip(geometry) -> None:
+    snapshots = _random_snapshots(geometry, 40, seed=geometry.cells)
+    codec = StateCodec(geometry)
+
+    payload = codec.encode(snapshots)
+
+    assert len(payload) == HEADER.size + 40 * codec.record_size
+    assert list(decode_states(payload)) == snapshots
+    assert codec.ply_at(payload, HEADER.size) == sum(
+        cell is not None for cell in snapshots[0].board
+    )
+
+
+def test_standard_record_is_six_bytes_and_works_on_memoryview() -> None:
+    game = KInARowGame()
+    for move in (0, 4, 8):
+        game.make_move(move)
+    codec = StateCodec()
+    buffer = bytearray(codec.record_size * 2)
+
+    codec.pack_into(memoryview(buffer), codec.record_size, game.snapshot)
+
+    assert codec.record_size == 6
+    decoded = codec.unpack_from(memoryview(buffer), codec.record_size)
+    assert decoded == game.snapshot
+    assert decode_state(encode_state(game.snapshot)) == decoded
+
+
+@pytest.mark.parametrize(
+    "offset, value",
+    [(0, 0x03), (0, 0x30), (1, 0x05), (3, 0x03)],
+    ids=["current-player", "winner", "ply", "cell"],
+)
+def test_corrupt_state_records_raise_value_error(offset, value) -> None:
+    payload = bytearray(encode_state(KInARowGame().snapshot))
+    payload[HEADER.size + offset] = value
+
+    with pytest.raises(ValueError):
+        decode_state(payload)
+
+
+def test_actions_round_trip_as_fixed_width_records() -> None:
+    geometry = BoardGeometry(15, 15, 5)
+    actions = [
+        select_action(224, actor="Actor A"),
+        select_action(0),
+        select_action(17, actor="Actor B"),
+    ]
+
+    payload = encode_actions(actions, geometry)
+
+    assert len(payload) == HEADER.size + 3 * 4
+    assert decode_actions(payload) == (geometry, tuple(actions))
+    with pytest.raises(ValueError):
+        encode_actions([ExampleAction(name="game.reset")])
+    with pytest.raises(ValueError):
+        decode_states(payload).__next__()
+    payload[HEADER.size + 1] = 3
+    with pytest.raises(ValueError):
+        decode_actions(payload)
@@ -0,0 +1,58 @@
+"""Tests for controller telemetry hooks."""
+
+from __future__ import annotations
+
+from tictactoe.controller import ControllerHooks, LazyPayload, configure_hooks
+
+
+def test_emit_skips_delivery_of_unconsumed_and_muted_events() -> None:
+    seen = []
+    hooks = ControllerHooks(view=seen.append, muted=frozenset({"view.cell_click"}))
+
+    unhooked = hooks.emit("domain", "snapshot", state="playing")
+    muted = hooks.emit("view", "cell_click", position=0)
+    assert unhooked.payload == {"state": "playing"}
+    assert (muted.channel, muted.action) == ("view", "cell_click")
+    assert hooks.emit_lazy("view", "cell_click", dict) is None
+    assert not hooks.enabled("view", "cell_click")
+    assert hooks.enabled("view", "reset_requested")
+    event = hooks.emit("view", "reset_requested")
+
+    assert seen == [event]
+    assert not ControllerHooks(view=seen.append, muted=frozenset({"view"})).enabled(
+        "view", "initialized"
+    )
+
+
+def test_lazy_payload_is_built_only_when_read() -> None:
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"state": "playing"}
+
+    dropped = ControllerHooks(domain=lambda event: None)
+    dropped.emit_lazy("domain", "snapshot", build)
+    ControllerHooks().emit_lazy("domain", "snapshot", build)
+    assert calls == []
+
+    read = []
+    ControllerHooks(domain=lambda event: read.append(dict(event.payload))).emit_lazy(
+        "domain", "snapshot", build
+    )
+    assert read == [{"state": "playing"}]
+    assert calls == [1]
+
+    payload = LazyPayload(build)
+    assert len(payload) == 1 and payload["state"] == "playing"
+    assert calls == [1, 1]
+
+
+def test_configure_hooks_applies_mute_list(monkeypatch) -> None:
+    monkeypatch.delenv("TICTACTOE_TELEMETRY_ASYNC", raising=False)
+    monkeypatch.setenv("TICTACTOE_TELEMETRY_MUTE", "view.cell_click, domain")
+    hooks = configure_hooks(ControllerHooks(view=print, domain=print))
+
+    assert hooks.muted == frozenset({"view.cell_click", "domain"})
+    assert not hooks.enabled("domain", "snapshot")
+    assert hooks.enabled("view", "reset_requested")
@@ -0,0 +1,190 @@
+"""Tests for delta notifications and incremental view rendering."""
+
+from __future__ import annotations
+
+from tictactoe.controller import ControllerHooks
+from tictactoe.domain import KInARowGame, StateDelta
+from tictactoe.domain.logic import BoardGeometry, ExampleAction, GameState, Player
+from tictactoe.ui.gui.headless_view import HeadlessGameView
+from tictactoe.ui.gui.main import TicTacToeGUI
+
+
+def _select(position: int) -> ExampleAction:
+    return ExampleAction(name="grid.select", payload={"position": position})
+
+
+def _cells(delta: StateDelta) -> list[tuple[int, object, object]]:
+    return [(c.position, c.previous, c.current) for c in delta.cells]
+
+
+def test_delta_listener_receives_changed_cells_and_status() -> None:
+    game = KInARowGame()
+    deltas: list[StateDelta] = []
+    game.add_delta_listener(deltas.append)
+
+    game.make_move(4)
+    for position in (0, 3, 1, 5):
+        game.make_move(position)
+
+    first = deltas[0]
+    assert _cells(first) == [(4, None, Player.PRIMARY)]
+    assert first.base_version == first.version - 1
+    assert (first.previous_player, first.current_player) == (
+        Player.PRIMARY,
+        Player.SECONDARY,
+    )
+    win = deltas[-1]
+    assert (win.previous_state, win.state) == (GameState.PLAYING, GameState.X_WON)
+    assert win.winner is Player.PRIMARY and win.status_changed
+
+    game.reset()
+    cleared = deltas[-1]
+    assert sorted(c.position for c in cleared.cells) == [0, 1, 3, 4, 5]
+    assert all(c.current is None for c in cleared.cells)
+
+
+def test_transactions_deliver_one_merged_delta() -> None:
+    game = KInARowGame()
+    game.make_move(8)
+    deltas: list[StateDelta] = []
+    game.add_delta_listener(deltas.append)
+
+    game.dispatch_actions(_select(p) for p in (0, 3, 1))
+    history = game.enable_history()
+    with game.transaction():
+        game.make_move(2)
+        history.undo()
+
+    assert len(deltas) == 2
+    merged = deltas[0]
+    assert merged.span == 3 and merged.action is None
+    assert merged.base_version == merged.version - 3
+    assert _cells(merged) == [
+        (0, None, Player.SECONDARY),
+        (3, None, Player.PRIMARY),
+        (1, None, Player.SECONDARY),
+    ]
+    # A move undone inside the same transaction leaves nothing to repaint.
+    assert deltas[1].cells == () and not deltas[1].status_changed
+
+
+def test_removing_last_delta_listener_stops_tracking() -> None:
+    game = KInARowGame()
+    deltas: list[StateDelta] = []
+    game.add_delta_listener(deltas.append)
+    game.remove_delta_listener(deltas.append)
+
+    game.make_move(0)
+
+    assert deltas == [] and game._delta_sinks == []
+
+
+def test_headless_view_renders_deltas_incrementally() -> None:
+    game = KInARowGame(BoardGeometry(19, 19, 5))
+    gui = TicTacToeGUI(game_factory=lambda: game, view_factory=HeadlessGameView)
+    view = gui.view
+    touched: list[int] = []
+    render_cell = view._render_cell
+
+    def spy(target, cell) -> None:
+        touched.append(1)
+        render_cell(target, cell)
+
+    view._render_cell = spy  # type: ignore[method-assign]
+
+    game.make_move(180)
+    game.make_move(0)
+
+    assert len(touched) == 2
+    assert view.cell_text(180) == Player.PRIMARY.value
+    assert view.cell_state(0) == "disabled"
+    assert view.status_text() == "Player Actor A's turn"
+
+
+def test_delta_path_emits_snapshot_telemetry_without_building_snapshots() -> None:
+    game = KInARowGame(BoardGeometry(19, 19, 5))
+    events = []
+    gui = TicTacToeGUI(
+        game_factory=lambda: game,
+        view_factory=HeadlessGameView,
+        controller_hooks=ControllerHooks(domain=events.append),
+    )
+    events.clear()
+
+    game.make_move(180)
+
+    assert game._snapshot_cache is None
+    assert gui.view.cell_text(180) == Player.PRIMARY.value
+    (event,) = events
+    assert dict(event.payload) == {
+        "state": GameState.PLAYING.value,
+        "current_player": Player.SECONDARY.value,
+        "winner": None,
+        "notes": len(game.notes),
+    }
+
+
+class _SnapshotOnlyView:
+    """A custom view written before deltas existed: no `render_delta`."""
+
+    def __init__(self, **kwargs) -> None:
+        self._inner = HeadlessGameView(**kwargs)
+        self.renders = 0
+
+    def build(self) -> None:
+        self._inner.build()
+
+    def is_ready(self) -> bool:
+        return self._inner.is_ready()
+
+    def render(self, snapshot) -> None:
+        self.renders += 1
+        self._inner.render(snapshot)
+
+    def cell_count(self) -> int:
+        return self._inner.cell_count()
+
+    def cell_text(self, position: int) -> str:
+        return self._inner.cell_text(position)
+
+    def cell_state(self, position: int) -> str:
+        return self._inner.cell_state(position)
+
+    def status_text(self) -> str:
+        return self._inner.status_text()
+
+    def reset_button_label(self) -> str:
+        return self._inner.reset_button_label()
+
+
+def test_views_without_delta_support_get_full_snapshots() -> None:
+    game = KInARowGame()
+    gui = TicTacToeGUI(game_factory=lambda: game, view_factory=_SnapshotOnlyView)
+    view = gui.view
+    assert isinstance(view, _SnapshotOnlyView)
+
+    game.make_move(4)
+
+    assert view.renders == 2
+    assert view.cell_text(4) == Player.PRIMARY.value
+    assert not game._delta_listeners
+
+
+def test_headless_view_falls_back_to_full_render_when_out_of_step() -> None:
+    game = KInARowGame()
+    view = HeadlessGameView(
+        ctk_module=None, root=None, on_cell_click=game.make_move, on_reset=game.reset
+    )
+    view.build()
+    deltas: list[StateDelta] = []
+    game.add_delta_listener(deltas.append)
+
+    game.make_move(4)
+    game.make_move(0)
+
+    assert not view.render_delta(deltas[-1])
+    view.render(game.snapshot)
+    assert view.cell_text(4) == Player.PRIMARY.value
+    game.make_move(8)
+    assert view.render_delta(deltas[-1])
+    assert view.cell_text(8) == Player.PRIMARY.value
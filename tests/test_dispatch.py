@@ -0,0 +1,159 @@
+"""Tests for the background telemetry dispatcher."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from tictactoe.controller import ControllerHooks, configure_hooks
+from tictactoe.controller.dispatch import AsyncDispatcher
+
+
+def test_events_are_delivered_in_batches_off_thread() -> None:
+    seen = []
+    threads = set()
+    batches = []
+
+    def record(event) -> None:
+        seen.append((event.channel, event.action, event.payload["n"]))
+        threads.add(threading.get_ident())
+
+    dispatcher = AsyncDispatcher(
+        ControllerHooks(view=record, domain=record),
+        batch_size=8,
+        batch_hook=lambda batch: batches.append(len(batch)),
+    )
+    for n in range(50):
+        dispatcher.hooks.emit("view" if n % 2 else "domain", "tick", n=n)
+    assert dispatcher.flush(timeout=5)
+    dispatcher.close()
+
+    assert [item[2] for item in seen] == list(range(50))
+    assert threading.get_ident() not in threads
+    assert sum(batches) == 50 and max(batches) <= 8
+    stats = dispatcher.stats()
+    assert stats.delivered == stats.queued == 50
+    assert stats.dropped == 0 and stats.queue_depth == 0
+
+
+def test_drop_oldest_counts_discarded_events() -> None:
+    release = threading.Event()
+    seen = []
+
+    def slow(event) -> None:
+        release.wait(5)
+        seen.append(event.payload["n"])
+
+    dispatcher = AsyncDispatcher(ControllerHooks(view=slow), max_queue=4, batch_size=1)
+    dispatcher.hooks.emit("view", "tick", n=0)
+    # Wait until the worker holds event 0 so the queue state is predictable.
+    while dispatcher.stats().queue_depth:
+        pass
+    for n in range(1, 11):
+        dispatcher.hooks.emit("view", "tick", n=n)
+    assert dispatcher.queue_depth == 4
+    release.set()
+    dispatcher.close()
+
+    assert seen == [0, 7, 8, 9, 10]
+    stats = dispatcher.stats()
+    assert stats.dropped == 6
+    assert stats.high_watermark == 4
+
+
+def test_block_policy_keeps_every_event() -> None:
+    seen = []
+    dispatcher = AsyncDispatcher(
+        ControllerHooks(domain=lambda event: seen.append(event.payload["n"])),
+        max_queue=2,
+        batch_size=1,
+        policy="block",
+    )
+    for n in range(200):
+        dispatcher.hooks.emit("domain", "tick", n=n)
+    dispatcher.close()
+
+    assert seen == list(range(200))
+    assert dispatcher.stats().dropped == 0
+
+
+def test_close_flushes_and_later_events_run_inline() -> None:
+    seen = []
+    dispatcher = AsyncDispatcher(ControllerHooks(view=seen.append))
+    dispatcher.hooks.emit("view", "first")
+    dispatcher.close()
+    assert [event.action for event in seen] == ["first"]
+
+    dispatcher.hooks.emit("view", "late")
+    assert [event.action for event in seen] == ["first", "late"]
+    with pytest.raises(ValueError):
+        AsyncDispatcher(ControllerHooks(), policy="spill")
+
+
+def test_inline_delivery_after_close_does_not_hold_the_lock() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow(event) -> None:
+        entered.set()
+        release.wait(5)
+
+    fast = []
+    dispatcher = AsyncDispatcher(ControllerHooks(view=slow, domain=fast.append))
+    dispatcher.close()
+    late = threading.Thread(target=dispatcher.hooks.emit, args=("view", "late"))
+    late.start()
+    assert entered.wait(5)
+
+    # The slow hook is still running, yet other threads are not held up.
+    other = threading.Thread(target=dispatcher.hooks.emit, args=("domain", "other"))
+    other.start()
+    other.join(1)
+    assert not other.is_alive() and len(fast) == 1
+    release.set()
+    late.join(5)
+
+
+def test_blocked_producer_is_not_queued_past_the_limit_after_close() -> None:
+    release = threading.Event()
+    seen = []
+
+    def slow(event) -> None:
+        release.wait(5)
+        seen.append(event.payload["n"])
+
+    dispatcher = AsyncDispatcher(
+        ControllerHooks(view=slow), max_queue=1, batch_size=1, policy="block"
+    )
+    dispatcher.hooks.emit("view", "tick", n=0)
+    while dispatcher.stats().queue_depth:
+        pass
+    dispatcher.hooks.emit("view", "tick", n=1)
+    producer = threading.Thread(
+        target=dispatcher.hooks.emit, args=("view", "tick"), kwargs={"n": 2}
+    )
+    producer.start()
+    time.sleep(0.05)
+    dispatcher.close(timeout=0)
+    release.set()
+    producer.join(5)
+    assert dispatcher.flush(timeout=5)
+
+    assert sorted(seen) == [0, 1, 2]
+    assert dispatcher.stats().high_watermark == 1
+
+
+def test_configure_hooks_reads_environment(monkeypatch) -> None:
+    hooks = ControllerHooks(view=lambda event: None)
+    monkeypatch.delenv("TICTACTOE_TELEMETRY_ASYNC", raising=False)
+    assert configure_hooks(hooks) is hooks
+
+    monkeypatch.setenv("TICTACTOE_TELEMETRY_ASYNC", "block")
+    wrapped = configure_hooks(hooks)
+    assert wrapped is not hooks
+    dispatcher = wrapped.view.__self__
+    assert isinstance(dispatcher, AsyncDispatcher)
+    assert dispatcher.policy == "block"
+    dispatcher.close()
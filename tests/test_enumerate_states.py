@@ -0,0 +1,51 @@
+"""Tests for the reachable-state enumerator."""
+
+from __future__ import annotations
+
+from tictactoe.domain import BoardGeometry
+from tictactoe.domain.bitboard import symmetry_mapper
+from tictactoe.domain.logic import GameState
+from tictactoe.tools import enumerate_states as enumerator
+
+
+def test_standard_board_counts() -> None:
+    folded = enumerator.enumerate_states()
+    full = enumerator.enumerate_states(fold_symmetry=False)
+
+    assert folded.total == 765
+    assert full.total == 5478
+    assert full.outcomes() == {
+        GameState.PLAYING: 4520,
+        GameState.X_WON: 626,
+        GameState.O_WON: 316,
+        GameState.DRAW: 16,
+    }
+    assert [counts.total for counts in folded.plies[:3]] == [1, 3, 12]
+
+
+def test_state_file_round_trip(tmp_path) -> None:
+    path = tmp_path / "states.bin"
+    with path.open("wb") as handle:
+        result = enumerator.enumerate_states(output=handle)
+
+    states = enumerator.StateFile.open(path)
+    mapper = symmetry_mapper(states.geometry)
+    corner, _ = mapper.canonical(0b000000001, 0)
+    other_corner = 0b100000000
+    two_crosses = 0b000000011
+
+    assert states.folded and len(states) == result.total
+    assert len(states.ply_range(1)) == 3
+    assert corner in states
+    assert other_corner in states
+    assert two_crosses not in states
+    keys = [states.key(index) for index in states.ply_range(4)]
+    assert keys == sorted(keys)
+
+
+def test_small_rectangular_board(capsys) -> None:
+    result = enumerator.enumerate_states(BoardGeometry(3, 2, 3))
+    enumerator.main(["--board", "3x2", "--win-length", "3"])
+
+    assert result.outcomes()[GameState.O_WON] == 0
+    assert f"Total reachable positions: {result.total}" in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""Tests for the bounded undo/redo history."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.domain import BitboardTicTacToe, BoardGeometry, KInARowGame
+from tictactoe.domain.logic import ExampleState, GameState, Player
+
+
+def _play(game, moves) -> None:
+    for move in moves:
+        assert game.make_move(move)
+
+
+@pytest.mark.parametrize("factory", [BitboardTicTacToe, KInARowGame])
+def test_undo_and_redo_restore_positions(factory) -> None:
+    game = factory()
+    history = game.enable_history()
+    _play(game, (0, 3, 1, 4, 2))
+    won = game.snapshot
+
+    assert history.undo()
+    assert game.state is GameState.PLAYING
+    assert game.current_player is Player.PRIMARY
+    assert game.board[2] is None
+    assert game.make_move(2)
+    assert game.board == won.board
+
+    assert history.undo() and history.undo()
+    assert history.ply == 3
+    assert history.redo() and history.redo()
+    assert game.state is GameState.X_WON
+    assert game.get_winner() is Player.PRIMARY
+    assert not history.redo()
+
+
+def test_new_move_discards_redo_branch() -> None:
+    game = KInARowGame()
+    history = game.enable_history()
+    _play(game, (0, 1, 2))
+    history.undo()
+    history.undo()
+
+    assert game.make_move(4)
+    assert history.ply == 2
+    assert not history.can_redo()
+    assert game.board[1] is None and game.board[4] is Player.SECONDARY
+
+
+def test_capacity_caps_retained_plies() -> None:
+    game = KInARowGame(BoardGeometry(9, 9, 5))
+    history = game.enable_history(capacity=4, keyframe_interval=2)
+    _play(game, range(10))
+
+    assert len(history) == 4
+    assert history.oldest_ply == 6
+    assert history.keyframe_count <= 3
+    while history.undo():
+        pass
+    assert history.ply == 6
+    assert sum(cell is not None for cell in game.board) == 6
+
+
+def test_jump_to_notifies_once_and_uses_keyframes() -> None:
+    game = KInARowGame(BoardGeometry(7, 7, 4))
+    history = game.enable_history(keyframe_interval=4)
+    moves = (24, 0, 25, 6, 18, 42, 32, 48, 10, 1)
+    _play(game, moves)
+    seen: list[ExampleState] = []
+    game.add_listener(seen.append)
+
+    history.jump_to(1)
+    assert len(seen) == 1
+    assert [p for p, cell in enumerate(game.board) if cell] == [24]
+
+    history.jump_to(9)
+    assert game.board[10] is Player.PRIMARY and game.board[1] is None
+    with pytest.raises(ValueError):
+        history.jump_to(11)
+
+
+def test_reset_clears_history() -> None:
+    game = BitboardTicTacToe()
+    history = game.enable_history()
+    _play(game, (0, 1))
+    game.reset()
+
+    assert history.ply == 0
+    assert not history.can_undo()
+    assert game.history is history
+    game.disable_history()
+    assert game.history is None
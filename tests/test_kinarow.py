@@ -0,0 +1,91 @@
+"""Tests for board geometry and the generalized k-in-a-row engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.domain import STANDARD_GEOMETRY, BoardGeometry, KInARowGame
+from tictactoe.domain.logic import GameState, Player, TicTacToe
+from tictactoe.ui.gui.headless_view import HeadlessGameView
+from tictactoe.ui.gui.main import TicTacToeGUI
+
+
+def test_standard_geometry_matches_classic_board() -> None:
+    assert STANDARD_GEOMETRY.cells == 9
+    assert STANDARD_GEOMETRY.label == "3x3"
+    assert len(STANDARD_GEOMETRY.lines) == 8
+    assert len(STANDARD_GEOMETRY.cell_lines[4]) == 4
+    assert TicTacToe().geometry is STANDARD_GEOMETRY
+    assert TicTacToe().snapshot.geometry is STANDARD_GEOMETRY
+
+
+def test_geometry_parse_and_validation() -> None:
+    geometry = BoardGeometry.parse("15x15", 5)
+
+    assert (geometry.width, geometry.height, geometry.k) == (15, 15, 5)
+    assert geometry.lines is BoardGeometry(15, 15, 5).lines
+    with pytest.raises(ValueError):
+        BoardGeometry.parse("15")
+    with pytest.raises(ValueError):
+        BoardGeometry(3, 3, 4)
+
+
+def test_five_in_a_row_on_large_board() -> None:
+    game = KInARowGame(BoardGeometry(15, 15, 5))
+    # Primary walks the diagonal from (2, 2); secondary answers on row 0.
+    for step in range(4):
+        assert game.make_move((2 + step) * 15 + 2 + step)
+        assert game.make_move(step)
+    assert game.state is GameState.PLAYING
+
+    assert game.make_move(6 * 15 + 6)
+    assert game.state is GameState.X_WON
+    assert game.get_winner() is Player.PRIMARY
+    assert len(game.board) == 225
+
+
+def test_k_in_a_row_draw_on_standard_board() -> None:
+    game = KInARowGame()
+    for position in (0, 1, 2, 4, 3, 5, 7, 6, 8):
+        game.make_move(position)
+
+    assert game.state is GameState.DRAW
+    assert not game.make_move(0)
+
+
+def test_headless_view_follows_geometry() -> None:
+    game = KInARowGame(BoardGeometry(4, 5, 3))
+    view = HeadlessGameView(
+        ctk_module=None,
+        root=None,
+        on_cell_click=lambda _: None,
+        on_reset=lambda: None,
+        geometry=game.geometry,
+    )
+    view.build()
+    game.make_move(19)
+    view.render(game.snapshot)
+
+    assert view.cell_count() == 20
+    assert view.cell_text(19) == Player.PRIMARY.value
+
+
+def test_gui_accepts_view_factories_without_geometry() -> None:
+    def legacy_factory(*, ctk_module, root, on_cell_click, on_reset, view_config):
+        return HeadlessGameView(
+            ctk_module=ctk_module,
+            root=root,
+            on_cell_click=on_cell_click,
+            on_reset=on_reset,
+            view_config=view_config,
+        )
+
+    gui = TicTacToeGUI(game_factory=KInARowGame, view_factory=legacy_factory)
+    gui.game.make_move(4)
+    assert gui.view.cell_text(4) == Player.PRIMARY.value
+
+    wide = TicTacToeGUI(
+        game_factory=lambda: KInARowGame(BoardGeometry(4, 4, 3)),
+        view_factory=HeadlessGameView,
+    )
+    assert wide.view.cell_count() == 16
@@ -0,0 +1,122 @@
+"""Tests for per-listener timing and slow-listener handling."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from tictactoe.controller import ControllerHooks
+from tictactoe.domain import BitboardTicTacToe
+from tictactoe.domain.listeners import ListenerMonitor
+from tictactoe.ui.gui.headless_view import HeadlessGameView
+from tictactoe.ui.gui.main import TicTacToeGUI
+
+
+def test_monitor_counts_calls_and_time() -> None:
+    game = BitboardTicTacToe()
+    seen = []
+    game.add_listener(seen.append)
+    monitor = game.enable_listener_monitoring()
+
+    game.make_move(0)
+    game.make_move(4)
+
+    (stats,) = monitor.stats()
+    assert stats.calls == 2 and len(seen) == 2
+    assert stats.total_seconds >= stats.max_seconds > 0
+    assert stats.mean_seconds == pytest.approx(stats.total_seconds / 2)
+    assert stats.slow_calls == 0 and not stats.offloaded
+
+    game.disable_listener_monitoring()
+    game.make_move(8)
+    assert game.listener_monitor is None and len(seen) == 3
+
+
+def test_slow_listener_is_reported_then_offloaded() -> None:
+    game = BitboardTicTacToe()
+    reports = []
+    caller = threading.get_ident()
+    threads = []
+
+    def slow(snapshot) -> None:
+        threads.append(threading.get_ident())
+        time.sleep(0.05)
+
+    fast = []
+    game.add_listener(slow)
+    game.add_listener(fast.append)
+    monitor = game.enable_listener_monitoring(
+        slow_threshold=0.01,
+        on_slow=lambda stats, seconds: reports.append((stats.name, seconds)),
+        offload=True,
+    )
+
+    game.make_move(0)
+    started = time.perf_counter()
+    game.make_move(4)
+    blocked = time.perf_counter() - started
+    monitor.shutdown()
+
+    assert reports[0][0].endswith("slow") and reports[0][1] >= 0.01
+    assert threads[0] == caller and threads[1] != caller
+    assert blocked < 0.04
+    assert monitor.stats_for(slow).offloaded
+    assert monitor.stats_for(slow).calls == 2
+    assert monitor.stats_for(fast.append).slow_calls == 0
+    assert len(fast) == 2
+
+
+def test_removed_listener_stats_are_dropped() -> None:
+    game = BitboardTicTacToe()
+    seen = []
+    game.add_listener(seen.append)
+    game.add_delta_listener(seen.append)
+    monitor = game.enable_listener_monitoring()
+    game.make_move(0)
+
+    game.remove_listener(seen.append)
+    assert monitor.stats_for(seen.append) is not None
+    game.remove_delta_listener(seen.append)
+    assert monitor.stats_for(seen.append) is None and monitor.stats() == []
+
+
+def test_concurrent_first_calls_share_one_stats_entry() -> None:
+    monitor = ListenerMonitor()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def notify() -> None:
+        barrier.wait()
+        for _ in range(50):
+            monitor.call(calls.append, None)
+
+    threads = [threading.Thread(target=notify) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert monitor.stats_for(calls.append).calls == len(calls) == 400
+
+
+def test_offload_requires_threshold() -> None:
+    with pytest.raises(ValueError):
+        BitboardTicTacToe().enable_listener_monitoring(offload=True)
+
+
+def test_gui_emits_slow_listener_events(monkeypatch) -> None:
+    monkeypatch.setenv("TICTACTOE_SLOW_LISTENER_MS", "0")
+    events = []
+    gui = TicTacToeGUI(
+        game_factory=BitboardTicTacToe,
+        view_factory=HeadlessGameView,
+        controller_hooks=ControllerHooks(domain=events.append),
+    )
+
+    gui.game.make_move(4)
+
+    slow = [event for event in events if event.action == "slow_listener"]
+    assert slow and slow[-1].payload["listener"].endswith("_on_game_delta")
+    assert slow[-1].payload["elapsed"] >= 0
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from tictactoe.domain.logic import ExampleAction, ExampleState, GameState, TicTacToe
+from tictactoe.ui.gui.headless_view import HeadlessGameView
 
 
 def test_placeholder_snapshot_documents_override_points() -> None:
@@ -30,3 +31,40 @@ def test_dispatch_action_is_not_implemented_yet() -> None:
 
     with pytest.raises(NotImplementedError):
         game.dispatch_action(action)
+
+
+def test_snapshot_is_cached_until_the_next_mutation() -> None:
+    """Reads share one immutable snapshot; mutations bump its version."""
+
+    game = TicTacToe()
+    first = game.snapshot
+
+    assert game.snapshot is first
+    assert first.version == game.version
+    game.reset()
+    assert game.snapshot is not first
+    assert game.snapshot.version == first.version + 1
+    # Same content at a later version is still the same state.
+    assert game.snapshot == first
+
+
+def test_views_skip_already_rendered_versions() -> None:
+    """Views use the snapshot version to skip redundant renders."""
+
+    game = TicTacToe()
+    view = HeadlessGameView(
+        ctk_module=None,
+        root=None,
+        on_cell_click=lambda _: None,
+        on_reset=lambda: None,
+    )
+    view.build()
+    view.render(game.snapshot)
+    calls: list[object] = []
+    view._render_board = calls.append  # type: ignore[method-assign]
+
+    view.render(game.snapshot)
+    assert calls == []
+    game.reset()
+    view.render(game.snapshot)
+    assert len(calls) == 1
@@ -0,0 +1,96 @@
+"""Tests for the Monte Carlo tree search player."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tictactoe.controller import ControllerHooks, TelemetryEvent
+from tictactoe.domain import BoardGeometry, KInARowGame, MCTSPlayer
+from tictactoe.domain.logic import GameState, Player
+from tictactoe.domain.mcts import playout
+
+
+def _play(game, moves) -> None:
+    for move in moves:
+        assert game.make_move(move)
+
+
+def test_takes_immediate_win_and_blocks() -> None:
+    player = MCTSPlayer(iterations=2000, time_budget=None, seed=1)
+
+    game = KInARowGame()
+    _play(game, (0, 3, 1, 4))
+    assert player.best_move(game).move == 2
+
+    game = KInARowGame()
+    _play(game, (8, 0, 7))
+    assert player.best_move(game).move == 6
+
+
+def test_never_loses_to_random_on_3x3() -> None:
+    rng = random.Random(5)
+    for _ in range(10):
+        game = KInARowGame()
+        with MCTSPlayer(iterations=1500, time_budget=None, seed=rng.random()) as mcts:
+            while game.state is GameState.PLAYING:
+                if game.current_player is Player.PRIMARY:
+                    mcts.play(game)
+                else:
+                    game.make_move(rng.choice(game.legal_moves()))
+        assert game.state is not GameState.O_WON
+
+
+def test_tree_is_reused_between_moves_and_reported() -> None:
+    events: list[TelemetryEvent] = []
+    player = MCTSPlayer(
+        iterations=400,
+        time_budget=None,
+        seed=3,
+        controller_hooks=ControllerHooks(domain=events.append),
+    )
+    game = KInARowGame(BoardGeometry(7, 7, 4))
+    game.make_move(24)
+
+    first = player.play(game)
+    game.make_move(next(cell for cell in (16, 32, 17) if game.is_legal(cell)))
+    second = player.best_move(game)
+
+    assert first.stats.reused_nodes == 0
+    assert second.stats.reused_nodes > 0
+    assert second.stats.tree_size > second.stats.reused_nodes
+    assert [event.action for event in events] == ["mcts_search", "mcts_search"]
+    payload = events[-1].payload
+    assert payload["playouts"] == 400
+    assert payload["tree_size"] == second.stats.tree_size
+    assert "playouts_per_second" in payload
+
+
+def test_process_pool_rollouts() -> None:
+    with MCTSPlayer(
+        iterations=20, time_budget=None, rollouts_per_leaf=4, workers=2, seed=2
+    ) as player:
+        result = player.best_move(KInARowGame())
+
+    assert result.stats.playouts == 80
+    assert 0 <= result.move < 9
+
+
+def test_playout_scores_from_side_to_move() -> None:
+    rng = random.Random(0)
+    geometry = BoardGeometry()
+    # Side to move threatens 2, the opponent threatens 5.
+    mine, theirs = 0b000000011, 0b000011000
+    scores = {playout(geometry, mine, theirs, rng) for _ in range(50)}
+    assert scores <= {0.0, 0.5, 1.0}
+    assert {0.0, 1.0} <= scores
+
+
+def test_rejects_finished_games_and_empty_budgets() -> None:
+    with pytest.raises(ValueError):
+        MCTSPlayer(iterations=None, time_budget=None)
+    game = KInARowGame()
+    _play(game, (0, 3, 1, 4, 2))
+    with pytest.raises(ValueError):
+        MCTSPlayer().best_move(game)
@@ -0,0 +1,90 @@
+"""Tests for the telemetry metrics registry and Prometheus export."""
+
+from __future__ import annotations
+
+import urllib.request
+
+import pytest
+
+from tictactoe.controller import ControllerHooks, configure_hooks
+from tictactoe.controller.metrics import (
+    MetricsRegistry,
+    log_buckets,
+    metrics_hooks,
+    serve_metrics,
+    write_metrics_file,
+)
+
+
+def test_hooks_aggregate_events_and_forward() -> None:
+    registry = MetricsRegistry()
+    forwarded = []
+    hooks = metrics_hooks(registry, ControllerHooks(domain=forwarded.append))
+    hooks.emit("view", "cell_click", position=4)
+    hooks.emit("view", "cell_click", position=5)
+    hooks.emit("domain", "mcts_search", elapsed=0.003, tree_size=120)
+    hooks.emit_lazy("domain", "snapshot", lambda: pytest.fail("payload built"))
+    hooks.emit_error(RuntimeError("boom"), action="reset")
+
+    text = registry.render()
+    assert 'tictactoe_events_total{channel="view",action="cell_click"} 2' in text
+    assert 'tictactoe_events_total{channel="domain",action="snapshot"} 1' in text
+    assert 'tictactoe_errors_total{action="reset"} 1' in text
+    assert (
+        'tictactoe_event_value{channel="domain",action="mcts_search",'
+        'field="tree_size"} 120' in text
+    )
+    assert "tictactoe_event_seconds_count" in text
+    assert [event.action for event in forwarded] == ["mcts_search", "snapshot"]
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", buckets=log_buckets(0.001, 10, 3))
+    for value in (0.0005, 0.002, 0.05, 5.0):
+        latency.labels().observe(value)
+
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{le="0.001"} 1' in lines
+    assert 'latency_seconds_bucket{le="0.01"} 2' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_count 4" in lines
+    with pytest.raises(ValueError):
+        registry.counter("latency_seconds")
+    with pytest.raises(ValueError):
+        log_buckets(factor=1.0)
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter("events", labels=("name",)).labels('a"b\\c').inc(2)
+    assert 'events{name="a\\"b\\\\c"} 2' in registry.render()
+
+
+def test_file_and_http_export(tmp_path) -> None:
+    registry = MetricsRegistry()
+    registry.gauge("depth").labels().set_function(lambda: 7)
+    path = tmp_path / "metrics" / "tictactoe.prom"
+    write_metrics_file(registry, path)
+    assert "depth 7" in path.read_text(encoding="utf-8")
+
+    server = serve_metrics(registry, port=0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert "# TYPE depth gauge" in body and "depth 7" in body
+
+
+def test_configure_hooks_enables_metrics_without_logging(monkeypatch, tmp_path):
+    monkeypatch.delenv("TICTACTOE_TELEMETRY_ASYNC", raising=False)
+    monkeypatch.delenv("TICTACTOE_METRICS_PORT", raising=False)
+    assert configure_hooks(None) is None
+
+    monkeypatch.setenv("TICTACTOE_METRICS_FILE", str(tmp_path / "out.prom"))
+    hooks = configure_hooks(None)
+    assert hooks is not None and hooks.enabled("view", "cell_click")
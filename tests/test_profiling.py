@@ -0,0 +1,79 @@
+"""Tests for the launcher's profiling switch."""
+
+from __future__ import annotations
+
+import pstats
+import time
+from importlib import import_module, reload
+
+import pytest
+
+from tictactoe.tools import profiling
+
+
+def _busy(duration: float = 0.05) -> int:
+    deadline = time.perf_counter() + duration
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+def test_parse_modes() -> None:
+    assert profiling.parse_modes("cprofile, sample") == ("cprofile", "sample")
+    assert profiling.parse_modes("all") == profiling.MODES
+    assert profiling.parse_modes(" ,") == ()
+    with pytest.raises(ValueError):
+        profiling.parse_modes("perf")
+
+
+def test_output_dir_follows_automation_output(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv(profiling.PROFILE_DIR_ENV_VAR, raising=False)
+    monkeypatch.setenv("TICTACTOE_AUTOMATION_OUTPUT", str(tmp_path / "run.json"))
+    assert profiling.profile_output_dir() == tmp_path
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV_VAR, str(tmp_path / "prof"))
+    assert profiling.profile_output_dir() == tmp_path / "prof"
+
+
+def test_session_writes_every_report(tmp_path) -> None:
+    session = profiling.ProfileSession(
+        profiling.MODES, label="run", output_dir=tmp_path, interval=0.001
+    )
+    with session:
+        _busy()
+        blob = [bytearray(1024) for _ in range(100)]
+
+    names = sorted(path.name for path in session.reports)
+    assert names == ["run.alloc.txt", "run.collapsed.txt", "run.pstats"]
+    stats = pstats.Stats(str(tmp_path / "run.pstats"))
+    assert any(name == "_busy" for _, _, name in stats.stats)
+    collapsed = (tmp_path / "run.collapsed.txt").read_text(encoding="utf-8")
+    assert "_busy (test_profiling.py:" in collapsed
+    stack, count = collapsed.splitlines()[0].rsplit(" ", 1)
+    assert ";" in stack and int(count) > 0
+    alloc = (tmp_path / "run.alloc.txt").read_text(encoding="utf-8")
+    assert "test_profiling.py" in alloc
+    assert blob
+
+
+def test_launcher_honours_profile_env(monkeypatch, tmp_path, capsys) -> None:
+    console_module = import_module("tictactoe.ui.cli.main")
+    monkeypatch.setattr(console_module, "main", lambda: _busy(0.01) and 0)
+    monkeypatch.setenv("TICTACTOE_PROFILE", "cprofile")
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV_VAR, str(tmp_path))
+
+    launcher = reload(import_module("tictactoe.__main__"))
+    assert launcher.main(["--ui", "cli"]) == 0
+
+    (report,) = tmp_path.iterdir()
+    assert report.name.startswith("tictactoe-cli-")
+    assert report.suffix == ".pstats"
+    assert str(report) in capsys.readouterr().err
+
+
+def test_launcher_rejects_unknown_profile_mode(monkeypatch) -> None:
+    console_module = import_module("tictactoe.ui.cli.main")
+    monkeypatch.setattr(console_module, "main", lambda: 0)
+    launcher = reload(import_module("tictactoe.__main__"))
+    with pytest.raises(SystemExit, match="Unknown profiling mode"):
+        launcher.main(["--ui", "cli", "--profile", "perf"])
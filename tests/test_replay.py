@@ -0,0 +1,138 @@
+"""Tests for the event-sourced action log."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.domain import ActionLog, BoardGeometry, KInARowGame
+from tictactoe.domain.logic import ExampleState, GameState, Player
+from tictactoe.domain.replay import select_action
+
+
+def _recorded(
+    geometry: BoardGeometry, moves, **kwargs
+) -> tuple[KInARowGame, ActionLog]:
+    game = KInARowGame(geometry)
+    log = ActionLog(geometry, **kwargs)
+    log.attach(game)
+    for move in moves:
+        assert game.make_move(move)
+    return game, log
+
+
+def test_attach_records_make_move_and_dispatch() -> None:
+    game = KInARowGame()
+    log = ActionLog()
+    log.attach(game)
+    game.make_move(4)
+    game.dispatch_action(select_action(0))
+    game.reset()
+    log.detach()
+    game.make_move(1)
+
+    assert [action.name for action in log.actions] == [
+        "grid.select",
+        "grid.select",
+        "game.reset",
+    ]
+    assert log.actions[0].payload == {"position": 4}
+
+
+def test_replay_reproduces_final_position() -> None:
+    game, log = _recorded(BoardGeometry(), (0, 3, 1, 4, 2))
+
+    replayed = log.replay()
+
+    assert replayed.board == game.board
+    assert replayed.state is GameState.X_WON
+    assert replayed.get_winner() is Player.PRIMARY
+
+
+def test_seek_starts_from_nearest_keyframe() -> None:
+    geometry = BoardGeometry(15, 15, 5)
+    moves = tuple(range(0, 60, 3))
+    game, log = _recorded(geometry, moves, keyframe_interval=4)
+    assert log.keyframe_count == 1 + len(moves) // 4
+
+    dispatched: list[int] = []
+    target = KInARowGame(geometry)
+    original = target.dispatch_action
+
+    def counting(action):
+        dispatched.append(action.payload["position"])
+        return original(action)
+
+    target.dispatch_action = counting  # type: ignore[method-assign]
+    seen: list[ExampleState] = []
+    target.add_listener(seen.append)
+
+    log.seek(11, target)
+
+    assert dispatched == [moves[8], moves[9], moves[10]]
+    assert len(seen) == 1
+    occupied = [position for position, cell in enumerate(target.board) if cell]
+    assert occupied == sorted(moves[:11])
+
+
+def test_round_trip_through_file_is_deterministic(tmp_path) -> None:
+    geometry = BoardGeometry(4, 4, 3)
+    game, log = _recorded(geometry, (5, 0, 6, 1, 7))
+    path = tmp_path / "game.jsonl"
+    log.write(path)
+
+    loaded = ActionLog.read(path)
+
+    assert loaded.geometry == geometry
+    assert loaded.actions == log.actions
+    assert loaded.replay().snapshot.board == game.board
+    assert loaded.seek(2).board == log.seek(2).board
+
+
+def test_seek_rejects_out_of_range_and_illegal_actions() -> None:
+    _, log = _recorded(BoardGeometry(), (0,))
+    with pytest.raises(ValueError):
+        log.seek(2)
+
+    log.append(select_action(0))
+    with pytest.raises(ValueError):
+        log.replay()
+
+
+def test_log_follows_history_navigation() -> None:
+    game = KInARowGame()
+    history = game.enable_history(keyframe_interval=2)
+    log = ActionLog()
+    log.attach(game)
+    game.make_move(0)
+    game.make_move(1)
+
+    assert history.undo()
+    assert game.make_move(2)
+    assert log.replay().board == game.board
+    assert [action.payload["position"] for action in log.actions] == [0, 2]
+
+    for move in (4, 8):
+        game.make_move(move)
+    history.undo()
+    history.undo()
+    history.redo()
+    assert log.replay().board == game.board
+    history.jump_to(history.newest_ply)
+    assert len(log) == 4 and log.replay().board == game.board
+
+
+def test_navigating_before_recording_stops_the_log() -> None:
+    game = KInARowGame()
+    history = game.enable_history()
+    game.make_move(0)
+    log = ActionLog()
+    log.attach(game)
+    game.make_move(4)
+
+    history.undo()
+    history.undo()
+    game.make_move(8)
+
+    # Ply 0 is the position the log was attached at.
+    assert len(log) == 0
+    assert log.replay().board == (Player.PRIMARY,) + (None,) * 8
@@ -0,0 +1,101 @@
+"""Tests for telemetry sampling and rate-limit policies."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.controller import ControllerHooks, configure_hooks
+from tictactoe.controller.sampling import SamplingFilter, parse_rules
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _filter(spec: str, clock=None, seed=0):
+    seen = []
+    sampler = SamplingFilter(
+        ControllerHooks(view=seen.append, domain=seen.append),
+        parse_rules(spec),
+        clock=clock or _Clock(),
+        seed=seed,
+    )
+    return sampler, seen
+
+
+def test_first_n_per_interval_reports_suppressed_counts() -> None:
+    clock = _Clock()
+    sampler, seen = _filter("view.*=first:2/10", clock)
+    for _ in range(5):
+        sampler.hooks.emit("view", "cell_click", position=1)
+    clock.now = 10.0
+    sampler.hooks.emit("view", "cell_click", position=2)
+    sampler.hooks.emit("view", "reset_requested")
+    sampler.hooks.emit("domain", "snapshot")
+
+    payloads = [dict(event.payload) for event in seen]
+    assert payloads[:3] == [
+        {"position": 1},
+        {"position": 1},
+        {"position": 2, "suppressed": 3},
+    ]
+    assert len(seen) == 5
+    assert sampler.suppressed() == {"view.cell_click": 3}
+
+
+def test_token_bucket_refills_over_time() -> None:
+    clock = _Clock()
+    sampler, seen = _filter("domain.snapshot=rate:2/2", clock)
+    for _ in range(4):
+        sampler.hooks.emit("domain", "snapshot")
+    assert len(seen) == 2
+    clock.now = 0.5
+    sampler.hooks.emit("domain", "snapshot")
+    sampler.hooks.emit("domain", "snapshot")
+    assert len(seen) == 3
+    assert seen[-1].payload["suppressed"] == 2
+
+
+def test_sampling_keeps_totals_exact() -> None:
+    sampler, seen = _filter("*=sample:0.25", seed=7)
+    for index in range(1000):
+        sampler.hooks.emit("view", "cell_click", position=index)
+    sampler.flush()
+
+    kept = [event for event in seen if event.action == "cell_click"]
+    tail = [event for event in seen if event.action == "events_suppressed"]
+    assert 150 < len(kept) < 350
+    total = len(kept) + sum(event.payload.get("suppressed", 0) for event in seen)
+    assert total == 1000
+    assert all(event.payload["action"] == "cell_click" for event in tail)
+
+
+def test_specific_rules_win_and_invalid_specs_fail() -> None:
+    sampler, seen = _filter("*=sample:0,view.cell_click=sample:1")
+    sampler.hooks.emit("view", "cell_click")
+    sampler.hooks.emit("view", "reset_requested")
+    assert [event.action for event in seen] == ["cell_click"]
+
+    sampler, seen = _filter("*.snapshot=sample:0")
+    sampler.hooks.emit("domain", "snapshot")
+    sampler.hooks.emit("domain", "reset")
+    assert [event.action for event in seen] == ["reset"]
+    for spec in ("view=sample:1", "view.x=sample:2", "view.x=rate:0", "*=bogus:1"):
+        with pytest.raises(ValueError):
+            parse_rules(spec)
+
+
+def test_policy_env_var_prefers_frontend_alias(monkeypatch) -> None:
+    for name in ("TICTACTOE_TELEMETRY_ASYNC", "TICTACTOE_METRICS_FILE"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("TICTACTOE_LOGGING_POLICY", "*=sample:1")
+    monkeypatch.setenv("TICTACTOE_CLI_LOGGING_POLICY", "view.*=first:1/60")
+    seen = []
+    hooks = configure_hooks(ControllerHooks(view=seen.append), "TICTACTOE_CLI_LOGGING")
+    for _ in range(3):
+        hooks.emit("view", "cell_click")
+    assert len(seen) == 1
@@ -0,0 +1,70 @@
+"""Tests for the alpha-beta search engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.domain import BitboardTicTacToe, BoardGeometry, KInARowGame
+from tictactoe.domain.bitboard import symmetry_mapper
+from tictactoe.domain.logic import STANDARD_GEOMETRY, GameState
+from tictactoe.domain.search import WIN_SCORE, SearchEngine
+
+
+def _play(game, moves) -> None:
+    for move in moves:
+        assert game.make_move(move)
+
+
+def test_symmetry_mapper_folds_rotations() -> None:
+    mapper = symmetry_mapper(STANDARD_GEOMETRY)
+    corners = {mapper.canonical(1 << cell, 0)[0] for cell in (0, 2, 6, 8)}
+    edges = {mapper.canonical(1 << cell, 0)[0] for cell in (1, 3, 5, 7)}
+
+    assert len(mapper.permutations) == 8
+    assert len(corners) == 1
+    assert len(edges) == 1
+    assert corners != edges
+
+
+def test_empty_board_is_a_draw_with_table_hits() -> None:
+    engine = SearchEngine(time_budget=None, use_solved_table=False)
+    result = engine.best_move(BitboardTicTacToe())
+
+    assert result.score == 0
+    assert result.depth == 9
+    assert result.stats.tt_hits > 0
+    assert 0 < result.stats.hit_rate < 1
+    assert result.stats.nodes_per_second > 0
+
+
+def test_engine_takes_immediate_win_and_blocks() -> None:
+    engine = SearchEngine(time_budget=None)
+    game = BitboardTicTacToe()
+    _play(game, (0, 3, 1, 4))
+
+    win = engine.best_move(game)
+    assert win.move == 2
+    assert win.score == WIN_SCORE - 1
+
+    game = KInARowGame()
+    _play(game, (0, 4, 8))
+    block = engine.play(game)
+    assert block.move in (1, 3, 5, 7)
+    assert game.state is GameState.PLAYING
+
+
+def test_engine_respects_time_budget_on_large_boards() -> None:
+    game = KInARowGame(BoardGeometry(15, 15, 5))
+    _play(game, (112, 113))
+    result = SearchEngine(time_budget=0.05).best_move(game)
+
+    assert game.is_legal(result.move)
+    assert result.depth >= 1
+
+
+def test_engine_rejects_finished_games() -> None:
+    game = BitboardTicTacToe()
+    _play(game, (0, 3, 1, 4, 2))
+
+    with pytest.raises(ValueError):
+        SearchEngine().best_move(game)
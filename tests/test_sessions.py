@@ -0,0 +1,125 @@
+"""Tests for the multi-session game manager."""
+
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+from tictactoe.config.gui import NAMED_THEMES
+from tictactoe.domain import BoardGeometry
+from tictactoe.domain.logic import GameState, Player
+from tictactoe.domain.replay import select_action
+from tictactoe.ui.service.sessions import SessionManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sessions_are_independent_and_share_tables() -> None:
+    manager = SessionManager()
+    first = manager.create("a")
+    second = manager.create("b", theme="dark")
+    for move in (0, 3, 1, 4, 2):
+        manager.dispatch("a", select_action(move))
+
+    assert first.game.state is GameState.X_WON
+    assert second.game.state is GameState.PLAYING
+    assert second.theme is NAMED_THEMES["dark"]
+    wide = manager.create("c", geometry=BoardGeometry(9, 9, 5))
+    other = manager.create("d", geometry=BoardGeometry(9, 9, 5))
+    assert wide.game.geometry.lines is other.game.geometry.lines
+    with pytest.raises(ValueError):
+        manager.create("a")
+
+
+def test_idle_sessions_expire() -> None:
+    clock = _Clock()
+    manager = SessionManager(ttl=10.0, clock=clock)
+    manager.create("old")
+    clock.now = 6.0
+    manager.create("fresh")
+    clock.now = 9.0
+    manager.get("old")
+    clock.now = 17.0
+
+    assert list(manager) == ["old"]
+    with pytest.raises(KeyError):
+        manager.get("fresh")
+    assert manager.stats().expired == 1
+
+
+def test_least_recently_used_session_is_evicted() -> None:
+    manager = SessionManager(max_sessions=2, ttl=None)
+    manager.create("a")
+    manager.create("b")
+    manager.get("a")
+    manager.create("c")
+
+    assert sorted(manager) == ["a", "c"]
+    assert manager.stats().evicted == 1
+
+
+def test_stats_report_footprint_without_shared_tables() -> None:
+    manager = SessionManager()
+    manager.create("small")
+    manager.create("large", geometry=BoardGeometry(15, 15, 5))
+    manager.dispatch("large", select_action(112))
+
+    small = manager.session_footprint("small")
+    large = manager.session_footprint("large")
+    stats = manager.stats()
+
+    assert 0 < small < large
+    assert stats.live == 2
+    # Stats charge each session its fresh size; they never re-walk games.
+    assert small == manager.get("small").estimated_bytes
+    assert stats.total_bytes == small + manager.get("large").estimated_bytes
+    assert manager.get("large").estimated_bytes <= large
+    assert manager.get("large").game.board[112] is Player.PRIMARY
+    # The 15x15 line tables alone are far bigger than what a session owns.
+    assert large < 50_000
+    assert manager.close("small") and not manager.close("small")
+    assert manager.stats().total_bytes == manager.get("large").estimated_bytes
+
+
+def test_running_size_total_follows_expiry_and_eviction() -> None:
+    clock = _Clock()
+    manager = SessionManager(max_sessions=2, ttl=10.0, clock=clock)
+    for name in ("a", "b", "c"):
+        manager.create(name)
+    per_session = manager.get("c").estimated_bytes
+
+    assert manager.stats().total_bytes == 2 * per_session
+    clock.now = 20.0
+    assert manager.stats().total_bytes == 0
+
+
+def test_dispatch_serialises_moves_per_session() -> None:
+    manager = SessionManager()
+    session = manager.create("a")
+    errors: List[Exception] = []
+
+    def play(position: int) -> None:
+        try:
+            manager.dispatch("a", select_action(position))
+        except ValueError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=play, args=(4,)) for _ in range(8)]
+    with session.lock:
+        for thread in threads:
+            thread.start()
+        # Every dispatch is parked on the session lock.
+        assert session.game.board[4] is None
+    for thread in threads:
+        thread.join()
+
+    assert session.game.board[4] is Player.PRIMARY
+    assert len(errors) == 7
@@ -0,0 +1,141 @@
+"""Tests for the JSON-lines telemetry sink."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+from tictactoe.controller import ControllerHooks, configure_hooks
+from tictactoe.controller.sinks import JsonLinesSink
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_events_are_buffered_until_flush(tmp_path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = JsonLinesSink(path, flush_interval=None)
+    forwarded = []
+    hooks = sink.hooks(ControllerHooks(view=forwarded.append))
+    hooks.emit("view", "cell_click", position=4)
+    hooks.emit_lazy("domain", "snapshot", lambda: {"state": "playing"})
+    hooks.emit_error(RuntimeError("boom"), action="reset")
+    assert not path.exists()
+
+    sink.flush()
+    records = _lines(path)
+    assert [(r["channel"], r["action"]) for r in records] == [
+        ("view", "cell_click"),
+        ("domain", "snapshot"),
+        ("error", "reset"),
+    ]
+    assert records[0]["payload"] == {"position": 4}
+    assert records[1]["payload"] == {"state": "playing"}
+    assert records[2]["payload"]["error"] == "RuntimeError('boom')"
+    assert len(forwarded) == 1
+    sink.close()
+
+
+def test_rotation_by_size_and_age(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "telemetry.jsonl"
+    sink = JsonLinesSink(
+        path, max_bytes=200, max_age=60, buffer_size=1, flush_interval=None, clock=clock
+    )
+    hooks = sink.hooks()
+    for index in range(6):
+        hooks.emit("view", "cell_click", position=index)
+    assert len(sink.rotated) >= 2
+    assert all(rotated.stat().st_size <= 200 for rotated in sink.rotated)
+
+    before = len(sink.rotated)
+    clock.now += 61
+    hooks.emit("view", "reset_requested")
+    assert len(sink.rotated) == before + 1
+    sink.close()
+
+    positions = [
+        record["payload"].get("position")
+        for rotated in sorted(sink.rotated, key=lambda item: item.stat().st_mtime_ns)
+        for record in _lines(rotated)
+    ]
+    assert sorted(p for p in positions if p is not None) == list(range(6))
+    assert _lines(path)[-1]["action"] == "reset_requested"
+
+
+def test_rotated_files_are_gzipped_in_background(tmp_path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = JsonLinesSink(
+        path, max_bytes=100, compress=True, buffer_size=1, flush_interval=None
+    )
+    for index in range(5):
+        sink.hooks().emit("domain", "tick", n=index)
+    sink.close()
+
+    assert sink.rotated and all(item.suffix == ".gz" for item in sink.rotated)
+    restored = []
+    for item in sink.rotated:
+        with gzip.open(item, "rt", encoding="utf-8") as handle:
+            restored.extend(json.loads(line)["payload"]["n"] for line in handle)
+    restored.extend(record["payload"]["n"] for record in _lines(path))
+    assert sorted(restored) == list(range(5))
+    assert not list(tmp_path.glob("*-[0-9].jsonl"))
+
+
+def test_rotation_counts_encoded_bytes(tmp_path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = JsonLinesSink(path, max_bytes=150, buffer_size=1, flush_interval=None)
+    for _ in range(6):
+        sink.hooks().emit("view", "status", text="\u00e9\u00e8\u00ea\u2713" * 2)
+    sink.close()
+
+    assert sink.rotated
+    assert all(item.stat().st_size <= 150 for item in sink.rotated)
+    assert path.stat().st_size <= 150
+
+
+def test_rotation_numbering_survives_restarts(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "telemetry.jsonl"
+    names = []
+    for _ in range(2):
+        clock.now = 1_000_000.0
+        sink = JsonLinesSink(
+            path, max_age=60, buffer_size=1, flush_interval=None, clock=clock
+        )
+        sink.hooks().emit("view", "initialized")
+        clock.now += 61
+        sink.hooks().emit("view", "reset_requested")
+        sink.close()
+        names.extend(item.name for item in sink.rotated)
+
+    # Both runs rotate in the same clock second, yet nothing is overwritten.
+    assert len(set(names)) == 2
+    assert [name.rsplit("-", 1)[1] for name in names] == ["1.jsonl", "2.jsonl"]
+    assert len(list(tmp_path.glob("telemetry.*-*.jsonl"))) == 2
+
+
+def test_configure_hooks_adds_sink(monkeypatch, tmp_path) -> None:
+    for name in (
+        "TICTACTOE_TELEMETRY_ASYNC",
+        "TICTACTOE_METRICS_FILE",
+        "TICTACTOE_METRICS_PORT",
+        "TICTACTOE_LOGGING_POLICY",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    path = tmp_path / "events.jsonl"
+    monkeypatch.setenv("TICTACTOE_TELEMETRY_FILE", str(path))
+    seen = []
+    hooks = configure_hooks(ControllerHooks(view=seen.append))
+    hooks.emit("view", "cell_click", position=1)
+    assert len(seen) == 1
+    assert configure_hooks(None) is not None
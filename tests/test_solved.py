@@ -0,0 +1,70 @@
+"""Tests for the shipped solved-position table and its generator."""
+
+from __future__ import annotations
+
+import random
+
+from tictactoe.domain import BitboardTicTacToe
+from tictactoe.domain.logic import GameState
+from tictactoe.domain.search import SearchEngine
+from tictactoe.domain.solved import Outcome, SolvedTable, load_solved_table
+from tictactoe.tools import solve_positions
+
+
+def test_shipped_table_covers_every_reachable_position() -> None:
+    table = load_solved_table()
+
+    assert table is load_solved_table()
+    assert table.entry_count == 3**9
+    assert table.reachable == 5478
+    empty = table.probe((None,) * 9)
+    assert empty is not None
+    assert empty.outcome is Outcome.DRAW
+    assert empty.distance == 9
+
+
+def test_table_finds_wins_and_marks_terminal_positions() -> None:
+    table = load_solved_table()
+    game = BitboardTicTacToe()
+    for move in (0, 3, 1, 4):
+        game.make_move(move)
+
+    assert table.best_move(game) == 2
+    entry = table.probe_bitboards(*game.bitboards)
+    assert entry is not None and entry.outcome is Outcome.WIN
+
+    game.make_move(2)
+    terminal = table.probe_bitboards(*game.bitboards)
+    assert terminal is not None
+    assert terminal.move is None
+    assert terminal.outcome is Outcome.LOSS
+    assert table.best_move(game) is None
+
+
+def test_table_agrees_with_search_values() -> None:
+    table = load_solved_table()
+    search = SearchEngine(time_budget=None, use_solved_table=False)
+    rng = random.Random(7)
+    for _ in range(25):
+        game = BitboardTicTacToe()
+        for _ in range(rng.randrange(0, 6)):
+            if game.state is not GameState.PLAYING:
+                break
+            game.make_move(rng.choice(game.legal_moves()))
+        if game.state is not GameState.PLAYING:
+            continue
+        entry = table.probe_bitboards(*game.bitboards)
+        result = search.best_move(game)
+        assert entry is not None
+        expected = {Outcome.WIN: 1, Outcome.DRAW: 0, Outcome.LOSS: -1}
+        assert expected[entry.outcome] == (result.score > 0) - (result.score < 0)
+
+
+def test_generator_reproduces_shipped_asset(tmp_path) -> None:
+    destination = tmp_path / "solved.bin"
+    solve_positions.main(["--output", str(destination)])
+
+    rebuilt = SolvedTable.open(destination)
+    assert rebuilt.reachable == load_solved_table().reachable
+    shipped = solve_positions._default_output().read_bytes()
+    assert destination.read_bytes() == shipped
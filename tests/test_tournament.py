@@ -0,0 +1,57 @@
+"""Tests for the self-play tournament runner."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from tictactoe.tools import tournament
+
+
+def test_schedule_modes_and_colour_alternation() -> None:
+    round_robin = tournament.schedule(["random", "search", "mcts"], games=4)
+    gauntlet = tournament.schedule(
+        ["search", "random", "mcts"], games=4, mode="gauntlet"
+    )
+
+    assert len(round_robin) == 12
+    assert len(gauntlet) == 8
+    assert {spec.primary for spec in gauntlet[:4]} == {"search", "random"}
+    assert [spec.index for spec in round_robin] == list(range(12))
+    with pytest.raises(ValueError):
+        tournament.schedule(["random", "nobody"], games=1)
+
+
+def test_results_do_not_depend_on_worker_count() -> None:
+    specs = tournament.schedule(["random", "search"], games=6, seed=4)
+    inline, pooled = io.StringIO(), io.StringIO()
+
+    tournament.run_tournament(specs, workers=1, output=inline)
+    tournament.run_tournament(specs, workers=2, output=pooled)
+
+    assert inline.getvalue() == pooled.getvalue()
+    rows = [json.loads(line) for line in inline.getvalue().splitlines()]
+    assert [row["index"] for row in rows] == list(range(6))
+
+
+def test_elo_ranks_perfect_play_above_random() -> None:
+    specs = tournament.schedule(["random", "search"], games=30, seed=1)
+    table = tournament.run_tournament(specs)
+
+    standings = table.standings()
+    assert standings[0].name == "search"
+    best = standings[0]
+    assert best.games == 30
+    assert best.lower <= best.elo <= best.upper
+
+
+def test_main_streams_jsonl(tmp_path, capsys) -> None:
+    output = tmp_path / "games.jsonl"
+    tournament.main(
+        ["--players", "random", "random", "--games", "3", "--output", str(output)]
+    )
+
+    assert len(output.read_text(encoding="utf-8").splitlines()) == 3
+    assert "elo" in capsys.readouterr().out
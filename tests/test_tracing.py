@@ -0,0 +1,72 @@
+"""Tests for contextvars tracing spans and the Chrome trace export."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tictactoe import tracing
+from tictactoe.domain import BitboardTicTacToe
+from tictactoe.ui.gui.headless_view import HeadlessGameView
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.start_tracing()
+    yield tracer
+    tracing.stop_tracing()
+
+
+def test_click_to_render_forms_one_span_tree(tracer) -> None:
+    game = BitboardTicTacToe()
+    view = HeadlessGameView(
+        ctk_module=None, root=None, on_cell_click=game.make_move, on_reset=game.reset
+    )
+    view.build()
+    game.add_listener(view.render)
+
+    with tracing.span("cell_click", "controller", position=4):
+        game.make_move(4)
+
+    spans = {span.name: span for span in tracer.spans}
+    assert set(spans) >= {
+        "cell_click",
+        "make_move",
+        "notify_listeners",
+        "render",
+        "HeadlessGameView.render",
+    }
+    assert spans["make_move"].parent_id == spans["cell_click"].span_id
+    assert spans["notify_listeners"].parent_id == spans["make_move"].span_id
+    listener = spans["HeadlessGameView.render"]
+    assert listener.parent_id == spans["notify_listeners"].span_id
+    assert spans["render"].parent_id == listener.span_id
+    assert spans["cell_click"].duration_ns >= spans["make_move"].duration_ns
+    assert tracing.current_span() is None
+
+
+def test_chrome_trace_export(tracer, tmp_path) -> None:
+    with pytest.raises(ValueError):
+        with tracing.span("outer", "test", label="a"):
+            with tracing.span("inner", "test"):
+                raise ValueError("boom")
+
+    path = tracer.write(tmp_path / "trace.json")
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    outer, inner = events
+    assert {event["ph"] for event in events} == {"X"}
+    assert outer["args"]["label"] == "a"
+    assert inner["args"]["parent_id"] == outer["args"]["span_id"]
+    assert inner["args"]["error"] == "ValueError"
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_spans_are_free_when_tracing_is_off() -> None:
+    assert tracing.active_tracer() is None and not tracing.ENABLED
+    game = BitboardTicTacToe()
+    with tracing.span("ignored") as span:
+        game.make_move(0)
+    assert span is None
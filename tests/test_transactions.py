@@ -0,0 +1,108 @@
+"""Tests for batched dispatch and coalesced listener notifications."""
+
+from __future__ import annotations
+
+import pytest
+
+from tictactoe.domain import KInARowGame, StateDelta
+from tictactoe.domain.logic import ExampleAction, ExampleState, GameState, Player
+
+
+def _select(position: int) -> ExampleAction:
+    return ExampleAction(name="grid.select", payload={"position": position})
+
+
+def test_dispatch_actions_notifies_once() -> None:
+    game = KInARowGame()
+    seen: list[ExampleState] = []
+    game.add_listener(seen.append)
+
+    result = game.dispatch_actions(_select(p) for p in (0, 3, 1, 4, 2))
+
+    assert len(seen) == 1
+    assert seen[0] is result.snapshot
+    assert result.snapshot.state is GameState.X_WON
+    assert result.deltas == ()
+
+
+def test_dispatch_actions_can_collect_deltas_for_batch_listeners() -> None:
+    game = KInARowGame()
+    batches: list[tuple[ExampleState, tuple[StateDelta, ...]]] = []
+    game.add_batch_listener(lambda snapshot, deltas: batches.append((snapshot, deltas)))
+
+    result = game.dispatch_actions([_select(4), _select(0)], collect_deltas=True)
+
+    assert len(result.deltas) == 2
+    first, second = result.deltas
+    assert first.action == _select(4)
+    assert [(c.position, c.previous, c.current) for c in first.cells] == [
+        (4, None, Player.PRIMARY)
+    ]
+    assert first.previous_player is Player.PRIMARY
+    assert first.current_player is Player.SECONDARY
+    assert second.version == first.version + 1
+    assert batches == [(result.snapshot, result.deltas)]
+
+
+def test_nested_transactions_defer_until_outermost_exit() -> None:
+    game = KInARowGame()
+    seen: list[ExampleState] = []
+    game.add_listener(seen.append)
+
+    with game.transaction(collect_deltas=True) as outer:
+        game.make_move(0)
+        with game.transaction():
+            game.make_move(1)
+            game.reset()
+        assert seen == []
+
+    assert len(seen) == 1
+    assert outer.snapshot is seen[0]
+    assert [len(delta.cells) for delta in outer.deltas] == [1, 1, 2]
+    assert outer.deltas[-1].state is GameState.PLAYING
+
+
+def test_transaction_still_announces_applied_actions_on_error() -> None:
+    game = KInARowGame()
+    seen: list[ExampleState] = []
+    game.add_listener(seen.append)
+
+    with pytest.raises(ValueError):
+        game.dispatch_actions([_select(0), _select(0)])
+
+    assert len(seen) == 1
+    assert seen[0].board[0] is Player.PRIMARY
+
+
+def test_batch_listeners_fire_once_after_outermost_commit() -> None:
+    game = KInARowGame()
+    order: list[str] = []
+    batches: list[tuple[StateDelta, ...]] = []
+    game.add_listener(lambda snapshot: order.append("snapshot"))
+
+    def on_batch(snapshot: ExampleState, deltas: tuple[StateDelta, ...]) -> None:
+        order.append("batch")
+        batches.append(deltas)
+
+    game.add_batch_listener(on_batch)
+
+    with game.transaction(collect_deltas=True):
+        game.make_move(0)
+        with game.transaction(collect_deltas=True):
+            game.make_move(1)
+        assert order == []
+
+    assert order == ["snapshot", "batch"]
+    assert [len(deltas) for deltas in batches] == [2]
+
+
+def test_empty_transactions_do_not_fire_batch_listeners() -> None:
+    game = KInARowGame()
+    batches: list[tuple[StateDelta, ...]] = []
+    game.add_batch_listener(lambda snapshot, deltas: batches.append(deltas))
+
+    with game.transaction(collect_deltas=True):
+        pass
+    game.dispatch_actions([])
+
+    assert batches == []
@@ -0,0 +1,72 @@
+"""Tests for incremental Zobrist hashing."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tictactoe.domain import BitboardTicTacToe, BoardGeometry, KInARowGame
+from tictactoe.domain.logic import ExampleState, GameState
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [BitboardTicTacToe, KInARowGame, lambda: KInARowGame(BoardGeometry(6, 4, 4))],
+)
+def test_incremental_hash_matches_full_rehash(factory) -> None:
+    rng = random.Random(11)
+    for _ in range(20):
+        game = factory()
+        geometry = game.geometry
+        while game.state is GameState.PLAYING:
+            game.make_move(rng.choice(game.legal_moves()))
+            snapshot = game.snapshot
+            assert snapshot.zobrist_hash == geometry.zobrist_hash(snapshot.board)
+            assert snapshot.symmetric_hash == geometry.symmetric_hash(snapshot.board)
+            assert snapshot == ExampleState(
+                snapshot.board,
+                snapshot.current_player,
+                snapshot.state,
+                snapshot.winner,
+                geometry=geometry,
+            )
+        game.reset()
+        assert game.zobrist_hash == game.symmetric_hash == 0
+
+
+def test_symmetric_hash_is_shared_by_rotations() -> None:
+    geometry = BoardGeometry()
+    hashes = set()
+    plain = set()
+    for permutation in geometry.symmetries:
+        game = KInARowGame()
+        for move in (0, 4, 1):
+            game.make_move(permutation[move])
+        hashes.add(game.symmetric_hash)
+        plain.add(game.zobrist_hash)
+
+    assert len(hashes) == 1
+    assert len(plain) > 1
+
+
+def test_hash_survives_undo_and_transposition() -> None:
+    first = KInARowGame()
+    for move in (0, 4, 8):
+        first.make_move(move)
+    second = KInARowGame()
+    for move in (8, 4, 0):
+        second.make_move(move)
+    assert first.zobrist_hash == second.zobrist_hash
+
+    history = first.enable_history()
+    before = first.zobrist_hash
+    first.make_move(2)
+    assert first.zobrist_hash != before
+    history.undo()
+    assert first.zobrist_hash == before
+
+
+def test_keys_are_deterministic_per_geometry() -> None:
+    assert BoardGeometry(4, 4, 3).zobrist_keys == BoardGeometry(4, 4, 4).zobrist_keys
+    assert BoardGeometry().zobrist_keys != BoardGeometry(4, 4, 3).zobrist_keys[:9]